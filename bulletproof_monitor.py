@@ -8,7 +8,7 @@ from seleniumbase import SB
 
 # Import our bulletproof services
 from services.bulletproof_session import BulletproofSessionService
-from services.bulletproof_booking import BulletproofBookingService
+from services.bulletproof_booking import BulletproofBookingService, flush_notifications
 from enhanced_notifier import EnhancedDiscordNotifier
 from enhanced_integrated_monitor import EnhancedIntegratedMonitor
 from config.models import AppConfig
@@ -30,6 +30,7 @@ class BulletproofMonitor:
         self.notifier = None
         self.booking_service = None
         self.main_monitor = None
+        self._warmed_up = False
         
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -65,13 +66,7 @@ class BulletproofMonitor:
         """Initialize notification system with error handling"""
         try:
             self.notifier = EnhancedDiscordNotifier()
-            
-            # Test Discord connectivity
-            test_success = self.session_service.send_test_notification(self.notifier)
-            if test_success:
-                logger.info("✅ Discord notification system verified")
-            else:
-                logger.warning("⚠️ Discord notification test failed - continuing without notifications")
+            # Discord connectivity is tested alongside the first session validation (see warmup)
                 
         except Exception as e:
             logger.error(f"❌ Failed to initialize notifications: {e}")
@@ -171,8 +166,12 @@ class BulletproofMonitor:
                 # Initialize services with current browser
                 self.booking_service = BulletproofBookingService(sb, self.notifier)
                 
-                # Validate session with bulletproof method
-                session_valid = self.session_service.validate_session_bulletproof(sb)
+                # Validate session with bulletproof method; the first cycle also tests Discord
+                if not self._warmed_up:
+                    self._warmed_up = True
+                    session_valid = self.session_service.warmup(sb, self.notifier)
+                else:
+                    session_valid = self.session_service.validate_session_bulletproof(sb)
                 if not session_valid:
                     logger.warning("⚠️ Session validation failed, attempting recovery")
                     return False
@@ -414,4 +413,6 @@ class BulletproofMonitor:
     def _cleanup(self):
         """Cleanup resources"""
         logger.info("🧹 Cleaning up resources...")
-        self.running = False
\ No newline at end of file
+        self.running = False
+        # Booking alerts are sent from a background thread; deliver what's queued before exit
+        flush_notifications(timeout=30)
\ No newline at end of file
@@ -112,6 +112,7 @@ def run(config, headless, debug):
             # 2) create monitor and inject driver
             monitor = EnhancedIntegratedMonitor(cfg)
             monitor.driver = sb  # inject the driver
+            monitor.session_service = sess  # reused for re-authentication between cycles
             
             # 3) start monitoring
             monitor.start_monitoring(correlation_id)
@@ -149,7 +150,7 @@ def test_session():
     try:
         with SB(headless=settings.headless) as sb:
             sess = SessionService()
-            if sess.ensure_authenticated_session():
+            if sess.ensure_authenticated_session(sb):
                 click.echo("✅ Session test successful")
             else:
                 click.echo("❌ Session test failed")
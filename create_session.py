@@ -116,8 +116,7 @@ class SessionCreator:
             self.session_manager.save_session(sb, self.config.email)
             
             logger.info("✅ Session created and saved successfully!")
-            logger.info(f"📁 Session saved to: amazon_session.pkl")
-            logger.info(f"🍪 Cookies saved to: amazon_cookies.json")
+            logger.info(f"📁 Session saved to: {self.session_manager.session_file}")
             return True
             
         except Exception as e:
@@ -19,9 +19,11 @@ class EnhancedIntegratedMonitor:
         """
         config: your AppConfig instance (Pydantic)
         driver: will be injected by CLI after session is established
+        session_service: injected by CLI too; the service that signed the driver in
         """
         self.config = config
         self.driver = None
+        self.session_service: Optional[SessionService] = None
         self.shift_filter = None
         self.job_reporter = None
         self.shift_booking = None
@@ -110,6 +112,9 @@ class EnhancedIntegratedMonitor:
                 except Exception as e:
                     self.logger.error(f"Error in monitoring cycle {cycle}: {e}", extra={'correlation_id': cycle_correlation_id})
                     time.sleep(self.config.monitoring.error_retry_delay)
+                    # Same browser and service every cycle: a still-valid session is only re-validated
+                    if self.session_service and not self.session_service.ensure_authenticated_session(self.driver):
+                        self.logger.error("❌ Could not re-establish session after cycle error", extra={'correlation_id': cycle_correlation_id})
                     continue
                 
                 if self.running:
@@ -1,4 +1,5 @@
 from seleniumbase import BaseCase
+from selenium.webdriver.common.by import By
 import json
 import re
 from datetime import datetime
@@ -82,12 +83,12 @@ class EnhancedJobReporter:
         """Parse individual job card for details"""
         try:
             # Extract job title
-            title_elements = card_element.find_elements('css selector', 'strong')
+            title_elements = card_element.find_elements(By.CSS_SELECTOR, 'strong')
             title = title_elements[0].text if title_elements else "Unknown"
             
             # Extract shifts available
             shifts_text = ""
-            shift_elements = card_element.find_elements('css selector', 'div')
+            shift_elements = card_element.find_elements(By.CSS_SELECTOR, 'div')
             for elem in shift_elements:
                 if 'shift available' in elem.text:
                     shifts_text = elem.text
@@ -101,7 +102,7 @@ class EnhancedJobReporter:
             pay_rate = self._extract_field_value(card_element, "Pay rate:")
             
             # Extract location (last strong element)
-            location_elements = card_element.find_elements('css selector', 'strong')
+            location_elements = card_element.find_elements(By.CSS_SELECTOR, 'strong')
             location = location_elements[-1].text if location_elements else "Unknown"
             
             # Determine shift type based on title and other factors
@@ -125,7 +126,7 @@ class EnhancedJobReporter:
     def _extract_field_value(self, card_element, field_name: str) -> str:
         """Extract specific field value from job card"""
         try:
-            text_elements = card_element.find_elements('css selector', 'div')
+            text_elements = card_element.find_elements(By.CSS_SELECTOR, 'div')
             for elem in text_elements:
                 if field_name in elem.text:
                     # Extract value after the field name
@@ -653,7 +653,7 @@ class EnhancedShiftFilter:
             
             # Try to select from autocomplete if it appears
             try:
-                autocomplete_item = self.driver.find_element(f'//*[contains(text(), "{current_city}")]', by='xpath')
+                autocomplete_item = self.driver.find_element(f'//*[contains(text(), "{current_city}")]', by=By.XPATH)
                 if autocomplete_item:
                     autocomplete_item.click()
                     logger.info(f"✅ Selected city from autocomplete: {current_city}")
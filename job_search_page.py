@@ -1,9 +1,22 @@
 
 from seleniumbase import BaseCase
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
 import logging
+import re
+
+from utils.selenium_helpers import snapshot_for_observer, wait_for_change_via_observer
 
 logger = logging.getLogger(__name__)
 
+_TEST_ID_RE = re.compile(r'data-test-id="([^"]+)"')
+
+
+def _test_ids(selectors):
+    """Extract the data-test-id values from a collection of selectors."""
+    return frozenset(_TEST_ID_RE.search(s).group(1) for s in selectors)
+
 class JobSearchPage:
     """Page object for the job search and filtering functionality."""
 
@@ -32,7 +45,17 @@ class JobSearchPage:
         "grocery_warehouse": 'button[data-test-id="filter-role-button-Amazon Grocery Warehouse Associate"] div',
     }
 
+    # Every filter button of a group matches one prefix query; the wanted ones
+    # are picked out by data-test-id instead of querying each selector.
+    SHIFT_FILTER_BUTTONS = 'button[data-test-id^="filter-schedule-shift-button-"]'
+    ROLE_FILTER_BUTTONS = 'button[data-test-id^="filter-role-button-"]'
+    SHIFT_FILTER_IDS = _test_ids(SHIFT_FILTERS.values())
+    ROLE_FILTER_IDS = _test_ids(ROLE_FILTERS.values())
+    # React re-renders the panel after each toggle, so buttons are re-found per click
+    STALE_RETRIES = 3
+
     # Job card and application selectors
+    JOB_CARD = 'div[data-test-id="JobCard"]'
     FIRST_JOB_CARD = 'div[data-test-id="JobCard"] div div:nth-of-type(2) div strong'
     APPLY_BTN = 'button[data-test-id="jobDetailApplyButtonDesktop"] div'
 
@@ -42,41 +65,64 @@ class JobSearchPage:
         self._apply_location_filter(sb, location)
         self._apply_shift_filters(sb)
         self._apply_role_filters(sb)
+        snapshot_for_observer(sb.driver, self.JOB_CARD)
         sb.click(self.SHOW_FILTERS_BTN)
-        sb.sleep(3)
+        wait_for_change_via_observer(sb.driver, self.JOB_CARD, timeout_ms=3000)
 
     def _apply_location_filter(self, sb: BaseCase, location: str):
         """Applies the location filter."""
         if sb.is_element_visible(self.LOCATION_FILTER):
+            snapshot_for_observer(sb.driver, self.LOCATION_INPUT)
             sb.click(self.LOCATION_FILTER)
-            sb.sleep(2)
+            wait_for_change_via_observer(sb.driver, self.LOCATION_INPUT, timeout_ms=2000)
         if sb.is_element_visible(self.LOCATION_INPUT):
+            snapshot_for_observer(sb.driver, self.LOCATION_SUGGESTION)
             sb.press_keys(self.LOCATION_INPUT, location)
-            sb.sleep(2)
+            wait_for_change_via_observer(sb.driver, self.LOCATION_SUGGESTION, timeout_ms=2000)
             if sb.is_element_visible(self.LOCATION_SUGGESTION):
                 sb.click(self.LOCATION_SUGGESTION)
                 sb.sleep(2)
 
     def _apply_shift_filters(self, sb: BaseCase):
         """Applies the shift filters."""
-        for filter_name, selector in self.SHIFT_FILTERS.items():
-            if sb.is_element_visible(selector):
-                sb.click(selector)
-                sb.sleep(1.5)
+        self._click_filter_buttons(sb, self.SHIFT_FILTER_BUTTONS, self.SHIFT_FILTER_IDS)
 
     def _apply_role_filters(self, sb: BaseCase):
         """Applies the role filters."""
-        for role_name, selector in self.ROLE_FILTERS.items():
-            if sb.is_element_visible(selector):
-                sb.click(selector)
-                sb.sleep(1.5)
+        self._click_filter_buttons(sb, self.ROLE_FILTER_BUTTONS, self.ROLE_FILTER_IDS)
+
+    def _click_filter_buttons(self, sb: BaseCase, group_selector: str, wanted_ids):
+        """Clicks every visible wanted button of a filter group found in one query."""
+        visible_ids = sb.execute_script(
+            "return Array.from(document.querySelectorAll(arguments[0]))"
+            ".filter(b => b.offsetParent !== null).map(b => b.getAttribute('data-test-id'));",
+            group_selector)
+        for test_id in visible_ids:
+            if test_id in wanted_ids:
+                self._click_filter_button(sb, f'button[data-test-id="{test_id}"]')
+
+    def _click_filter_button(self, sb: BaseCase, selector: str):
+        """Clicks one filter button, re-finding it since each toggle re-renders the panel."""
+        for _ in range(self.STALE_RETRIES):
+            try:
+                sb.driver.find_element(By.CSS_SELECTOR, selector).click()
+                break
+            except StaleElementReferenceException:
+                continue
+        try:
+            WebDriverWait(sb.driver, 1.5, ignored_exceptions=(StaleElementReferenceException,)).until(
+                lambda d: d.find_element(By.CSS_SELECTOR, selector).get_attribute("aria-pressed") == "true"
+            )
+        except TimeoutException:
+            logger.debug("Filter button did not report aria-pressed")
 
     def select_first_job_and_apply(self, sb: BaseCase):
         """Selects the first job card and clicks the apply button."""
         logger.info("Selecting first job and applying...")
         if sb.is_element_visible(self.FIRST_JOB_CARD):
+            snapshot_for_observer(sb.driver, self.APPLY_BTN)
             sb.click(self.FIRST_JOB_CARD)
-            sb.sleep(3)
+            wait_for_change_via_observer(sb.driver, self.APPLY_BTN, timeout_ms=3000)
         if sb.is_element_visible(self.APPLY_BTN):
             sb.click(self.APPLY_BTN)
             sb.sleep(4)
@@ -8,28 +8,35 @@ logger = logging.getLogger(__name__)
 class AmazonLoginPage:
     """Handles Amazon login flow interactions."""
     
-    EMAIL_SELECTORS = [
+    EMAIL_SELECTORS = (
         'input[data-test-id="input-test-id-login"]',
         'input[name="email"]',
         'input[type="email"]',
         '#email',
         '.email-input'
-    ]
+    )
     
-    PASSWORD_SELECTORS = [
+    PASSWORD_SELECTORS = (
         'input[type="password"]',
         'input[data-test-id="password"]',
         '#password',
         '.password-input'
-    ]
+    )
     
-    CONTINUE_SELECTORS = [
+    CONTINUE_SELECTORS = (
         'button[data-test-id="button-continue"]',
         'button:contains("Continue")',
         'button:contains("Sign In")',
         'button[type="submit"]',
         '.continue-button'
-    ]
+    )
+    
+    TWO_FACTOR_SELECTORS = (
+        'input[data-test-id="mfa-input"]',
+        'input[name="code"]',
+        'input[placeholder*="code"]',
+        '.mfa-input'
+    )
     
     def enter_credentials(self, driver: BaseCase, email: str, password: str, 
                          correlation_id: str = None) -> bool:
@@ -67,7 +74,7 @@ class AmazonLoginPage:
             return True
             
         except Exception as e:
-            logger.error(f"Exception during credential entry: {e}", extra=log_extra)
+            logger.error("Exception during credential entry: %s", e, extra=log_extra)
             return False
     
     def _enter_email(self, driver: BaseCase, email: str) -> bool:
@@ -77,7 +84,7 @@ class AmazonLoginPage:
                 if driver.is_element_present(selector, timeout=5):
                     driver.clear(selector)
                     driver.type(selector, email)
-                    logger.debug(f"Email entered using selector: {selector}")
+                    logger.debug("Email entered using selector: %s", selector)
                     return True
             except Exception:
                 continue
@@ -90,7 +97,7 @@ class AmazonLoginPage:
                 if driver.is_element_present(selector, timeout=5):
                     driver.clear(selector)
                     driver.type(selector, password)
-                    logger.debug(f"Password entered using selector: {selector}")
+                    logger.debug("Password entered using selector: %s", selector)
                     return True
             except Exception:
                 continue
@@ -102,7 +109,7 @@ class AmazonLoginPage:
             try:
                 if driver.is_element_present(selector, timeout=5):
                     driver.click(selector)
-                    logger.debug(f"Continue clicked {context} using: {selector}")
+                    logger.debug("Continue clicked %s using: %s", context, selector)
                     return True
             except Exception:
                 continue
@@ -110,15 +117,8 @@ class AmazonLoginPage:
     
     def handle_two_factor(self, driver: BaseCase, code: str = None) -> bool:
         """Handle two-factor authentication if required."""
-        two_factor_selectors = [
-            'input[data-test-id="mfa-input"]',
-            'input[name="code"]',
-            'input[placeholder*="code"]',
-            '.mfa-input'
-        ]
-        
         # Check if 2FA is required
-        for selector in two_factor_selectors:
+        for selector in self.TWO_FACTOR_SELECTORS:
             if driver.is_element_present(selector, timeout=3):
                 logger.info("Two-factor authentication required")
                 if code:
@@ -1,8 +1,12 @@
 from seleniumbase import BaseCase
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support.ui import WebDriverWait, Select
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    StaleElementReferenceException,
+)
 import logging
 from typing import List, Dict, Any, Optional
 
@@ -11,6 +15,10 @@ logger = logging.getLogger(__name__)
 class FiltersPanel:
     """Generic filters panel component for handling filter interactions."""
     
+    # React re-renders the panel on every toggle, so element references go
+    # stale between calls. Re-find by selector this many times before giving up.
+    STALE_RETRIES = 3
+    
     def __init__(self, driver: BaseCase):
         self.driver = driver
         self.wait = WebDriverWait(driver, 10)
@@ -22,10 +30,10 @@ class FiltersPanel:
                 element = self.driver.find_element(selector)
                 if element and element.is_displayed():
                     self.driver.click(selector)
-                    logger.info(f"Successfully opened filters panel with selector: {selector}")
+                    logger.info("Successfully opened filters panel with selector: %s", selector)
                     return True
             except Exception as e:
-                logger.debug(f"Failed to open filters with selector {selector}: {e}")
+                logger.debug("Failed to open filters with selector %s: %s", selector, e)
                 continue
         
         logger.warning("Failed to open filters panel with any selector")
@@ -34,7 +42,7 @@ class FiltersPanel:
     def apply_filter(self, filter_type: str, value: Any, selectors: Dict[str, List[str]]) -> bool:
         """Apply a specific filter with the given value."""
         if filter_type not in selectors:
-            logger.error(f"Unknown filter type: {filter_type}")
+            logger.error("Unknown filter type: %s", filter_type)
             return False
             
         filter_selectors = selectors[filter_type]
@@ -42,43 +50,54 @@ class FiltersPanel:
         for selector in filter_selectors:
             try:
                 if self._apply_single_filter(selector, value):
-                    logger.info(f"Successfully applied {filter_type} filter with value: {value}")
+                    logger.info("Successfully applied %s filter with value: %s", filter_type, value)
                     return True
             except Exception as e:
-                logger.debug(f"Failed to apply filter with selector {selector}: {e}")
+                logger.debug("Failed to apply filter with selector %s: %s", selector, e)
                 continue
                 
-        logger.warning(f"Failed to apply {filter_type} filter with value: {value}")
+        logger.warning("Failed to apply %s filter with value: %s", filter_type, value)
         return False
     
     def _apply_single_filter(self, selector: str, value: Any) -> bool:
-        """Apply a single filter using the given selector and value."""
-        element = self.driver.find_element(selector)
-        if not element or not element.is_displayed():
-            return False
-            
-        # Handle different input types
-        tag_name = element.tag_name.lower()
-        input_type = element.get_attribute('type')
+        """Apply a single filter using the given selector and value.
         
-        if tag_name == 'input':
-            if input_type in ['checkbox', 'radio']:
-                if value and not element.is_selected():
-                    element.click()
-                elif not value and element.is_selected():
+        The selector is kept alongside the element reference so a stale
+        reference can be re-found in place instead of abandoning the selector.
+        """
+        element = self.driver.find_element(selector)
+        for attempt in range(self.STALE_RETRIES):
+            try:
+                if not element or not element.is_displayed():
+                    return False
+                    
+                # Handle different input types
+                tag_name = element.tag_name.lower()
+                input_type = element.get_attribute('type')
+                
+                if tag_name == 'input':
+                    if input_type in ['checkbox', 'radio']:
+                        if value and not element.is_selected():
+                            element.click()
+                        elif not value and element.is_selected():
+                            element.click()
+                    elif input_type in ['text', 'number']:
+                        element.clear()
+                        element.send_keys(str(value))
+                elif tag_name == 'select':
+                    select = Select(element)
+                    select.select_by_visible_text(str(value))
+                else:
+                    # For buttons, divs, etc.
                     element.click()
-            elif input_type in ['text', 'number']:
-                element.clear()
-                element.send_keys(str(value))
-        elif tag_name == 'select':
-            from selenium.webdriver.support.ui import Select
-            select = Select(element)
-            select.select_by_visible_text(str(value))
-        else:
-            # For buttons, divs, etc.
-            element.click()
-            
-        return True
+                    
+                return True
+            except StaleElementReferenceException:
+                logger.debug("Stale element for %s, re-finding (attempt %s)", selector, attempt + 1)
+                element = self.driver.find_element(selector)
+                continue
+        
+        return False
     
     def clear_all_filters(self, clear_selector: str) -> bool:
         """Clear all applied filters."""
@@ -87,7 +106,7 @@ class FiltersPanel:
             logger.info("Successfully cleared all filters")
             return True
         except Exception as e:
-            logger.warning(f"Failed to clear filters: {e}")
+            logger.warning("Failed to clear filters: %s", e)
             return False
     
     def get_filter_state(self, selectors: Dict[str, List[str]]) -> Dict[str, Any]:
@@ -97,18 +116,33 @@ class FiltersPanel:
         for filter_type, filter_selectors in selectors.items():
             for selector in filter_selectors:
                 try:
-                    element = self.driver.find_element(selector)
-                    if element and element.is_displayed():
-                        if element.tag_name.lower() == 'input':
-                            input_type = element.get_attribute('type')
-                            if input_type in ['checkbox', 'radio']:
-                                state[filter_type] = element.is_selected()
-                            else:
-                                state[filter_type] = element.get_attribute('value')
-                        else:
-                            state[filter_type] = element.text
-                        break
+                    value = self._read_filter_value(selector)
                 except Exception:
                     continue
+                if value is not None:
+                    state[filter_type] = value
+                    break
                     
-        return state
\ No newline at end of file
+        return state
+    
+    def _read_filter_value(self, selector: str) -> Any:
+        """Read a filter's current value, re-finding the element if it goes stale.
+        
+        Returns None when the element is not displayed.
+        """
+        element = self.driver.find_element(selector)
+        for attempt in range(self.STALE_RETRIES):
+            try:
+                if not element or not element.is_displayed():
+                    return None
+                if element.tag_name.lower() == 'input':
+                    input_type = element.get_attribute('type')
+                    if input_type in ['checkbox', 'radio']:
+                        return element.is_selected()
+                    return element.get_attribute('value')
+                return element.text
+            except StaleElementReferenceException:
+                element = self.driver.find_element(selector)
+                continue
+        
+        return None
@@ -1,6 +1,10 @@
+import os
 import time
 import json
+import atexit
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, date
 from dataclasses import dataclass, asdict
 from pathlib import Path
@@ -8,12 +12,197 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.common.action_chains import ActionChains
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from typing import List, Set, Optional
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from types import MappingProxyType
+from typing import Dict, List, Set, Optional
+
+from utils import DATACLASS_SLOTS, timed
+from utils.selenium_helpers import wait_for_via_observer
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# DOM states that mark the end of a transition in the booking flow
+FLYOUT_SELECTOR = '[data-test-component="StencilFlyoutBody"]'
+APPLY_BUTTON_READY_SELECTOR = "button[data-test-id='jobDetailApplyButtonDesktop'], button[data-test-id*='apply']"
+JOB_DETAIL_READY_SELECTOR = f"{FLYOUT_SELECTOR}, {APPLY_BUTTON_READY_SELECTOR}"
+
+# Selector groups are comma-joined so each lookup is one find_elements call
+# (one round trip, one DOM walk). Where priority matters, the generic
+# selectors live in a separate fallback group queried only on a miss.
+JOB_CARD_SELECTOR = ", ".join((
+    "div[data-test-id='JobCard']",
+    ".job-card",
+    "[data-testid*='JobCard']",
+    "[data-testid*='job-card']",
+    "div[class*='JobCard']",
+    "div[class*='job-card']",
+    "div[class*='job'][class*='card']",
+))
+
+# The generic class selectors also match elements nested inside a card, so only
+# the outermost match counts; discovery and booking share this to keep card_index aligned
+OUTERMOST_CARDS_JS = """
+const outermost = (sel) => Array.from(document.querySelectorAll(sel))
+    .filter(e => !(e.parentElement && e.parentElement.closest(sel)));
+"""
+
+FIND_CARDS_JS = OUTERMOST_CARDS_JS + "return outermost(arguments[0]);"
+
+APPLY_BUTTON_SELECTOR = ", ".join((
+    "button[data-test-id='jobDetailApplyButtonDesktop']",
+    "button[data-testid*='apply']",
+    "button[data-test-id*='apply']",
+    ".apply-button",
+    "button[class*='apply']",
+    "button[aria-label*='Apply']",
+))
+
+APPLY_BUTTON_FALLBACK_SELECTOR = ", ".join((
+    "button[class*='primary']",
+    "button[class*='cta']",
+    "button[style*='background-color']:not([style*='transparent'])",
+))
+
+# :contains() is jQuery-only and invalid CSS, so text matching goes through
+# XPath. translate() lowercases the button text for case-insensitive matching.
+_LOWER = "translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+
+def _button_text_xpath(*texts: str) -> str:
+    """XPath matching buttons whose text contains any of the given phrases."""
+    return "//button[" + " or ".join(f"contains({_LOWER}, '{t.lower()}')" for t in texts) + "]"
+
+APPLY_BUTTON_TEXT_XPATH = _button_text_xpath("Apply")
+
+# Buttons that advance the application after Apply, as a single union query
+NEXT_BUTTON_TEXTS = ("Next", "Create Application", "Continue", "Submit", "Confirm")
+NEXT_BUTTON_XPATH = _button_text_xpath(*NEXT_BUTTON_TEXTS)
+
+SHIFT_DROPDOWN_TEXT_XPATH = "//*[@data-test-component='StencilReactRow'][contains(., 'Select one')]"
+SHIFT_MODAL_TEXT_XPATH = "//*[contains(text(), 'Select work shift')]"
+
+SHIFT_DROPDOWN_SELECTOR = ", ".join((
+    '.jobDetailScheduleDropdown.hvh-careers-emotion-1uzwmf0',
+    'div[class*="jobDetailScheduleDropdown"]',
+    '.hvh-careers-emotion-1uzwmf0[tabindex="0"]',
+))
+
+SHIFT_MODAL_SELECTOR = ", ".join((
+    FLYOUT_SELECTOR,
+    '.hvh-careers-emotion-wuykcp',
+    '[data-test-component*="StencilFlyout"]',
+))
+
+SHIFT_CARD_SELECTOR = ", ".join((
+    '[data-test-component="StencilReactCard"][role="button"]',
+    '[data-test-component="StencilReactCard"][tabindex="0"]',
+    '.hvh-careers-emotion-h6jfyp[role="button"]',
+    '.focusableItem.hvh-careers-emotion-h6jfyp',
+))
+
+SHIFT_CARD_FALLBACK_SELECTOR = ", ".join((
+    f'{FLYOUT_SELECTOR} [role="button"]',
+    f'{FLYOUT_SELECTOR} [tabindex="0"]',
+    '.hvh-careers-emotion-wuykcp [role="button"]',
+    f'{FLYOUT_SELECTOR} .pointer',
+    '.scheduleFlyoutSelection.pointer',
+    '.scheduleDetails',
+))
+
+# Lookup tiers, tried in order until one yields a usable element
+APPLY_BUTTON_LOCATORS = (
+    (By.CSS_SELECTOR, APPLY_BUTTON_SELECTOR),
+    (By.XPATH, APPLY_BUTTON_TEXT_XPATH),
+    (By.CSS_SELECTOR, APPLY_BUTTON_FALLBACK_SELECTOR),
+)
+SHIFT_CARD_LOCATORS = (
+    (By.CSS_SELECTOR, SHIFT_CARD_SELECTOR),
+    (By.CSS_SELECTOR, SHIFT_CARD_FALLBACK_SELECTOR),
+)
+
+# Returns the first visible, enabled match across [by, selector] tiers, where
+# by is a selenium By value ('css selector' or 'xpath'), scrolled into view.
+FIND_FIRST_CLICKABLE_JS = """
+const usable = el => {
+    const r = el.getBoundingClientRect();
+    return r.width > 0 && r.height > 0 && !el.disabled;
+};
+for (const [by, sel] of arguments[0]) {
+    let els;
+    if (by === 'xpath') {
+        const snap = document.evaluate(sel, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        els = Array.from({length: snap.snapshotLength}, (_, i) => snap.snapshotItem(i));
+    } else {
+        els = document.querySelectorAll(sel);
+    }
+    for (const el of els) {
+        if (usable(el)) {
+            el.scrollIntoView({block: 'center'});
+            return el;
+        }
+    }
+}
+return null;
+"""
+
+# Per-card field selectors, tried in order; first non-empty text wins
+CARD_FIELD_SELECTORS = {
+    'title': ["strong", ".job-title", "h3", "h4", "[data-testid*='title']"],
+    'location': [".location", "[data-testid*='location']", ".job-location"],
+    'schedule': [".schedule", "[data-testid*='schedule']", ".time", ".shift-time"],
+    'pay_rate': [".pay", ".rate", "[data-testid*='pay']", ".wage"],
+}
+
+# Extracts every card's fields in the browser in a single round trip
+# instead of one find_element per selector per field per card. Cards whose
+# job id is in arguments[2] (already booked) are dropped before returning.
+EXTRACT_CARDS_JS = OUTERMOST_CARDS_JS + """
+const cards = outermost(arguments[0]);
+const fields = arguments[1];
+const booked = new Set(arguments[2]);
+const pick = (card, sels) => {
+    for (const s of sels) {
+        const el = card.querySelector(s);
+        const text = el && el.innerText.trim();
+        if (text) return text;
+    }
+    return null;
+};
+return cards.map((card, idx) => ({
+    idx: idx,
+    job_id: card.getAttribute('data-job-id') || card.getAttribute('data-testid') || card.id || '',
+    title: pick(card, fields.title),
+    location: pick(card, fields.location),
+    schedule: pick(card, fields.schedule),
+    pay_rate: pick(card, fields.pay_rate),
+})).filter(info => !booked.has(info.job_id));
+"""
+
+# Find (by selector or element), skip disabled, scroll and click in one call
+JS_CLICK = """
+const el = typeof arguments[0] === 'string' ? document.querySelector(arguments[0]) : arguments[0];
+if (!el || el.disabled) return false;
+el.scrollIntoView({block: 'center'});
+el.click();
+return true;
+"""
+
+# Click the schedule dropdown if visible, then the first visible shift card
+FAST_SHIFT_DROPDOWN_JS = """
+const d = document.querySelector(arguments[0]);
+if (!d || d.offsetParent === null) return 'no_dropdown';
+d.click();
+const s = document.querySelector(arguments[1]);
+if (s && s.offsetParent !== null) { s.click(); return 'done'; }
+return 'clicked_only';
+"""
+
+# Static assets and trackers the booking flow never needs; blocked via CDP
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.gif", "*.svg", "*.woff", "*.woff2",
+    "*analytics*", "*doubleclick*", "*google-analytics*",
+]
+
+@dataclass(frozen=True, **DATACLASS_SLOTS)
 class ShiftSlot:
     job_id: str
     title: str
@@ -25,103 +214,268 @@ class ShiftSlot:
     
     def __post_init__(self):
         if self.discovered_at is None:
-            self.discovered_at = datetime.now().isoformat()
+            object.__setattr__(self, 'discovered_at', datetime.now().isoformat())
 
 class ShiftBookingState:
-    """Manages booking state and idempotency."""
+    """Manages booking state and idempotency.
+    
+    Bookings are appended one line at a time to a log next to the JSON
+    snapshot (booking_state.log for booking_state.json), so recording a
+    booking costs O(1) I/O. On load the snapshot is read and today's log
+    lines are replayed; the log is folded into the snapshot once it grows
+    past COMPACT_AFTER entries, at exit, and archived on the daily reset.
+    """
+    
+    # Logged bookings kept before they are folded into the snapshot
+    COMPACT_AFTER = 100
+    
+    # How long the cached ISO date is trusted before date.today() is re-read
+    TODAY_TTL = 60.0
     
     def __init__(self, state_file: str = "booking_state.json"):
         self.state_file = Path(state_file)
+        self.state_log = self.state_file.with_suffix('.log')
         self.booked_today: Set[str] = set()
         self.daily_count = 0
-        self.last_reset_date = date.today().isoformat()
+        self._today_iso = date.today().isoformat()
+        self._today_checked = time.monotonic()
+        self.last_reset_date = self._today_iso
+        self._log_entries = 0
+        # Shared between ShiftBooking instances driving parallel browsers
+        self._lock = threading.RLock()
         self._load_state()
+        atexit.register(self.flush)
+    
+    def _today(self) -> str:
+        """Today's ISO date, re-read from the clock at most once per TODAY_TTL."""
+        now = time.monotonic()
+        if now - self._today_checked > self.TODAY_TTL:
+            self._today_iso = date.today().isoformat()
+            self._today_checked = now
+        return self._today_iso
+    
+    def _roll_over(self):
+        """Start a new day's state once the date has changed (a long-running monitor crosses midnight)."""
+        if self._today() != self.last_reset_date:
+            with self._lock:
+                if self._today() != self.last_reset_date:
+                    self._reset_daily_state()
     
     def _load_state(self):
-        """Load booking state from file."""
+        """Load the booking snapshot, then replay today's entries from the log."""
         if self.state_file.exists():
             try:
                 with open(self.state_file, 'r') as f:
                     data = json.load(f)
                     
                 # Reset if it's a new day
-                if data.get('last_reset_date') != date.today().isoformat():
+                today = self._today()
+                if data.get('last_reset_date') != today:
+                    # Archive the stale log under the day it belongs to
+                    self.last_reset_date = data.get('last_reset_date') or today
                     self._reset_daily_state()
-                else:
-                    self.booked_today = set(data.get('booked_today', []))
-                    self.daily_count = data.get('daily_count', 0)
-                    self.last_reset_date = data.get('last_reset_date', date.today().isoformat())
+                    return
+                self.booked_today = set(data.get('booked_today', []))
+                self.daily_count = data.get('daily_count', 0)
+                self.last_reset_date = data.get('last_reset_date', today)
                     
             except (json.JSONDecodeError, KeyError) as e:
                 logger.warning(f"Failed to load booking state: {e}. Starting fresh.")
                 self._reset_daily_state()
+                return
+        
+        self._replay_log()
+    
+    def _replay_log(self):
+        """Apply logged bookings for the current day on top of the snapshot."""
+        if not self.state_log.exists():
+            return
+        with open(self.state_log, 'r') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Torn final line from a crash mid-append
+                if entry.get('day') != self.last_reset_date:
+                    continue
+                self._log_entries += 1
+                # Entries already in the snapshot (crash between compaction
+                # writing the snapshot and truncating the log) are not recounted
+                if entry['job_id'] not in self.booked_today:
+                    self.booked_today.add(entry['job_id'])
+                    self.daily_count += 1
     
     def _reset_daily_state(self):
-        """Reset state for a new day."""
-        self.booked_today.clear()
-        self.daily_count = 0
-        self.last_reset_date = date.today().isoformat()
-        self._save_state()
+        """Reset state for a new day, archiving the previous day's log."""
+        with self._lock:
+            if self.state_log.exists():
+                archive = self.state_log.with_name(
+                    f"{self.state_log.stem}.{self.last_reset_date}{self.state_log.suffix}"
+                )
+                try:
+                    os.replace(self.state_log, archive)
+                except OSError as e:
+                    logger.warning(f"Failed to archive booking log: {e}")
+            self.booked_today.clear()
+            self.daily_count = 0
+            self._log_entries = 0
+            self.last_reset_date = self._today()
+            self._save_state()
         logger.info("🔄 Daily booking state reset")
     
     def _save_state(self):
-        """Save current state to file."""
+        """Save the snapshot atomically (write temp file, then replace)."""
         try:
             data = {
-                'booked_today': list(self.booked_today),
+                'booked_today': sorted(self.booked_today),
                 'daily_count': self.daily_count,
                 'last_reset_date': self.last_reset_date
             }
-            with open(self.state_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            tmp = self.state_file.with_suffix('.tmp')
+            tmp.write_text(json.dumps(data, separators=(',', ':')))
+            os.replace(tmp, self.state_file)
         except Exception as e:
             logger.error(f"Failed to save booking state: {e}")
     
+    def flush(self):
+        """Fold the booking log into the snapshot and truncate the log."""
+        with self._lock:
+            if not self._log_entries:
+                return
+            self._save_state()
+            try:
+                open(self.state_log, 'w').close()
+                self._log_entries = 0
+            except OSError as e:
+                logger.error(f"Failed to truncate booking log: {e}")
+    
+    def booked_ids(self) -> List[str]:
+        """Job ids booked today, after rolling over to a new day if needed."""
+        with self._lock:
+            self._roll_over()
+            return list(self.booked_today)
+    
     def is_already_booked(self, job_id: str) -> bool:
         """Check if job was already booked today."""
+        self._roll_over()
         return job_id in self.booked_today
     
     def mark_as_booked(self, job_id: str):
         """Mark job as booked and increment counters."""
-        self.booked_today.add(job_id)
-        self.daily_count += 1
-        self._save_state()
+        with self._lock:
+            self._roll_over()
+            self.booked_today.add(job_id)
+            self.daily_count += 1
+            try:
+                with open(self.state_log, 'a') as f:
+                    f.write(json.dumps({'job_id': job_id, 'day': self.last_reset_date}, separators=(',', ':')) + '\n')
+                self._log_entries += 1
+            except OSError as e:
+                logger.error(f"Failed to append booking log: {e}")
+            if self._log_entries >= self.COMPACT_AFTER:
+                self.flush()
     
     def can_book_more(self, daily_limit: int) -> bool:
         """Check if we can book more shifts today."""
+        self._roll_over()
         return self.daily_count < daily_limit
 
 class ShiftBooking:
     """Production-grade shift booking with idempotency and resilience."""
     
-    def __init__(self, driver, state_file: str = "booking_state.json"):
+    # Fast path only ever tries the primary dropdown and card selectors
+    _FAST_DROPDOWN_SELECTOR = '.jobDetailScheduleDropdown.hvh-careers-emotion-1uzwmf0'
+    _FAST_SHIFT_LOCATOR = (By.CSS_SELECTOR, '[data-test-component="StencilReactCard"][role="button"]')
+    
+    def __init__(self, driver, state_file: str = "booking_state.json",
+                 state: Optional[ShiftBookingState] = None,
+                 block_resources: bool = True):
         self.driver = driver
         self.wait = WebDriverWait(driver, 3)  # Ultra-fast waits for instant booking
-        self.state = ShiftBookingState(state_file)
+        self.state = state or ShiftBookingState(state_file)
         self.fast_booking_mode = True  # Enable aggressive booking optimizations
+        self._summary_cache: Optional[tuple] = None
+        # Keep images/fonts when debugging so screenshots stay readable
+        self.block_resources = (block_resources and hasattr(driver, 'execute_cdp_cmd')
+                                and not logger.isEnabledFor(logging.DEBUG))
+
+    def _set_blocked_urls(self, urls: List[str]):
+        """Set the URL patterns Chrome refuses to fetch; an empty list lifts the block."""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": urls})
+        except WebDriverException as e:
+            logger.debug("Resource blocking unavailable: %s", e)
         
+    def _wait_for(self, condition, timeout: float = 3):
+        """Wait until condition holds; returns its result, or False on timeout."""
+        try:
+            return WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(condition)
+        except TimeoutException:
+            return False
+    
+    def _find_first_clickable(self, locators):
+        """Return the first visible, enabled element across locator tiers, or None.
+        
+        Runs entirely in the browser and scrolls the match into view.
+        """
+        try:
+            return self.driver.execute_script(FIND_FIRST_CLICKABLE_JS, [list(loc) for loc in locators])
+        except Exception as e:
+            logger.debug(f"Clickable lookup failed: {e}")
+            return None
+    
+    def _click(self, element) -> bool:
+        """Scroll to and click an element via JS, falling back to a native click once.
+        
+        The JS click works on Amazon's React UI in practice; the native pointer
+        path is only tried if the driver rejects the script.
+        """
+        try:
+            self.driver.execute_script(
+                "arguments[0].scrollIntoView({block: 'center'}); arguments[0].click();", element
+            )
+            return True
+        except WebDriverException as e:
+            logger.debug(f"JS click failed, falling back to native click: {e}")
+        try:
+            if hasattr(self.driver, 'execute_cdp_cmd'):
+                self._cdp_click(element)
+            else:
+                ActionChains(self.driver).move_to_element(element).click().perform()
+            return True
+        except WebDriverException as e:
+            logger.warning(f"Native click failed: {e}")
+            return False
+    
+    def _cdp_click(self, element):
+        """Click the element's center with raw CDP mouse events (Chromium only).
+        
+        One round trip for the coordinates plus one per event, versus the
+        move/pause/click/perform sequence ActionChains sends.
+        """
+        x, y = self.driver.execute_script(
+            "const r = arguments[0].getBoundingClientRect(); return [r.left + r.width / 2, r.top + r.height / 2];",
+            element
+        )
+        for event_type in ("mousePressed", "mouseReleased"):
+            self.driver.execute_cdp_cmd("Input.dispatchMouseEvent", {
+                "type": event_type, "x": x, "y": y, "button": "left", "clickCount": 1
+            })
+    
     def click_with_retry(self, element_or_selector, max_retries: int = 2, backoff_factor: float = 1.2) -> bool:
-        """Click with exponential backoff retry."""
+        """Resolve, scroll and click in one round trip, waiting for the selector between attempts."""
         for attempt in range(max_retries):
             try:
-                if isinstance(element_or_selector, str):
-                    element = self.wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, element_or_selector)))
-                else:
-                    element = element_or_selector
-                    
-                # Scroll into view and click
-                self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-                time.sleep(0.5)
-                element.click()
-                return True
-                
-            except (TimeoutException, NoSuchElementException) as e:
-                wait_time = backoff_factor ** attempt
-                logger.warning(f"Click attempt {attempt + 1} failed: {e}. Retrying in {wait_time:.1f}s...")
-                if attempt < max_retries - 1:
-                    time.sleep(wait_time)
-                    
-        logger.error(f"Failed to click after {max_retries} attempts")
+                if self.driver.execute_script(JS_CLICK, element_or_selector):
+                    return True
+            except WebDriverException as e:
+                logger.warning("Click attempt %d failed: %s", attempt + 1, e)
+            if attempt < max_retries - 1 and isinstance(element_or_selector, str):
+                wait_for_via_observer(self.driver, element_or_selector,
+                                      timeout_ms=int(1000 * backoff_factor ** attempt))
+
+        logger.error("Failed to click after %d attempts", max_retries)
         return False
     
     def discover_available_slots(self, correlation_id: str = None) -> List[ShiftSlot]:
@@ -131,122 +485,61 @@ class ShiftBooking:
         
         try:
             # Wait for job cards to load
-            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "div[data-test-id='JobCard'], .job-card")))
+            self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, JOB_CARD_SELECTOR)))
         except TimeoutException:
             logger.warning("No job cards found on page", extra=log_extra)
             return []
         
-        # Try multiple selectors for job cards
-        card_selectors = [
-            "div[data-test-id='JobCard']",
-            ".job-card",
-            "div[class*='job'][class*='card']",
-            "[data-testid*='job']"
-        ]
-        
-        cards = []
-        for selector in card_selectors:
-            cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-            if cards:
-                logger.debug(f"Found {len(cards)} cards using selector: {selector}", extra=log_extra)
-                break
+        try:
+            card_infos = self.driver.execute_script(
+                EXTRACT_CARDS_JS, JOB_CARD_SELECTOR, CARD_FIELD_SELECTORS, self.state.booked_ids()
+            )
+        except Exception as e:
+            logger.warning(f"Failed to extract job cards: {e}", extra=log_extra)
+            return []
+        logger.debug(f"Found {len(card_infos)} job cards not booked today", extra=log_extra)
         
-        if not cards:
-            logger.warning("No job cards found with any selector", extra=log_extra)
+        if not card_infos:
+            logger.info("All job cards on the page are already booked", extra=log_extra)
             return []
         
-        slots = []
-        for idx, card in enumerate(cards):
-            try:
-                slot = self._extract_slot_info(card, idx)
-                if slot and not self.state.is_already_booked(slot.job_id):
-                    slots.append(slot)
-                elif slot:
-                    logger.debug(f"Skipping already booked slot: {slot.job_id}", extra=log_extra)
-            except Exception as e:
-                logger.debug(f"Failed to extract slot info from card {idx}: {e}", extra=log_extra)
+        # One timestamp for the whole pass instead of one per ShiftSlot
+        now_iso = datetime.now().isoformat()
+        slots = [self._slot_from_card_info(info, now_iso) for info in card_infos]
         
         logger.info(f"✅ Discovered {len(slots)} available slots (excluding already booked)", extra=log_extra)
         return slots
     
-    def _extract_slot_info(self, card, idx: int) -> Optional[ShiftSlot]:
-        """Extract shift information from a job card element."""
-        try:
-            # Multiple selectors for robustness
-            title_selectors = ["strong", ".job-title", "h3", "h4", "[data-testid*='title']"]
-            location_selectors = [".location", "[data-testid*='location']", ".job-location"]
-            schedule_selectors = [".schedule", "[data-testid*='schedule']", ".time", ".shift-time"]
-            pay_selectors = [".pay", ".rate", "[data-testid*='pay']", ".wage"]
-            
-            title = self._find_text_by_selectors(card, title_selectors) or f"Shift {idx + 1}"
-            location = self._find_text_by_selectors(card, location_selectors) or "Location TBD"
-            schedule = self._find_text_by_selectors(card, schedule_selectors) or "Schedule TBD"
-            pay_rate = self._find_text_by_selectors(card, pay_selectors)
-            
-            # Try to get job ID from various attributes
-            job_id = (card.get_attribute("data-job-id") or 
-                     card.get_attribute("data-testid") or 
-                     card.get_attribute("id") or 
-                     f"shift_{idx}_{int(time.time())}")
-            
-            return ShiftSlot(
-                job_id=job_id,
-                title=title,
-                location=location,
-                schedule=schedule,
-                card_index=idx,
-                pay_rate=pay_rate
-            )
-        except Exception as e:
-            logger.debug(f"Failed to extract slot info: {e}")
-            return None
-    
-    def _find_text_by_selectors(self, parent, selectors: List[str]) -> Optional[str]:
-        """Try multiple selectors to find text content."""
-        for selector in selectors:
-            try:
-                element = parent.find_element(By.CSS_SELECTOR, selector)
-                text = element.text.strip()
-                if text:
-                    return text
-            except NoSuchElementException:
-                continue
-        return None
+    def _slot_from_card_info(self, info: dict, discovered_at: Optional[str] = None) -> ShiftSlot:
+        """Build a ShiftSlot from one record returned by EXTRACT_CARDS_JS."""
+        idx = info['idx']
+        return ShiftSlot(
+            job_id=info['job_id'] or f"shift_{idx}_{int(time.time())}",
+            title=info['title'] or f"Shift {idx + 1}",
+            location=info['location'] or "Location TBD",
+            schedule=info['schedule'] or "Schedule TBD",
+            card_index=idx,
+            pay_rate=info['pay_rate'],
+            discovered_at=discovered_at
+        )
     
     def book_slot(self, slot: ShiftSlot, correlation_id: str = None) -> bool:
         """Book a specific shift slot with retry logic and enhanced error handling."""
         log_extra = {'correlation_id': correlation_id, 'job_id': slot.job_id} if correlation_id else {'job_id': slot.job_id}
         logger.info(f"▶️ Attempting to book slot: {slot.title} @ {slot.location}", extra=log_extra)
         
+        # The driver is shared with monitoring, so the block only lasts for this booking
+        if self.block_resources:
+            self._set_blocked_urls(BLOCKED_URL_PATTERNS)
         try:
-            # Take a screenshot before starting
-            try:
-                self.driver.get_screenshot_as_png()
-                logger.debug("📸 Took initial screenshot", extra=log_extra)
-            except Exception as e:
-                logger.warning(f"Failed to take initial screenshot: {e}", extra=log_extra)
+            # Cheap liveness probe; a screenshot here cost 100-500ms for nothing
+            if logger.isEnabledFor(logging.DEBUG):
+                ready_state = self.driver.execute_script("return document.readyState")
+                logger.debug(f"Page readyState before booking: {ready_state}", extra=log_extra)
             
-            # Find job cards with better selectors and error handling
-            card_selectors = [
-                "div[data-test-id='JobCard']",
-                ".job-card", 
-                "[data-testid*='JobCard']",
-                "[data-testid*='job-card']",
-                "div[class*='JobCard']",
-                "div[class*='job-card']",
-                "[role='listitem']"
-            ]
-            
-            cards = []
-            for selector in card_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        logger.info(f"🔍 Found {len(elements)} job cards with selector: {selector}", extra=log_extra)
-                        cards = elements
-                        break
-                except Exception as e:
-                    logger.debug(f"Selector '{selector}' failed: {e}", extra=log_extra)
+            # Same selector group as discovery so card_index stays aligned
+            cards = self.driver.execute_script(FIND_CARDS_JS, JOB_CARD_SELECTOR)
+            logger.info(f"🔍 Found {len(cards)} job cards", extra=log_extra)
             
             if not cards:
                 logger.error("❌ No job cards found on the page", extra=log_extra)
@@ -256,41 +549,24 @@ class ShiftBooking:
                 logger.error(f"❌ Card index {slot.card_index} out of range (found {len(cards)} cards)", extra=log_extra)
                 return False
             
-            # Click the job card with multiple methods
+            # Click the job card
             card = cards[slot.card_index]
             logger.info(f"🖱️ Attempting to click job card {slot.card_index + 1} of {len(cards)}", extra=log_extra)
             
-            click_methods = [
-                lambda: card.click(),
-                lambda: (self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'}});", card),
-                        time.sleep(1),
-                        card.click()),
-                lambda: self.driver.execute_script("arguments[0].click();", card),
-                lambda: ActionChains(self.driver).move_to_element(card).click().perform()
-            ]
-            
-            card_clicked = False
-            for i, click_method in enumerate(click_methods):
-                try:
-                    click_method()
-                    logger.info(f"✅ Card clicked using method {i+1}", extra=log_extra)
-                    card_clicked = True
-                    break
-                except Exception as e:
-                    logger.warning(f"Click method {i+1} failed: {e}", extra=log_extra)
-            
-            if not card_clicked:
-                logger.error("❌ All card click methods failed", extra=log_extra)
+            before_url = self.driver.current_url
+            if not self._click(card):
+                logger.error("❌ Card click failed", extra=log_extra)
                 return False
+            logger.info("✅ Card clicked", extra=log_extra)
             
-            # Ultra-fast booking mode - minimal stabilization time
-            if self.fast_booking_mode:
-                time.sleep(0.5)  # Minimal wait for instant booking
-            else:
-                time.sleep(2)  # Standard wait
+            # Return as soon as the job detail view is up instead of padding
+            self._wait_for(EC.any_of(
+                EC.url_changes(before_url),
+                EC.presence_of_element_located((By.CSS_SELECTOR, JOB_DETAIL_READY_SELECTOR))
+            ))
             
-            # Quick URL check for fast mode
-            if self.fast_booking_mode:
+            # URL is only needed for the debug log
+            if logger.isEnabledFor(logging.DEBUG):
                 try:
                     current_url = self.driver.current_url
                     logger.debug(f"Current URL after card click: {current_url}", extra=log_extra)
@@ -308,108 +584,36 @@ class ShiftBooking:
                 logger.debug(f"Fast dropdown handling failed: {e}", extra=log_extra)
                 # Continue without shift selection for speed
             
-            # Minimal modal settle time for instant booking
-            if not self.fast_booking_mode:
-                time.sleep(1)
-            
-            # Click Apply button with enhanced selectors based on current Amazon structure
-            apply_selectors = [
-                # Primary apply button selectors
-                "button[data-test-id='jobDetailApplyButtonDesktop']",
-                "button[data-testid*='apply']",
-                "button[data-test-id*='apply']",
-                
-                # Blue apply button (Amazon's primary CTA color)
-                "button.hvh-careers-emotion-*[style*='background-color']:contains('Apply')",
-                "button[class*='hvh-careers-emotion'][style*='rgb']:contains('Apply')",
-                
-                # Text-based selectors
-                "button:contains('Apply')",
-                "button:contains('Apply Now')",
-                "button:contains('APPLY')",
-                
-                # Class and attribute-based
-                ".apply-button",
-                "button[class*='apply']",
-                "button[aria-label*='Apply']",
-                
-                # Generic button in job detail area
-                "[data-test-component*='JobDetail'] button:contains('Apply')",
-                ".job-detail button:contains('Apply')",
-                
-                # Fallback to any prominent button after modal appears
-                "button[class*='primary']",
-                "button[class*='cta']",
-                "button[style*='background-color']:not([style*='transparent'])",
-                
-                # Last resort - any button that might be apply button
-                "div[class*='job'] button:contains('Apply')",
-                "[role='main'] button:contains('Apply')"
-            ]
-            
-            # Wait for apply button to be available
-            apply_clicked = False
-            max_apply_attempts = 3
-            
-            for attempt in range(max_apply_attempts):
-                logger.info(f"🔍 Looking for apply button (attempt {attempt + 1}/{max_apply_attempts})", extra=log_extra)
-                
-                for selector in apply_selectors:
-                    try:
-                        elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                        if not elements:
-                            continue
-                            
-                        for btn in elements:
-                            try:
-                                if btn.is_displayed() and btn.is_enabled():
-                                    # Scroll button into view
-                                    self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", btn)
-                                    time.sleep(0.5)
-                                    
-                                    btn.click()
-                                    logger.info(f"✅ Clicked apply button: {selector}", extra=log_extra)
-                                    apply_clicked = True
-                                    break
-                            except Exception as btn_e:
-                                logger.debug(f"Error clicking button with selector '{selector}': {btn_e}", extra=log_extra)
-                                continue
-                                
-                        if apply_clicked:
-                            break
-                            
-                    except Exception as e:
-                        logger.debug(f"Error with apply selector '{selector}': {e}", extra=log_extra)
-                        continue
-                
-                if apply_clicked:
-                    break
-                    
-                # Wait between attempts
-                if attempt < max_apply_attempts - 1:
-                    logger.info(f"⏳ Apply button not found, waiting before retry...", extra=log_extra)
-                    time.sleep(2)
-            
-            if not apply_clicked:
-                logger.error("❌ Failed to click any apply button", extra=log_extra)
+            # Click Apply button: specific selectors first, generic CTAs on a miss.
+            # The observer returns the instant the button is inserted, so there
+            # is no retry/sleep loop; the fallback tiers are tried either way.
+            wait_for_via_observer(self.driver, APPLY_BUTTON_SELECTOR, timeout_ms=3000)
+            btn = self._find_first_clickable(APPLY_BUTTON_LOCATORS)
+            if btn is None:
+                logger.error("❌ No apply button found", extra=log_extra)
+                return False
+            try:
+                btn.click()
+                logger.info("✅ Clicked apply button", extra=log_extra)
+            except Exception as e:
+                logger.error(f"❌ Failed to click apply button: {e}", extra=log_extra)
                 return False
             
-            time.sleep(3)
-            
-            # Handle Next/Submit buttons
-            next_button_texts = ["Next", "Create Application", "Continue", "Submit", "Confirm"]
-            for text in next_button_texts:
+            # Handle Next/Submit buttons: click through each step until none is left
+            self._wait_for(EC.presence_of_element_located((By.XPATH, NEXT_BUTTON_XPATH)))
+            for _ in NEXT_BUTTON_TEXTS:
                 try:
-                    xpath = f"//button[contains(translate(., 'NEXT', 'next'), '{text.lower()}')]"
-                    elements = self.driver.find_elements(By.XPATH, xpath)
-                    for btn in elements:
-                        if btn.is_displayed() and btn.is_enabled():
-                            btn.click()
-                            logger.info(f"✅ Clicked '{text}' button", extra=log_extra)
-                            time.sleep(2)
-                            break
+                    btn = next((b for b in self.driver.find_elements(By.XPATH, NEXT_BUTTON_XPATH)
+                                if b.is_displayed() and b.is_enabled()), None)
+                    if btn is None:
+                        break
+                    text = btn.text.strip()
+                    btn.click()
+                    logger.info(f"✅ Clicked '{text}' button", extra=log_extra)
+                    self._wait_for(EC.staleness_of(btn), timeout=2)
                 except Exception as e:
-                    logger.debug(f"Error with next button '{text}': {e}", extra=log_extra)
+                    logger.debug(f"Error with next button: {e}", extra=log_extra)
+                    break
             
             # Mark as successfully booked
             self.state.mark_as_booked(slot.job_id)
@@ -419,35 +623,47 @@ class ShiftBooking:
         except Exception as e:
             logger.error(f"❌ Booking failed with exception: {e}", extra=log_extra)
             return False
+        finally:
+            if self.block_resources:
+                self._set_blocked_urls([])
+    
+    def book_slots_parallel(self, slots: List[ShiftSlot], drivers: List,
+                            correlation_id: str = None) -> Dict[str, bool]:
+        """Book up to len(drivers) slots at once, one browser session per slot.
+        
+        Each driver must be a separate browser (its own user_data_dir) showing
+        the same job list, so card indices line up. Booking state is shared.
+        Selenium releases the GIL while waiting on the driver, so threads
+        overlap the round trips. Returns {job_id: booked}.
+        """
+        bookers = [self if d is self.driver else ShiftBooking(d, state=self.state) for d in drivers]
+        results = {}
+        with ThreadPoolExecutor(max_workers=max(len(bookers), 1)) as pool:
+            futures = {
+                pool.submit(booker.book_slot, slot, correlation_id): slot
+                for booker, slot in zip(bookers, slots)
+            }
+            for future in as_completed(futures):
+                results[futures[future].job_id] = future.result()
+        return results
     
     def _handle_shift_dropdown(self, log_extra: dict) -> bool:
         """Handle shift selection dropdown that opens a modal/sidebar in Amazon's hiring portal."""
         try:
             # Step 1: Look for the "Work shift" dropdown with "Select one" text
-            dropdown_selectors = [
-                '.jobDetailScheduleDropdown.hvh-careers-emotion-1uzwmf0',  # Primary selector from XML
-                'div[class*="jobDetailScheduleDropdown"]',                   # Fallback with partial class
-                '.hvh-careers-emotion-1uzwmf0[tabindex="0"]',               # Fallback with tabindex
-                'div:contains("Select one")',                               # Text-based fallback
-                '[data-test-component="StencilReactRow"]:contains("Select one")', # Component-based
-            ]
-            
             dropdown_element = None
-            for selector in dropdown_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    for element in elements:
-                        if element.is_displayed() and element.is_enabled():
-                            # Check if it contains "Select one" text
-                            if "select one" in element.text.lower() or "work shift" in element.get_attribute("class"):
-                                dropdown_element = element
-                                logger.info(f"✅ Found shift dropdown: {selector}", extra=log_extra)
-                                break
-                    if dropdown_element:
-                        break
-                except Exception as e:
-                    logger.debug(f"Dropdown selector {selector} failed: {e}", extra=log_extra)
-                    continue
+            try:
+                candidates = (self.driver.find_elements(By.CSS_SELECTOR, SHIFT_DROPDOWN_SELECTOR)
+                              or self.driver.find_elements(By.XPATH, SHIFT_DROPDOWN_TEXT_XPATH))
+                for element in candidates:
+                    if element.is_displayed() and element.is_enabled():
+                        # Check if it contains "Select one" text
+                        if "select one" in element.text.lower() or "work shift" in (element.get_attribute("class") or ""):
+                            dropdown_element = element
+                            logger.info("✅ Found shift dropdown", extra=log_extra)
+                            break
+            except Exception as e:
+                logger.debug(f"Dropdown lookup failed: {e}", extra=log_extra)
             
             if not dropdown_element:
                 logger.info("No shift dropdown found, checking for existing modal", extra=log_extra)
@@ -457,96 +673,26 @@ class ShiftBooking:
                 logger.info("🖱️ Clicking shift dropdown to open modal", extra=log_extra)
                 try:
                     dropdown_element.click()
-                    time.sleep(1)  # Wait for modal to appear
                 except Exception as e:
                     logger.warning(f"Failed to click dropdown: {e}", extra=log_extra)
             
             # Step 2: Wait for the shift selection modal/sidebar to appear
-            modal_selectors = [
-                '[data-test-component="StencilFlyoutBody"]',  # Primary selector from XML
-                '.hvh-careers-emotion-wuykcp',                # Specific class from XML
-                '[data-test-component*="StencilFlyout"]',     # Broader flyout selector
-                'div:contains("Select work shift")',          # Title-based selector
-                'div:contains("Showing 1 of 1 shift")',      # Content-based selector
-            ]
-            
-            modal_found = False
-            for selector in modal_selectors:
-                try:
-                    self.wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-                    logger.info(f"✅ Found shift selection modal: {selector}", extra=log_extra)
-                    modal_found = True
-                    break
-                except TimeoutException:
-                    continue
-                    
-            if not modal_found:
+            modal_found = bool(self._wait_for(EC.any_of(
+                EC.presence_of_element_located((By.CSS_SELECTOR, SHIFT_MODAL_SELECTOR)),
+                EC.presence_of_element_located((By.XPATH, SHIFT_MODAL_TEXT_XPATH))
+            )))
+            if modal_found:
+                logger.info("✅ Found shift selection modal", extra=log_extra)
+            else:
                 logger.info("No shift selection modal found after dropdown click, proceeding without shift selection", extra=log_extra)
                 return True
             
-            # Step 3: Look for shift cards in the modal (based on XML structure)
-            shift_card_selectors = [
-                # Primary selector: StencilReactCard with role="button" (from XML)
-                '[data-test-component="StencilReactCard"][role="button"]',
-                '[data-test-component="StencilReactCard"][tabindex="0"]',
-                
-                # Backup with class selectors from XML
-                '.hvh-careers-emotion-h6jfyp[role="button"]',
-                '.focusableItem.hvh-careers-emotion-h6jfyp',
-                
-                # Text-based selectors for the specific shift from XML
-                'div:contains("Flexible Shifts (19h)")',
-                'div:contains("Featured")',
-                'div:contains("$20.00")',
-                
-                # Generic card selectors in the flyout
-                '[data-test-component="StencilFlyoutBody"] [role="button"]',
-                '[data-test-component="StencilFlyoutBody"] [tabindex="0"]',
-                '.hvh-careers-emotion-wuykcp [role="button"]',
-                
-                # Fallback to any clickable element with shift content
-                '[data-test-component="StencilFlyoutBody"] div:contains("Shift:")',
-                '[data-test-component="StencilFlyoutBody"] div:contains("Duration:")',
-                
-                # Last resort - any clickable element in the modal
-                '[data-test-component="StencilFlyoutBody"] div[tabindex="0"]',
-                '[data-test-component="StencilFlyoutBody"] .pointer',
-                
-                # Alternative class-based selectors
-                '.scheduleFlyoutSelection.pointer',
-                '.scheduleDetails',
-            ]
-            
-            # Find the first available shift card/option
-            shift_element = None
-            for selector in shift_card_selectors:
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements:
-                        logger.info(f"✅ Found {len(elements)} shift element(s): {selector}", extra=log_extra)
-                        
-                        # Get the first visible and clickable element
-                        for element in elements:
-                            try:
-                                if element.is_displayed() and element.is_enabled():
-                                    text = element.text.strip()
-                                    logger.info(f"📋 Evaluating shift element: '{text[:100]}...'", extra=log_extra)
-                                    
-                                    # Accept any visible clickable element in the modal
-                                    # Priority: elements with shift content, but accept any clickable element
-                                    shift_element = element
-                                    logger.info(f"✅ Selected shift element: '{text[:50]}...'", extra=log_extra)
-                                    break
-                            except Exception as elem_e:
-                                logger.debug(f"Error evaluating element: {elem_e}", extra=log_extra)
-                                continue
-                                
-                        if shift_element:
-                            break
-                                
-                except Exception as e:
-                    logger.debug(f"Shift selector {selector} failed: {e}", extra=log_extra)
-                    continue
+            # Step 3: Wait for any shift card tier to render (one wait, not one per
+            # selector), then take the first visible card in priority order
+            self._wait_for(EC.any_of(*(
+                EC.presence_of_element_located(locator) for locator in SHIFT_CARD_LOCATORS
+            )))
+            shift_element = self._find_first_clickable(SHIFT_CARD_LOCATORS)
             
             if not shift_element:
                 logger.info("No shift selection elements found, proceeding without selection", extra=log_extra)
@@ -557,62 +703,16 @@ class ShiftBooking:
                 element_text = shift_element.text.strip() if hasattr(shift_element, 'text') else "N/A"
                 logger.info(f"📋 Attempting to select shift card: '{element_text[:100]}...'", extra=log_extra)
                 
-                # Enhanced click methods for shift card selection
-                click_methods = [
-                    # Method 1: Direct click
-                    lambda: shift_element.click(),
-                    
-                    # Method 2: Scroll into view and click
-                    lambda: (self.driver.execute_script("arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});", shift_element),
-                            time.sleep(0.5),
-                            shift_element.click()),
-                    
-                    # Method 3: JavaScript click (most reliable for Amazon)
-                    lambda: self.driver.execute_script("arguments[0].click();", shift_element),
-                    
-                    # Method 4: ActionChains click with hover
-                    lambda: (ActionChains(self.driver).move_to_element(shift_element).pause(0.3).click().perform()),
-                    
-                    # Method 5: Focus and Enter key
-                    lambda: (shift_element.send_keys(""),  # Focus element
-                            time.sleep(0.2),
-                            shift_element.send_keys("\n")),
-                    
-                    # Method 6: Focus and Space key
-                    lambda: (shift_element.send_keys(""),  # Focus element  
-                            time.sleep(0.2),
-                            shift_element.send_keys(" ")),
-                ]
-                
                 click_success = False
-                for i, click_method in enumerate(click_methods):
-                    try:
-                        click_method()
-                        logger.info(f"✅ Clicked shift card using method {i+1}", extra=log_extra)
-                        time.sleep(1.5)  # Wait for selection to take effect and modal to update
-                        
-                        # Check if modal closed or selection was successful
-                        try:
-                            # Try to find the modal again - if it's gone, selection likely succeeded
-                            modal_still_open = self.driver.find_elements(By.CSS_SELECTOR, '[data-test-component="StencilFlyoutBody"]')
-                            if not modal_still_open:
-                                logger.info("✅ Modal closed - shift selection successful", extra=log_extra)
-                                click_success = True
-                                break
-                            else:
-                                logger.debug(f"Modal still open after method {i+1}, trying next method", extra=log_extra)
-                        except Exception:
-                            # If we can't check, assume success and continue
-                            logger.info("✅ Shift selection completed (unable to verify modal state)", extra=log_extra)
-                            click_success = True
-                            break
-                            
-                    except Exception as e:
-                        logger.debug(f"Click method {i+1} failed: {e}", extra=log_extra)
-                        continue
+                if self._click(shift_element):
+                    logger.info("✅ Clicked shift card", extra=log_extra)
+                    # The flyout closes once the selection takes effect
+                    if self._wait_for(EC.invisibility_of_element_located((By.CSS_SELECTOR, FLYOUT_SELECTOR)), timeout=1.5):
+                        logger.info("✅ Modal closed - shift selection successful", extra=log_extra)
+                        click_success = True
                 
                 if not click_success:
-                    logger.warning("⚠️ All shift selection methods completed, proceeding (may have succeeded)", extra=log_extra)
+                    logger.warning("⚠️ Shift selection not confirmed, proceeding (may have succeeded)", extra=log_extra)
                 
                 return True  # Always return True since selection issues aren't critical for booking flow
                     
@@ -624,63 +724,44 @@ class ShiftBooking:
             logger.error(f"Error handling shift selection: {e}", extra=log_extra)
             return False
 
+    @timed('booking.shift_dropdown_fast')
     def _handle_shift_dropdown_fast(self, log_extra: dict) -> bool:
         """Ultra-fast shift dropdown handling for instant booking."""
         try:
-            # Quick check for dropdown - skip if not immediately visible
-            dropdown_selectors = [
-                '.jobDetailScheduleDropdown.hvh-careers-emotion-1uzwmf0',
-                'div:contains("Select one")'
-            ]
-            
-            dropdown_element = None
-            for selector in dropdown_selectors[:1]:  # Only check first selector for speed
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements and elements[0].is_displayed():
-                        dropdown_element = elements[0]
-                        break
-                except Exception:
-                    continue
-            
-            if not dropdown_element:
+            # Open the dropdown and pick the first shift in one round trip
+            result = self.driver.execute_script(
+                FAST_SHIFT_DROPDOWN_JS, self._FAST_DROPDOWN_SELECTOR, self._FAST_SHIFT_LOCATOR[1])
+            if result == 'no_dropdown':
                 logger.debug("⚡ No shift dropdown found in fast mode, skipping", extra=log_extra)
                 return True
             
-            # Quick dropdown click
-            try:
-                dropdown_element.click()
-                time.sleep(0.3)  # Minimal wait
-            except Exception:
-                return False
-            
-            # Quick shift selection - grab first available option
-            shift_selectors = [
-                '[data-test-component="StencilReactCard"][role="button"]',
-                '[data-test-component="StencilFlyoutBody"] [role="button"]'
-            ]
-            
-            for selector in shift_selectors[:1]:  # Only try first selector for speed
-                try:
-                    elements = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    if elements and elements[0].is_displayed():
-                        elements[0].click()
-                        logger.info("⚡ Fast shift selection completed", extra=log_extra)
-                        time.sleep(0.2)  # Minimal wait
-                        return True
-                except Exception:
-                    continue
+            # Cards render after the dropdown opens; give them a moment then click once
+            if result == 'clicked_only':
+                if not self._wait_for(EC.visibility_of_element_located(self._FAST_SHIFT_LOCATOR), timeout=1):
+                    return True  # Return success even if no selection for speed
+                result = 'done' if self.driver.execute_script(JS_CLICK, self._FAST_SHIFT_LOCATOR[1]) else result
             
-            return True  # Return success even if no selection for speed
+            if result == 'done':
+                logger.info("⚡ Fast shift selection completed", extra=log_extra)
+            return True
             
         except Exception as e:
-            logger.debug(f"Fast dropdown handling error: {e}", extra=log_extra)
+            logger.debug("Fast dropdown handling error: %s", e, extra=log_extra)
             return False
     
     def get_booking_summary(self) -> dict:
-        """Get current booking state summary."""
-        return {
-            'daily_count': self.state.daily_count,
-            'booked_today': list(self.state.booked_today),
-            'last_reset_date': self.state.last_reset_date
-        }
\ No newline at end of file
+        """Get current booking state summary.
+        
+        The snapshot is rebuilt only when the state changes; callers get their
+        own dict (and booked_today list) so they can serialise or extend it.
+        """
+        state = self.state
+        key = (state.daily_count, len(state.booked_today), state.last_reset_date)
+        if self._summary_cache is None or self._summary_cache[0] != key:
+            self._summary_cache = (key, MappingProxyType({
+                'daily_count': state.daily_count,
+                'booked_today': tuple(state.booked_today),
+                'last_reset_date': state.last_reset_date
+            }))
+        snapshot = self._summary_cache[1]
+        return dict(snapshot, booked_today=list(snapshot['booked_today']))
\ No newline at end of file
@@ -1,130 +1,191 @@
 # enhanced_shift_filter.py
+import json
+from dataclasses import dataclass
 from seleniumbase import BaseCase
-import time
-from typing import List, Dict, Any
-from selenium.webdriver.common.action_chains import ActionChains
+from typing import Callable, FrozenSet, List, Optional, Tuple
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
+from utils import DATACLASS_SLOTS, timed
 
-class EnhancedShiftFilter:
-    def __init__(self, driver: BaseCase):
-        self.driver = driver
-        self.selectors = {
-            # — Panel structure —
-            'filters_panel': 'div[data-test-id="filters-panel"]',
-            'filters_button': 'button:contains("Filters")',
-            'view_filters_button': 'button:contains("View all filters")',
-            'view_filters_button_alt': 'button.guidedSearchFilterButton',
-            
-            # — Clear / Apply —
-            'clear_filters': 'button[data-test-id="filter-clear-button"]',
-            'apply_filters': 'button[data-test-component="StencilReactButton"]:contains("Show")',
+# Drag rc-slider handles to fractions of the track width with synthetic mouse events.
+# Returns the number of handles moved, or null when the slider is missing.
+_SLIDER_DRAG_JS = """
+const slider = document.querySelector(arguments[0]);
+if (!slider) return null;
+const handles = [...slider.querySelectorAll('.rc-slider-handle')].slice(0, 2);
+// Read all geometry before dispatching anything so no event forces a re-layout
+const track = slider.getBoundingClientRect();
+const rects = handles.map(h => h.getBoundingClientRect());
+const targets = [arguments[1], arguments[2]];
+handles.forEach((h, i) => {
+    const r = rects[i];
+    const y = r.top + r.height / 2;
+    const x = track.left + targets[i] * track.width;
+    h.dispatchEvent(new MouseEvent('mousedown', {bubbles: true, clientX: r.left + r.width / 2, clientY: y}));
+    document.dispatchEvent(new MouseEvent('mousemove', {bubbles: true, clientX: x, clientY: y}));
+    document.dispatchEvent(new MouseEvent('mouseup', {bubbles: true, clientX: x, clientY: y}));
+});
+return handles.length;
+"""
 
-            # — Schedule‑Hours panel structure —
-            'schedule_hours_section': '#filterPanelScheduleHoursSection',
-            'schedule_hours_label': 'label#filter-panel-schedule-hours[data-test-component="StencilLabel"]',
+# Click a select trigger, then poll for the matching <li> option for up to 1.5s
+_SELECT_BY_LABEL_JS = """
+const t = document.querySelector(arguments[0]);
+if (!t) return false;
+t.click();
+const label = arguments[1];
+return new Promise(resolve => {
+    const iv = setInterval(() => {
+        const m = [...document.querySelectorAll('li')].find(o => o.textContent.includes(label));
+        if (m) { clearInterval(iv); m.click(); resolve(true); }
+    }, 30);
+    setTimeout(() => { clearInterval(iv); resolve(false); }, 1500);
+});
+"""
 
-            # — Work‑hours slider & handles —
-            'work_hours_summary': 'div[data-test-id="workHourRangeSelectorSummary"]',
-            'work_hours_slider': '.rc-slider.rc-slider-with-marks.workHourRangeSelector',
-            'slider_handle_min': '.rc-slider-handle[data-index="0"]',
-            'slider_handle_max': '.rc-slider-handle[data-index="1"]',
+# Click every visible, enabled match of each selector; returns the click count
+_CLICK_ALL_JS = """(sels) => {
+    let n = 0;
+    for (const s of sels) {
+        document.querySelectorAll(s).forEach(e => {
+            if (e.offsetParent !== null && !e.disabled) { e.click(); n++; }
+        });
+    }
+    return n;
+}"""
 
-            # — Schedule‑shift buttons —
-            'schedule_early_morning': 'button[data-test-id="filter-schedule-shift-button-EarlyMorning"]',
-            'schedule_day_time': 'button[data-test-id="filter-schedule-shift-button-Daytime"]',
-            'schedule_evening': 'button[data-test-id="filter-schedule-shift-button-Evening"]',
-            'schedule_night': 'button[data-test-id="filter-schedule-shift-button-Night"]',
-            'schedule_weekday': 'button[data-test-id="filter-schedule-shift-button-Weekday"]',
-            'schedule_weekend': 'button[data-test-id="filter-schedule-shift-button-Weekend"]',
+# True once every selector's element reports aria-pressed="true"
+_ALL_PRESSED_JS = """
+return arguments[0].every(s => {
+    const e = document.querySelector(s);
+    return e !== null && e.getAttribute('aria-pressed') === 'true';
+});
+"""
 
-            # — Job Role filters (under "Job Types") —
-            'role_buttons': 'button[data-test-id^="filter-role-button-"]',
-            'role_fulfillment_center': 'button[data-test-id="filter-role-button-Amazon Fulfillment Center Warehouse Associate"]',
-            'role_sortation_center': 'button[data-test-id="filter-role-button-Amazon Sortation Center Warehouse Associate"]',
-            'role_delivery_station': 'button[data-test-id="filter-role-button-Amazon Delivery Station Warehouse Associate"]',
-            'role_distribution_center': 'button[data-test-id="filter-role-button-Amazon Distribution Center Associate"]',
-            'role_grocery': 'button[data-test-id="filter-role-button-Amazon Fresh Warehouse Associate"]',
-            'role_air_hub': 'button[data-test-id="filter-role-button-Amazon Air Hub Associate"]',
-            'role_customer_service': 'button[data-test-id="filter-role-button-Customer Service Associate"]',
+@dataclass(frozen=True, **DATACLASS_SLOTS)
+class Selectors:
+    """CSS selectors for the job-search filters panel."""
+    # — Panel structure —
+    filters_panel: str = 'div[data-test-id="filters-panel"]'
+    filters_button: str = 'button:contains("Filters")'
+    view_filters_button: str = 'button:contains("View all filters")'
+    view_filters_button_alt: str = 'button.guidedSearchFilterButton'
 
-            # — Other filters —
-            'length_of_employment_select': 'div[data-test-component="StencilSelect"][data-test-id="select-test-id-lengthOfEmployment"]',
-            'length_of_employment_trigger': 'button[data-test-component="StencilSelectTrigger"][aria-labelledby*="filter-panel-length-of-employment"]',
+    # — Clear / Apply —
+    clear_filters: str = 'button[data-test-id="filter-clear-button"]'
+    apply_filters: str = 'button[data-test-component="StencilReactButton"]:contains("Show")'
 
-            'language_requirement_select': 'div[data-test-component="StencilSelect"][data-test-id="languageRequirementSelectionButton"]',
-            'language_requirement_trigger': 'button[data-test-component="StencilSelectTrigger"][aria-labelledby*="filter-panel-language-requirements"]',
+    # — Schedule‑Hours panel structure —
+    schedule_hours_section: str = '#filterPanelScheduleHoursSection'
+    schedule_hours_label: str = 'label#filter-panel-schedule-hours[data-test-component="StencilLabel"]'
 
-            'start_date_select': 'div[data-test-component="StencilSelect"][data-test-id="filter-panel-start-date-select"]',
-            'start_date_trigger': 'button[data-test-component="StencilSelectTrigger"][aria-labelledby*="filter-panel-start-date"]',
-            'start_date_input': 'input[data-test-id="filter-panel-start-date-input"]',
-        }
-    
-    def apply_shift_filters(self, work_hours_range: tuple = (0, 40), 
-                           schedule_preferences: List[str] = None,
-                           job_roles: List[str] = None,
-                           length_of_employment: str = None,
-                           language_requirement: str = None,
-                           start_date: str = None) -> bool:
-        """Apply comprehensive shift filtering with proper panel management"""
-        try:
-            # Ensure filters panel is open
-            if not self._ensure_filters_panel_open():
-                return False
-            
-            # Set work hours range using slider
-            if not self._set_work_hours_range(work_hours_range):
-                print("⚠️ Failed to set work hours range")
-            
-            # Apply schedule preferences
-            if schedule_preferences:
-                self._apply_schedule_filters(schedule_preferences)
-            
-            # Apply job role filters
-            if job_roles:
-                self._apply_job_role_filters(job_roles)
-            
-            # Apply additional filters if provided
-            if length_of_employment:
-                self._set_length_of_employment(length_of_employment)
-            
-            if language_requirement:
-                self._set_language_requirement(language_requirement)
-            
-            if start_date:
-                self._set_start_date(start_date)
-            
-            # NOTE: do NOT call _apply_filters() here—we'll apply once commute is set
-            # self._apply_filters()  # REMOVED
-            
-            return True
-        except Exception as e:
-            print(f"Error applying shift filters: {e}")
-            return False
+    # — Work‑hours slider & handles —
+    work_hours_summary: str = 'div[data-test-id="workHourRangeSelectorSummary"]'
+    work_hours_slider: str = '.rc-slider.rc-slider-with-marks.workHourRangeSelector'
+    slider_handle_min: str = '.rc-slider-handle[data-index="0"]'
+    slider_handle_max: str = '.rc-slider-handle[data-index="1"]'
+
+    # — Schedule‑shift buttons —
+    schedule_early_morning: str = 'button[data-test-id="filter-schedule-shift-button-EarlyMorning"]'
+    schedule_day_time: str = 'button[data-test-id="filter-schedule-shift-button-Daytime"]'
+    schedule_evening: str = 'button[data-test-id="filter-schedule-shift-button-Evening"]'
+    schedule_night: str = 'button[data-test-id="filter-schedule-shift-button-Night"]'
+    schedule_weekday: str = 'button[data-test-id="filter-schedule-shift-button-Weekday"]'
+    schedule_weekend: str = 'button[data-test-id="filter-schedule-shift-button-Weekend"]'
+
+    # — Job Role filters (under "Job Types") —
+    role_buttons: str = 'button[data-test-id^="filter-role-button-"]'
+    role_fulfillment_center: str = 'button[data-test-id="filter-role-button-Amazon Fulfillment Center Warehouse Associate"]'
+    role_sortation_center: str = 'button[data-test-id="filter-role-button-Amazon Sortation Center Warehouse Associate"]'
+    role_delivery_station: str = 'button[data-test-id="filter-role-button-Amazon Delivery Station Warehouse Associate"]'
+    role_distribution_center: str = 'button[data-test-id="filter-role-button-Amazon Distribution Center Associate"]'
+    role_grocery: str = 'button[data-test-id="filter-role-button-Amazon Fresh Warehouse Associate"]'
+    role_air_hub: str = 'button[data-test-id="filter-role-button-Amazon Air Hub Associate"]'
+    role_customer_service: str = 'button[data-test-id="filter-role-button-Customer Service Associate"]'
+
+    # — Other filters —
+    length_of_employment_select: str = 'div[data-test-component="StencilSelect"][data-test-id="select-test-id-lengthOfEmployment"]'
+    length_of_employment_trigger: str = 'button[data-test-component="StencilSelectTrigger"][aria-labelledby*="filter-panel-length-of-employment"]'
+
+    language_requirement_select: str = 'div[data-test-component="StencilSelect"][data-test-id="languageRequirementSelectionButton"]'
+    language_requirement_trigger: str = 'button[data-test-component="StencilSelectTrigger"][aria-labelledby*="filter-panel-language-requirements"]'
+
+    start_date_select: str = 'div[data-test-component="StencilSelect"][data-test-id="filter-panel-start-date-select"]'
+    start_date_trigger: str = 'button[data-test-component="StencilSelectTrigger"][aria-labelledby*="filter-panel-start-date"]'
+    start_date_input: str = 'input[data-test-id="filter-panel-start-date-input"]'
+
+    def __getitem__(self, key: str) -> str:
+        return getattr(self, key)
+
+
+SELECTORS = Selectors()
+
+
+# Mapping user preferences to selector keys
+_SCHEDULE_MAPPING = {
+    'early_morning': 'schedule_early_morning',
+    'daytime': 'schedule_day_time',
+    'day_time': 'schedule_day_time',
+    'evening': 'schedule_evening',
+    'night': 'schedule_night',
+    'weekday': 'schedule_weekday',
+    'weekend': 'schedule_weekend'
+}
+_SCHEDULE_SELECTORS = {k: SELECTORS[v] for k, v in _SCHEDULE_MAPPING.items()}
+
+
+def _pref_aliases(key: str) -> set:
+    words = key.split('_')
+    spaced = ' '.join(words)
+    return {key, spaced, spaced.title(), ''.join(w.capitalize() for w in words)}
+
+
+# Every spelling callers use ('early morning', 'Early Morning', 'EarlyMorning', ...) → canonical key
+_PREF_ALIAS = {alias: key for key in _SCHEDULE_MAPPING for alias in _pref_aliases(key)}
+
+
+@dataclass(**DATACLASS_SLOTS)
+class FilterConfig:
+    """Values for each filter; None leaves that filter untouched."""
+    hours: Optional[Tuple[int, int]] = None
+    schedule: Optional[List[str]] = None
+    roles: Optional[List[str]] = None
+    employment: Optional[str] = None
+    language: Optional[str] = None
+    start_date: Optional[str] = None
+
+
+class EnhancedShiftFilter:
+    def __init__(self, driver: BaseCase):
+        self.driver = driver
+        # One short-polling wait shared by every click site instead of fixed sleeps
+        self._wait = WebDriverWait(driver.driver, 3, poll_frequency=0.1)
+        self._panel_open = False
+        self._panel_opener: Optional[str] = None
     
+    @timed('filters.panel_open')
     def _ensure_filters_panel_open(self) -> bool:
         """Ensure the filters panel is open using correct button text"""
+        if self._panel_open:
+            return True
         try:
             # Check if filters panel is already visible
-            if self.driver.is_element_present(self.selectors['filters_panel']):
+            if self.driver.is_element_present(SELECTORS.filters_panel):
                 print("✅ Filters panel already open")
+                self._panel_open = True
                 return True
             
-            # Try to open the filters panel
-            if self.driver.is_element_present(self.selectors['view_filters_button']):
-                self.driver.click(self.selectors['view_filters_button'])
-                time.sleep(2)
-                print("✅ Clicked 'View all filters' button")
-                
-                # Verify the panel opened
-                if self.driver.is_element_present(self.selectors['filters_panel']):
-                    return True
+            # Whichever opener worked last time is tried first
+            openers = ('view_filters_button', 'view_filters_button_alt')
+            if self._panel_opener is not None:
+                openers = (self._panel_opener,) + tuple(k for k in openers if k != self._panel_opener)
             
-            # Try alternative button if first one didn't work
-            if self.driver.is_element_present(self.selectors['view_filters_button_alt']):
-                self.driver.click(self.selectors['view_filters_button_alt'])
-                time.sleep(2)
-                print("✅ Clicked alternative filters button")
-                
-                if self.driver.is_element_present(self.selectors['filters_panel']):
+            for key in openers:
+                if self._click_opener(key) and self._wait_visible(By.CSS_SELECTOR, SELECTORS.filters_panel):
+                    self._panel_open = True
+                    self._panel_opener = key
                     return True
             
             print("❌ Could not open filters panel")
@@ -133,103 +194,184 @@ class EnhancedShiftFilter:
             print(f"Error opening filters panel: {e}")
             return False
     
+    def _click_opener(self, key: str) -> bool:
+        """Click one of the panel opener buttons; False if it isn't on the page"""
+        if key == 'view_filters_button':
+            # :contains selector needs SeleniumBase rather than querySelector
+            if not self.driver.is_element_present(SELECTORS.view_filters_button):
+                return False
+            self.driver.click(SELECTORS.view_filters_button)
+            print("✅ Clicked 'View all filters' button")
+            return True
+        if self._js_click(SELECTORS[key]):
+            print("✅ Clicked alternative filters button")
+            return True
+        return False
+    
+    def reset_panel_state(self) -> None:
+        """Forget the cached panel state; call after navigation or a page reload.
+        
+        The remembered opener is kept, since the page layout doesn't change between loads.
+        """
+        self._panel_open = False
+    
+    def _scoped(self, *keys: str) -> str:
+        """Join parent and child selectors into one descendant selector.
+        
+        Don't look up a parent and then search inside it (find_element on an
+        element): that costs an extra round trip. Resolve the whole path at once.
+        """
+        return ' '.join(SELECTORS[k] for k in keys)
+    
+    def _js_click(self, selector: str) -> bool:
+        """Find and click a CSS selector in one round trip; False if absent"""
+        return bool(self.driver.execute_script(
+            "const e=document.querySelector(arguments[0]); if(e){e.click(); return true} return false",
+            selector))
+    
+    def _js_click_all(self, selectors: List[str]) -> int:
+        """Click every visible, enabled match of each selector in one round trip; returns the click count"""
+        if hasattr(self.driver.driver, 'execute_cdp_cmd'):
+            try:
+                # Runtime.evaluate skips WebDriver's script wrapping on Chromium
+                result = self.driver.driver.execute_cdp_cmd('Runtime.evaluate', {
+                    'expression': f"({_CLICK_ALL_JS})({json.dumps(selectors)})",
+                    'returnByValue': True,
+                })
+            except WebDriverException:
+                result = None  # CDP unavailable; fall through to execute_script
+            if result is not None:
+                # A throw may come after some toggles were clicked; re-running would undo them
+                if 'exceptionDetails' in result:
+                    raise JavascriptException(result['exceptionDetails'].get('text', 'click script failed'))
+                return result['result']['value']
+        return self.driver.execute_script(f"return ({_CLICK_ALL_JS})(arguments[0]);", selectors)
+    
+    def _select_by_label(self, trigger_selector: str, label: str) -> bool:
+        """Open a Stencil select and click the option containing label, all in-browser"""
+        return bool(self.driver.execute_script(_SELECT_BY_LABEL_JS, trigger_selector, label))
+    
+    def _wait_visible(self, by: str, selector: str) -> bool:
+        """Wait until the element is visible; False on timeout"""
+        try:
+            self._wait.until(EC.visibility_of_element_located((by, selector)))
+            return True
+        except TimeoutException:
+            return False
+    
+    @timed('filters.work_hours')
     def _set_work_hours_range(self, hours_range: tuple) -> bool:
-        """Set work hours range using slider handles with drag functionality"""
+        """Set work hours range by dispatching drag events on the slider handles"""
         try:
             min_hours, max_hours = hours_range
+            print(f"🎯 Setting work hours range: {min_hours}-{max_hours}")
             
-            # Check if work hours slider is present
-            if not self.driver.is_element_present(self.selectors['work_hours_slider']):
+            # Positions assume a 0-40 hour range; both handles move in one script
+            moved = self.driver.execute_script(
+                _SLIDER_DRAG_JS, self._scoped('schedule_hours_section', 'work_hours_slider'), min_hours / 40, max_hours / 40)
+            if moved is None:
                 print("⚠️ Work hours slider not found")
                 return False
             
-            print(f"🎯 Setting work hours range: {min_hours}-{max_hours}")
-            
-            # Get slider element for calculations
-            slider = self.driver.find_element(self.selectors['work_hours_slider'])
-            slider_width = slider.size['width']
-            
-            # Calculate positions (assuming 0-40 hour range)
-            min_position = (min_hours / 40) * slider_width
-            max_position = (max_hours / 40) * slider_width
-            
-            # Move minimum handle
-            if self.driver.is_element_present(self.selectors['slider_handle_min']):
-                min_handle = self.driver.find_element(self.selectors['slider_handle_min'])
-                current_min_pos = min_handle.location['x']
-                min_offset = min_position - current_min_pos
-                
-                action_chains = ActionChains(self.driver.driver)
-                action_chains.click_and_hold(min_handle).move_by_offset(min_offset, 0).release().perform()
-                time.sleep(0.5)
+            if moved > 0:
                 print(f"✅ Set minimum hours to {min_hours}")
-            
-            # Move maximum handle
-            if self.driver.is_element_present(self.selectors['slider_handle_max']):
-                max_handle = self.driver.find_element(self.selectors['slider_handle_max'])
-                current_max_pos = max_handle.location['x']
-                max_offset = max_position - current_max_pos
-                
-                action_chains = ActionChains(self.driver.driver)
-                action_chains.click_and_hold(max_handle).move_by_offset(max_offset, 0).release().perform()
-                time.sleep(0.5)
+            if moved > 1:
                 print(f"✅ Set maximum hours to {max_hours}")
-            
             return True
             
         except Exception as e:
             print(f"Error setting work hours range: {e}")
             # Fallback: just log that we found the slider
-            if self.driver.is_element_present(self.selectors['work_hours_slider']):
+            if self.driver.is_element_present(self._scoped('schedule_hours_section', 'work_hours_slider')):
                 print(f"Found work hours slider, attempted to set range: {min_hours}-{max_hours}")
                 return True
             return False
     
+    def _schedule_selectors_for(self, preferences: List[str]) -> List[str]:
+        selectors = []
+        for p in preferences:
+            # Known spellings hit the alias table; anything else gets one normalisation attempt
+            key = _PREF_ALIAS.get(p) or _PREF_ALIAS.get(p.lower().replace(' ', '_'))
+            if key is None:
+                print(f"⚠️ Unknown schedule preference: {p}")
+                continue
+            selectors.append(_SCHEDULE_SELECTORS[key])
+        return selectors
+    
+    def _role_selectors_for(self, job_roles: List[str]) -> List[str]:
+        selectors = []
+        for role in job_roles:
+            if role == 'all':
+                # Prefix selector matches every available role button
+                selectors.append(SELECTORS.role_buttons)
+            elif role in ['fulfillment_center', 'sortation_center', 'delivery_station', 
+                         'distribution_center', 'grocery', 'air_hub', 'customer_service']:
+                selectors.append(SELECTORS[f'role_{role}'])
+            else:
+                print(f"⚠️ Unknown job role: {role}")
+        return selectors
+    
+    def _wait_roles_pressed(self, role_selectors: List[str]) -> None:
+        """One wait for the UI to settle instead of a sleep per click"""
+        named = [sel for sel in role_selectors if sel != SELECTORS.role_buttons]
+        if not named:
+            return
+        try:
+            self._wait.until(lambda d: d.execute_script(_ALL_PRESSED_JS, named))
+        except TimeoutException:
+            print("⚠️ Job role buttons did not report pressed state")
+    
+    @timed('filters.schedule')
     def _apply_schedule_filters(self, preferences: List[str]) -> bool:
         """Apply schedule preference filters using exact selectors"""
         try:
-            # Mapping user preferences to selector keys
-            schedule_mapping = {
-                'early_morning': 'schedule_early_morning',
-                'daytime': 'schedule_day_time',
-                'day_time': 'schedule_day_time',
-                'evening': 'schedule_evening',
-                'night': 'schedule_night',
-                'weekday': 'schedule_weekday',
-                'weekend': 'schedule_weekend'
-            }
-            
-            for preference in preferences:
-                pref_key = preference.lower().replace(' ', '_')
-                if pref_key in schedule_mapping:
-                    selector_key = schedule_mapping[pref_key]
-                    selector = self.selectors[selector_key]
-                    
-                    if self.driver.is_element_present(selector):
-                        self.driver.click(selector)
-                        print(f"✅ Applied {preference} filter")
-                        time.sleep(0.5)
-                    else:
-                        print(f"⚠️ Could not find {preference} filter button")
+            selectors = self._schedule_selectors_for(preferences)
+            clicked = self._js_click_all(selectors) if selectors else 0
+            if clicked < len(selectors):
+                print(f"⚠️ Only found {clicked} of {len(selectors)} schedule filter buttons")
+            else:
+                print(f"✅ Applied {clicked} schedule filter(s)")
             
             return True
         except Exception as e:
             print(f"Error applying schedule filters: {e}")
             return False
     
+    @timed('filters.roles')
+    def _apply_job_role_filters(self, job_roles: List[str]) -> bool:
+        """Apply job role filters from the Job Types section"""
+        try:
+            selectors = self._role_selectors_for(job_roles)
+            if selectors:
+                clicked = self._js_click_all(selectors)
+                print(f"✅ Selected {clicked} job role button(s)")
+                self._wait_roles_pressed(selectors)
+            return True
+        except Exception as e:
+            print(f"Error applying job role filters: {e}")
+            return False
+    
+    @timed('filters.schedule_and_roles')
+    def _apply_schedule_and_role_filters(self, preferences: List[str], job_roles: List[str]) -> bool:
+        """Click schedule and role buttons together; neither depends on the other"""
+        try:
+            role_selectors = self._role_selectors_for(job_roles)
+            selectors = self._schedule_selectors_for(preferences) + role_selectors
+            if selectors:
+                clicked = self._js_click_all(selectors)
+                print(f"✅ Applied {clicked} schedule/role filter button(s)")
+                self._wait_roles_pressed(role_selectors)
+            return True
+        except Exception as e:
+            print(f"Error applying schedule and role filters: {e}")
+            return False
+    
     def _set_length_of_employment(self, employment_length: str) -> bool:
         """Set length of employment filter"""
         try:
-            if self.driver.is_element_present(self.selectors['length_of_employment_trigger']):
-                self.driver.click(self.selectors['length_of_employment_trigger'])
-                time.sleep(1)
-                
-                # Look for the specific option
-                option_selector = f"li:contains('{employment_length}')"
-                if self.driver.is_element_present(option_selector):
-                    self.driver.click(option_selector)
-                    print(f"✅ Set length of employment to {employment_length}")
-                    return True
+            if self._select_by_label(SELECTORS.length_of_employment_trigger, employment_length):
+                print(f"✅ Set length of employment to {employment_length}")
+                return True
                     
             print(f"⚠️ Could not set length of employment to {employment_length}")
             return False
@@ -240,16 +382,9 @@ class EnhancedShiftFilter:
     def _set_language_requirement(self, language: str) -> bool:
         """Set language requirement filter"""
         try:
-            if self.driver.is_element_present(self.selectors['language_requirement_trigger']):
-                self.driver.click(self.selectors['language_requirement_trigger'])
-                time.sleep(1)
-                
-                # Look for the specific language option
-                option_selector = f"li:contains('{language}')"
-                if self.driver.is_element_present(option_selector):
-                    self.driver.click(option_selector)
-                    print(f"✅ Set language requirement to {language}")
-                    return True
+            if self._select_by_label(SELECTORS.language_requirement_trigger, language):
+                print(f"✅ Set language requirement to {language}")
+                return True
                     
             print(f"⚠️ Could not set language requirement to {language}")
             return False
@@ -260,16 +395,9 @@ class EnhancedShiftFilter:
     def _set_start_date(self, start_date: str) -> bool:
         """Set start date filter"""
         try:
-            if self.driver.is_element_present(self.selectors['start_date_trigger']):
-                self.driver.click(self.selectors['start_date_trigger'])
-                time.sleep(1)
-                
-                # Look for the specific date option
-                option_selector = f"li:contains('{start_date}')"
-                if self.driver.is_element_present(option_selector):
-                    self.driver.click(option_selector)
-                    print(f"✅ Set start date to {start_date}")
-                    return True
+            if self._select_by_label(SELECTORS.start_date_trigger, start_date):
+                print(f"✅ Set start date to {start_date}")
+                return True
                     
             print(f"⚠️ Could not set start date to {start_date}")
             return False
@@ -277,107 +405,45 @@ class EnhancedShiftFilter:
             print(f"Error setting start date: {e}")
             return False
     
-    def _apply_filters(self) -> bool:
-        """Apply the selected filters by clicking the Show Results button"""
-        # NOTE: we no longer auto‑apply "Show Results" here.
-        # The outer monitor will click "Apply" once ALL filters (including commute) are set.
-        print("✅ Filters configured (not applied yet)")
-        return True
-        try:
-            if self.driver.is_element_present(self.selectors['apply_filters']):
-                self.driver.click(self.selectors['apply_filters'])
-                time.sleep(3)  # Wait for results to refresh
-                print("✅ Applied filters successfully")
-                return True
-            else:
-                print("⚠️ Could not find Apply Filters button")
-                return False
-        except Exception as e:
-            print(f"Error applying filters: {e}")
-            return False
-    
-    def clear_all_filters(self) -> bool:
-        """Clear all applied filters"""
-        try:
-            if self.driver.is_element_present(self.selectors['clear_filters']):
-                self.driver.click(self.selectors['clear_filters'])
-                time.sleep(2)
-                print("✅ Cleared all filters")
-                return True
-            else:
-                print("⚠️ Could not find Clear Filters button")
-                return False
-        except Exception as e:
-            print(f"Error clearing filters: {e}")
-            return False
-    
-    def _apply_job_role_filters(self, job_roles: List[str]) -> bool:
-        """Apply job role filters from the Job Types section"""
-        try:
-            for role in job_roles:
-                if role == 'all':
-                    # Click all available role buttons
-                    role_buttons = self.driver.find_elements(self.selectors['role_buttons'])
-                    for btn in role_buttons:
-                        if btn.is_displayed() and btn.is_enabled():
-                            btn.click()
-                            time.sleep(0.5)
-                    print(f"✅ Selected all available job roles ({len(role_buttons)} roles)")
-                elif role in ['fulfillment_center', 'sortation_center', 'delivery_station', 
-                             'distribution_center', 'grocery', 'air_hub', 'customer_service']:
-                    selector_key = f'role_{role}'
-                    if selector_key in self.selectors:
-                        if self.driver.is_element_present(self.selectors[selector_key]):
-                            self.driver.click(self.selectors[selector_key])
-                            time.sleep(0.5)
-                            print(f"✅ Selected job role: {role}")
-                        else:
-                            print(f"⚠️ Job role button not found: {role}")
-                else:
-                    print(f"⚠️ Unknown job role: {role}")
-            return True
-        except Exception as e:
-            print(f"Error applying job role filters: {e}")
-            return False
+    # Filter key → setter, in the order filters are applied
+    _DISPATCH: Tuple[Tuple[str, Callable], ...] = (
+        ('hours', _set_work_hours_range),
+        ('schedule', _apply_schedule_filters),
+        ('roles', _apply_job_role_filters),
+        ('employment', _set_length_of_employment),
+        ('language', _set_language_requirement),
+        ('start_date', _set_start_date),
+    )
+    _DISPATCH_BY_KEY = dict(_DISPATCH)
     
-    # Map "short names" to the methods that set them
-    _FILTER_DISPATCH = {
-        'hours': '_set_work_hours_range',
-        'schedule': '_apply_schedule_filters', 
-        'roles': '_apply_job_role_filters',
-        'employment': '_set_length_of_employment',
-        'language': '_set_language_requirement',
-        'start_date': '_set_start_date',
-    }
-    
-    def apply_shift_filters(self, cfg: Dict[str, Any], which: List[str]) -> bool:
-        """
-        cfg: { 'hours':(min,max), 'schedule':[…], … }
-        which: subset of keys you actually want to run today.
-        """
-        if not self._ensure_filters_panel_open():
-            return False
-
-        for key in which:
-            if key not in self._FILTER_DISPATCH:
-                print(f"⚠️ Unknown filter '{key}'")
-                continue
-
-            method = getattr(self, self._FILTER_DISPATCH[key])
-            val = cfg.get(key)
+    def apply_shift_filters(self, cfg: FilterConfig,
+                            which: FrozenSet[str] = frozenset({'hours', 'schedule', 'roles'})) -> bool:
+        """Apply the filters named in ``which`` using the values from ``cfg``"""
+        unknown = frozenset(which).difference(self._DISPATCH_BY_KEY)
+        if unknown:
+            print(f"⚠️ Unknown filter(s): {', '.join(sorted(unknown))}")
+        
+        # Resolve everything before touching the browser
+        steps = [(key, setter, getattr(cfg, key)) for key, setter in self._DISPATCH if key in which]
+        for key, _, val in steps:
             if val is None:
                 print(f"⚠️ No value for {key}, skipping")
+        steps = [step for step in steps if step[2] is not None]
+        
+        if not self._ensure_filters_panel_open():
+            return False
+        
+        # Schedule and role clicks share one browser turn when both are requested
+        batch = {'schedule', 'roles'} <= {key for key, _, _ in steps}
+        for key, setter, val in steps:
+            if batch and key == 'roles':
                 continue
-
-            # tuple/list → unpack, scalar → pass directly
-            if isinstance(val, (list, tuple)):
-                method(val)
+            if batch and key == 'schedule':
+                self._apply_schedule_and_role_filters(cfg.schedule, cfg.roles)
             else:
-                method(val)
-
+                setter(self, val)
             print(f"✅ Done {key}")
-            time.sleep(0.5)
-
+        
         return True
     
     # Alternative: **kwargs-based approach
@@ -391,24 +457,17 @@ class EnhancedShiftFilter:
             return False
 
         for key, val in filters.items():
-            # Map some keys to their actual method names
-            method_mapping = {
-                'hours': '_set_work_hours_range',
-                'schedule': '_apply_schedule_filters',
-                'roles': '_apply_job_role_filters',
-                'employment': '_set_length_of_employment',
-                'language': '_set_language_requirement',
-                'start_date': '_set_start_date'
-            }
-            
-            method_name = method_mapping.get(key, f"_set_{key}")
-            if not hasattr(self, method_name):
+            # Known keys go through the dispatch table
+            setter = self._DISPATCH_BY_KEY.get(key)
+            if setter is not None:
+                setter(self, val)
+            elif hasattr(self, f"_set_{key}"):
+                getattr(self, f"_set_{key}")(val)
+            else:
                 print(f"⚠️ No handler for {key}")
                 continue
 
-            getattr(self, method_name)(val)
             print(f"✅ {key} applied")
-            time.sleep(0.5)
 
         return True
     
@@ -418,25 +477,19 @@ class EnhancedShiftFilter:
         # The outer monitor will click "Apply" once ALL filters (including commute) are set.
         print("✅ Filters configured (not applied yet)")
         return True
-        try:
-            if self.driver.is_element_present(self.selectors['apply_filters']):
-                self.driver.click(self.selectors['apply_filters'])
-                time.sleep(3)  # Wait for results to refresh
-                print("✅ Applied filters successfully")
-                return True
-            else:
-                print("⚠️ Could not find Apply Filters button")
-                return False
-        except Exception as e:
-            print(f"Error applying filters: {e}")
-            return False
     
     def clear_all_filters(self) -> bool:
         """Clear all applied filters"""
         try:
-            if self.driver.is_element_present(self.selectors['clear_filters']):
-                self.driver.click(self.selectors['clear_filters'])
-                time.sleep(2)
+            if self.driver.is_element_present(SELECTORS.clear_filters):
+                self.driver.click(SELECTORS.clear_filters)
+                try:
+                    self._wait.until(EC.invisibility_of_element_located(
+                        (By.CSS_SELECTOR, 'button[data-test-id^="filter-"][aria-pressed="true"]')))
+                except TimeoutException:
+                    pass
+                # Clearing can collapse the panel, so probe again next time
+                self._panel_open = False
                 print("✅ Cleared all filters")
                 return True
             else:
@@ -445,32 +498,3 @@ class EnhancedShiftFilter:
         except Exception as e:
             print(f"Error clearing filters: {e}")
             return False
-    
-    def _apply_job_role_filters(self, job_roles: List[str]) -> bool:
-        """Apply job role filters from the Job Types section"""
-        try:
-            for role in job_roles:
-                if role == 'all':
-                    # Click all available role buttons
-                    role_buttons = self.driver.find_elements(self.selectors['role_buttons'])
-                    for btn in role_buttons:
-                        if btn.is_displayed() and btn.is_enabled():
-                            btn.click()
-                            time.sleep(0.5)
-                    print(f"✅ Selected all available job roles ({len(role_buttons)} roles)")
-                elif role in ['fulfillment_center', 'sortation_center', 'delivery_station', 
-                             'distribution_center', 'grocery', 'air_hub', 'customer_service']:
-                    selector_key = f'role_{role}'
-                    if selector_key in self.selectors:
-                        if self.driver.is_element_present(self.selectors[selector_key]):
-                            self.driver.click(self.selectors[selector_key])
-                            time.sleep(0.5)
-                            print(f"✅ Selected job role: {role}")
-                        else:
-                            print(f"⚠️ Job role button not found: {role}")
-                else:
-                    print(f"⚠️ Unknown job role: {role}")
-            return True
-        except Exception as e:
-            print(f"Error applying job role filters: {e}")
-            return False
\ No newline at end of file
@@ -1,20 +1,264 @@
+import json
 import logging
+import queue
+import random
+import threading
 import time
+from enum import Enum
+from types import MappingProxyType
 from typing import List, Dict, Any, Optional
 from datetime import datetime
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
+from utils.selenium_helpers import batch_visible
 
 logger = logging.getLogger(__name__)
 
+_CARD_SELECTORS = (
+    'div[data-test-id="JobCard"]',
+    '[data-test-component="StencilReactCard"][data-test-id="JobCard"]',
+    '.jobCardItem',
+    '[role="link"][data-test-id="JobCard"]',
+    'div.pointer.focusableItem.jobCardItem',
+)
+
+# First card whose text contains the title (case-insensitive), else the first card
+_PICK_CARD_JS = """
+const els = document.querySelectorAll(arguments[0]);
+const t = arguments[1].toLowerCase();
+if (t) {
+    for (const e of els) if (e.innerText.toLowerCase().includes(t)) return e;
+}
+return els.length ? els[0] : null;
+"""
+
+# Viewport centre of the element after scrolling it into view, for CDP mouse events
+_CENTER_JS = """
+const e = arguments[0];
+e.scrollIntoView({block: 'center'});
+const r = e.getBoundingClientRect();
+return [r.left + r.width / 2, r.top + r.height / 2];
+"""
+
+def _cdp_click(driver, element):
+    """Press and release the left button at the element's centre via raw CDP input events"""
+    x, y = driver.execute_script(_CENTER_JS, element)
+    for event in ('mousePressed', 'mouseReleased'):
+        driver.execute_cdp_cmd('Input.dispatchMouseEvent', {
+            'type': event, 'x': x, 'y': y, 'button': 'left', 'clickCount': 1})
+
+# Click strategies in the order they're tried; each takes (driver, element)
+_CLICK_STRATEGIES = {
+    'direct_click': lambda driver, element: element.click(),
+    'javascript_click': lambda driver, element: driver.execute_script("arguments[0].click();", element),
+    'action_chains_click': lambda driver, element: ActionChains(driver).move_to_element(element).click().perform(),
+    'cdp_click': _cdp_click,
+}
+
+# (by, selector) pairs probed together via batch_visible
+_DROPDOWN_LOCATORS = (
+    (By.CSS_SELECTOR, '.jobDetailScheduleDropdown'),
+    (By.XPATH, '//div[text()[contains(., "Select one")]]'),
+    (By.CSS_SELECTOR, '[data-test-component="StencilReactSelect"]'),
+)
+
+_OPTION_LOCATORS = (
+    (By.CSS_SELECTOR, '[data-test-component="StencilReactCard"][role="button"]'),
+    (By.XPATH, '//*[@role="button"][contains(., "shift")]'),
+    (By.CSS_SELECTOR, '.dropdown-option'),
+)
+
+_APPLY_SELECTORS = (
+    'button[data-test-id="jobDetailApplyButtonDesktop"]',
+    '[data-test-id*="apply"]',
+    'button.apply-button',
+    '.apply-btn',
+)
+
+# First visible, enabled apply button: the selectors in order, then any button reading "Apply"
+_FIRST_APPLY_JS = """
+const ok = e => !e.disabled && e.offsetParent !== null && getComputedStyle(e).visibility !== 'hidden';
+const pick = e => { e.scrollIntoView({block: 'center'}); return e; };
+for (const s of arguments[0]) {
+    for (const e of document.querySelectorAll(s)) if (ok(e)) return pick(e);
+}
+for (const e of document.querySelectorAll('button')) if (e.textContent.includes('Apply') && ok(e)) return pick(e);
+return null;
+"""
+
+# Application flow buttons, in the order they're tried
+_FLOW_BUTTON_TEXTS = (
+    "Next",
+    "Continue",
+    "Create Application",
+    "Submit",
+    "Confirm",
+    "Apply Now",
+)
+
+_SUCCESS_INDICATORS = (
+    (By.XPATH, '//div[text()[contains(., "Application submitted")]]'),
+    (By.XPATH, '//div[text()[contains(., "Thank you")]]'),
+    (By.XPATH, '//div[text()[contains(., "Success")]]'),
+    (By.XPATH, '//div[text()[contains(., "Confirmation")]]'),
+    (By.CSS_SELECTOR, '.success-message'),
+    (By.CSS_SELECTOR, '.confirmation-message'),
+)
+
+_COMPLETION_URL_PATTERNS = (
+    'confirmation',
+    'success',
+    'thank-you',
+    'application-complete',
+)
+
+# Clicks the first visible flow button, or resolves 'done' once the page shows success.
+# When neither is there yet a MutationObserver waits for the DOM to change instead of
+# polling; resolves '' after o.timeout ms. After a click it waits for the next render.
+_FLOW_STEP_JS = """(o) => {
+    const visible = e => !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length);
+    const first = (by, sel) => by === 'xpath'
+        ? document.evaluate(sel, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+        : document.querySelector(sel);
+    const done = () => o.urls.some(p => location.href.toLowerCase().includes(p))
+        || o.success.some(([by, sel]) => { const e = first(by, sel); return e && visible(e); });
+    const button = t => {
+        const ok = e => visible(e) && !e.disabled;
+        return [...document.querySelectorAll('button')].find(b => b.textContent.includes(t) && ok(b))
+            || [...document.querySelectorAll(`[data-test-id*="${t.toLowerCase()}"]`)].find(ok);
+    };
+    const settle = ms => new Promise(resolve => {
+        const obs = new MutationObserver(() => { obs.disconnect(); resolve(); });
+        obs.observe(document.body, {childList: true, subtree: true});
+        setTimeout(() => { obs.disconnect(); resolve(); }, ms);
+    });
+    const step = () => {
+        if (done()) return 'done';
+        for (const t of o.texts) {
+            const e = button(t);
+            if (e) { e.click(); return t; }
+        }
+        return null;
+    };
+    return new Promise(resolve => {
+        const now = step();
+        if (now) return now === 'done' ? resolve(now) : settle(o.timeout).then(() => resolve(now));
+        const obs = new MutationObserver(() => {
+            const r = step();
+            if (!r) return;
+            obs.disconnect();
+            clearTimeout(timer);
+            r === 'done' ? resolve(r) : settle(o.timeout).then(() => resolve(r));
+        });
+        const timer = setTimeout(() => { obs.disconnect(); resolve(''); }, o.timeout);
+        obs.observe(document.documentElement, {childList: true, subtree: true, attributes: true});
+    });
+}"""
+
+# CDP errors meaning the page went away mid-script, i.e. the step already ran
+_CONTEXT_LOST_ERRORS = (
+    'Execution context was destroyed',
+    'Cannot find context with specified id',
+    'Inspected target navigated or closed',
+)
+
+_FLOW_STEP_ARGS = json.dumps({
+    'texts': _FLOW_BUTTON_TEXTS,
+    'urls': _COMPLETION_URL_PATTERNS,
+    'success': _SUCCESS_INDICATORS,
+    'timeout': 2000,
+})
+
+# Success indicators and URL patterns in one pass; returns whichever matched first, else null
+_COMPLETION_JS = """
+const visible = e => !!(e.offsetWidth || e.offsetHeight || e.getClientRects().length);
+for (const [by, sel] of arguments[0]) {
+    const e = by === 'xpath'
+        ? document.evaluate(sel, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+        : document.querySelector(sel);
+    if (e && visible(e)) return sel;
+}
+const u = location.href.toLowerCase();
+for (const p of arguments[1]) if (u.includes(p)) return p;
+return null;
+"""
+
+_COMPLETION_ARGS = ([list(loc) for loc in _SUCCESS_INDICATORS], list(_COMPLETION_URL_PATTERNS))
+
+class PollStrategy(Enum):
+    """Sleep schedule for _adaptive_wait; the last step repeats until the deadline"""
+    ADAPTIVE = (0.1, 0.1, 0.1, 0.2, 0.5, 1.0, 2.0)  # quick checks first, then back off
+    FIXED = (2.0,)
+
+# Recovery back-off base per attempt: 1, 2, 4, 8, then 10s; jittered delays stay under the cap too
+_BACKOFF_CAP = 10
+_BACKOFF = tuple(min(1 << i, _BACKOFF_CAP) for i in range(32))
+
+# One notifier thread per process, however many services the monitor builds.
+# Items are (notifier, kind, payload); _STOP_NOTIFIER ends the worker once
+# everything queued before it has been sent.
+_notify_queue: "queue.Queue" = queue.Queue()
+_notify_worker: Optional[threading.Thread] = None
+_notify_lock = threading.Lock()
+_STOP_NOTIFIER = object()
+
+def _notifier_worker():
+    """Drain queued notifications; failures are logged and never reach the booking path"""
+    while True:
+        item = _notify_queue.get()
+        try:
+            if item is _STOP_NOTIFIER:
+                return
+            notifier, kind, payload = item
+            if kind == 'attempt':
+                notifier.notify_instant_booking_attempt(payload)
+            elif kind == 'success':
+                notifier.notify_instant_booking_success(**payload)
+            else:
+                notifier.send(payload, urgent=True)
+        except Exception as e:
+            logger.warning(f"⚠️ {kind.capitalize()} notification failed: {e}")
+        finally:
+            _notify_queue.task_done()
+
+def _queue_notification(notifier, kind: str, payload):
+    """Hand a notification to the shared worker, starting it on first use"""
+    global _notify_worker
+    with _notify_lock:
+        if _notify_worker is None:
+            _notify_worker = threading.Thread(target=_notifier_worker, name="booking-notifier", daemon=True)
+            _notify_worker.start()
+        _notify_queue.put((notifier, kind, payload))
+
+def flush_notifications(timeout: Optional[float] = None):
+    """Send every queued notification, then stop the worker (call on shutdown)"""
+    global _notify_worker
+    with _notify_lock:
+        worker, _notify_worker = _notify_worker, None
+        if worker is None:
+            return
+        _notify_queue.put(_STOP_NOTIFIER)
+    worker.join(timeout)
+    if worker.is_alive():
+        logger.warning("⚠️ Booking notifications still pending at shutdown")
+
 class BulletproofBookingService:
     """Ultra-robust booking service with comprehensive error handling and retry mechanisms"""
     
     def __init__(self, driver, notifier=None):
-        self.driver = driver
+        # Accept a SeleniumBase BaseCase too; everything below speaks raw WebDriver
+        self.driver = getattr(driver, 'driver', driver)
         self.notifier = notifier
         self.max_booking_retries = 5
         self.max_click_retries = 3
         self.booking_success_count = 0
         self.booking_failure_count = 0
+        self._stats_cache = None
+        self.poll_strategy = PollStrategy.ADAPTIVE
+        # Notifications go out on the shared background thread so Discord never delays a booking
         
     def attempt_bulletproof_booking(self, job_data: Dict[str, Any], correlation_id: str) -> bool:
         """Attempt booking with comprehensive error handling and multiple strategies"""
@@ -26,10 +270,7 @@ class BulletproofBookingService:
         
         # Send booking attempt notification
         if self.notifier:
-            try:
-                self.notifier.notify_instant_booking_attempt(job_data)
-            except Exception as e:
-                logger.warning(f"⚠️ Booking attempt notification failed: {e}")
+            _queue_notification(self.notifier, 'attempt', job_data)
         
         for attempt in range(self.max_booking_retries):
             try:
@@ -67,27 +308,25 @@ class BulletproofBookingService:
                 
                 # Success!
                 self.booking_success_count += 1
+                self._stats_cache = None
                 logger.info(f"🎉 BULLETPROOF BOOKING SUCCESS! {job_title} at {job_location}")
                 
                 # Send success notification
                 if self.notifier:
-                    try:
-                        booking_details = {
-                            'title': job_title,
-                            'location': job_location,
-                            'schedule': job_data.get('schedule', 'TBD'),
-                            'pay_rate': job_data.get('pay_rate', 'TBD'),
-                            'discovered_at': datetime.now().strftime('%H:%M:%S'),
-                            'booking_id': correlation_id,
-                            'attempt_number': attempt + 1
-                        }
-                        self.notifier.notify_instant_booking_success(
-                            shift_number=self.booking_success_count,
-                            **booking_details,
-                            correlation_id=correlation_id
-                        )
-                    except Exception as e:
-                        logger.warning(f"⚠️ Success notification failed: {e}")
+                    booking_details = {
+                        'title': job_title,
+                        'location': job_location,
+                        'schedule': job_data.get('schedule', 'TBD'),
+                        'pay_rate': job_data.get('pay_rate', 'TBD'),
+                        'discovered_at': datetime.now().strftime('%H:%M:%S'),
+                        'booking_id': correlation_id,
+                        'attempt_number': attempt + 1
+                    }
+                    _queue_notification(self.notifier, 'success', dict(
+                        shift_number=self.booking_success_count,
+                        **booking_details,
+                        correlation_id=correlation_id
+                    ))
                 
                 return True
                 
@@ -99,64 +338,29 @@ class BulletproofBookingService:
         
         # All attempts failed
         self.booking_failure_count += 1
+        self._stats_cache = None
         logger.error(f"❌ BOOKING FAILED after {self.max_booking_retries} attempts: {job_title}")
         
         # Send failure notification
         if self.notifier:
-            try:
-                failure_message = f"❌ **BOOKING FAILED**\n🎯 Job: {job_title}\n📍 Location: {job_location}\n🔄 Attempts: {self.max_booking_retries}\n⏰ Time: {datetime.now().strftime('%H:%M:%S')}"
-                self.notifier.send(failure_message, urgent=True)
-            except Exception as e:
-                logger.warning(f"⚠️ Failure notification failed: {e}")
+            failure_message = f"❌ **BOOKING FAILED**\n🎯 Job: {job_title}\n📍 Location: {job_location}\n🔄 Attempts: {self.max_booking_retries}\n⏰ Time: {datetime.now().strftime('%H:%M:%S')}"
+            _queue_notification(self.notifier, 'failure', failure_message)
         
         return False
     
     def _click_job_card_bulletproof(self, job_data: Dict[str, Any], base_attempt: int) -> bool:
         """Click job card with multiple strategies and fallbacks"""
         
-        # Multiple selector strategies
-        card_selectors = [
-            'div[data-test-id="JobCard"]',
-            '[data-test-component="StencilReactCard"][data-test-id="JobCard"]',
-            '.jobCardItem',
-            '[role="link"][data-test-id="JobCard"]',
-            'div.pointer.focusableItem.jobCardItem'
-        ]
-        
-        click_strategies = [
-            'direct_click',
-            'javascript_click', 
-            'action_chains_click',
-            'coordinate_click'
-        ]
-        
-        for selector in card_selectors:
+        job_title = job_data.get('title', '')
+        for selector in _CARD_SELECTORS:
             try:
-                elements = self.driver.find_elements('css selector', selector)
-                if not elements:
-                    continue
-                
-                logger.debug(f"🔍 Found {len(elements)} job cards with selector: {selector}")
-                
-                # Try to find the specific job card
-                target_element = None
-                for element in elements:
-                    try:
-                        element_text = element.text.lower()
-                        job_title = job_data.get('title', '').lower()
-                        if job_title and job_title in element_text:
-                            target_element = element
-                            break
-                    except:
-                        continue
-                
-                # If specific job not found, use first available
-                if not target_element and elements:
-                    target_element = elements[0]
+                # Match the title in-browser; falls back to the first card, None if there are none
+                target_element = self.driver.execute_script(_PICK_CARD_JS, selector, job_title)
                 
                 if target_element:
+                    logger.debug(f"🔍 Picked job card with selector: {selector}")
                     # Try different click strategies
-                    for strategy in click_strategies:
+                    for strategy in _CLICK_STRATEGIES:
                         try:
                             success = self._execute_click_strategy(target_element, strategy)
                             if success:
@@ -175,247 +379,160 @@ class BulletproofBookingService:
     def _execute_click_strategy(self, element, strategy: str) -> bool:
         """Execute specific click strategy"""
         try:
-            if strategy == 'direct_click':
-                element.click()
-                time.sleep(1)
-                return True
-                
-            elif strategy == 'javascript_click':
-                self.driver.execute_script("arguments[0].click();", element)
-                time.sleep(1)
-                return True
-                
-            elif strategy == 'action_chains_click':
-                from selenium.webdriver.common.action_chains import ActionChains
-                ActionChains(self.driver).move_to_element(element).click().perform()
-                time.sleep(1)
-                return True
-                
-            elif strategy == 'coordinate_click':
-                from selenium.webdriver.common.action_chains import ActionChains
-                ActionChains(self.driver).move_to_element(element).click().perform()
-                time.sleep(1)
-                return True
-                
+            current_url = self.driver.current_url
+            _CLICK_STRATEGIES[strategy](self.driver, element)
+            # Move on as soon as the card is replaced or the route changes
+            self._wait_for(EC.any_of(EC.staleness_of(element), EC.url_changes(current_url)))
+            return True
         except Exception as e:
             logger.debug(f"❌ Click strategy {strategy} failed: {e}")
             return False
-        
-        return False
     
     def _handle_booking_modals_bulletproof(self):
         """Handle any modals, dropdowns, or overlays that might appear"""
         try:
-            # Wait for page to stabilize
-            time.sleep(1)
+            # Wait for the job detail to render (dropdown or apply button)
+            self._wait_for(EC.any_of(
+                EC.presence_of_element_located((By.CSS_SELECTOR, '.jobDetailScheduleDropdown')),
+                EC.presence_of_element_located((By.CSS_SELECTOR, _APPLY_SELECTORS[0])),
+            ))
             
             # Check for and handle shift selection dropdown
-            dropdown_selectors = [
-                '.jobDetailScheduleDropdown',
-                'div:contains("Select one")',
-                '[data-test-component="StencilReactSelect"]'
-            ]
-            
-            for selector in dropdown_selectors:
-                try:
-                    elements = self.driver.find_elements('css selector', selector)
-                    if elements and elements[0].is_displayed():
-                        logger.info("🔧 Handling shift selection dropdown")
-                        elements[0].click()
-                        time.sleep(0.5)
-                        
-                        # Select first available option
-                        option_selectors = [
-                            '[data-test-component="StencilReactCard"][role="button"]',
-                            '[role="button"]:contains("shift")',
-                            '.dropdown-option'
-                        ]
-                        
-                        for option_selector in option_selectors:
-                            try:
-                                options = self.driver.find_elements('css selector', option_selector)
-                                if options and options[0].is_displayed():
-                                    options[0].click()
-                                    logger.info("✅ Shift selection completed")
-                                    time.sleep(0.5)
-                                    break
-                            except:
-                                continue
-                        break
-                except:
-                    continue
+            dropdown = self._first_visible(_DROPDOWN_LOCATORS)
+            if dropdown is not None:
+                logger.info("🔧 Handling shift selection dropdown")
+                dropdown.click()
+                self._wait_for(EC.visibility_of_element_located((By.CSS_SELECTOR, _OPTION_LOCATORS[0][1])), timeout=1)
+                
+                # Select first available option
+                option = self._first_visible(_OPTION_LOCATORS)
+                if option is not None:
+                    option.click()
+                    logger.info("✅ Shift selection completed")
                     
         except Exception as e:
             logger.debug(f"⚠️ Modal handling error (non-critical): {e}")
     
+    def _wait_for(self, condition, timeout: float = 3) -> bool:
+        """Poll a WebDriverWait condition; False on timeout instead of raising"""
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(condition)
+            return True
+        except TimeoutException:
+            return False
+    
+    def _first_visible(self, locators):
+        """First element whose locator has a visible match, probing all locators in one round trip"""
+        for (by, selector), found in zip(locators, batch_visible(self.driver, locators)):
+            if found:
+                return self.driver.find_element(by, selector)
+        return None
+    
     def _click_apply_button_bulletproof(self, base_attempt: int) -> bool:
         """Click apply button with multiple strategies"""
         
-        apply_selectors = [
-            'button[data-test-id="jobDetailApplyButtonDesktop"]',
-            'button:contains("Apply")',
-            '[data-test-id*="apply"]',
-            'button.apply-button',
-            '.apply-btn'
-        ]
-        
         for attempt in range(self.max_click_retries):
-            for selector in apply_selectors:
-                try:
-                    elements = self.driver.find_elements('css selector', selector)
-                    if elements:
-                        for element in elements:
-                            if element.is_displayed() and element.is_enabled():
-                                # Try multiple click strategies
-                                for strategy in ['direct_click', 'javascript_click']:
-                                    try:
-                                        if strategy == 'direct_click':
-                                            element.click()
-                                        else:
-                                            self.driver.execute_script("arguments[0].click();", element)
-                                        
-                                        logger.info(f"✅ Apply button clicked using {strategy}")
-                                        time.sleep(2)
-                                        return True
-                                    except:
-                                        continue
-                except:
-                    continue
+            try:
+                element = self.driver.execute_script(_FIRST_APPLY_JS, list(_APPLY_SELECTORS))
+                if element is not None:
+                    for strategy in ('direct_click', 'javascript_click'):
+                        # The application flow opens on a new route or replaces the button
+                        if self._execute_click_strategy(element, strategy):
+                            logger.info(f"✅ Apply button clicked using {strategy}")
+                            return True
+            except Exception as e:
+                logger.debug(f"⚠️ Apply button lookup failed: {e}")
             
             if attempt < self.max_click_retries - 1:
-                time.sleep(2)
+                self._wait_for(EC.presence_of_element_located((By.CSS_SELECTOR, ', '.join(_APPLY_SELECTORS))), timeout=2)
         
         return False
     
     def _complete_application_flow_bulletproof(self, base_attempt: int) -> bool:
         """Complete the application flow with multiple strategies"""
         
-        # Handle various application flow buttons
-        flow_button_texts = [
-            "Next",
-            "Continue", 
-            "Create Application",
-            "Submit",
-            "Confirm",
-            "Apply Now"
-        ]
-        
         max_flow_attempts = 5
         
         for flow_attempt in range(max_flow_attempts):
             try:
-                # Check if we've completed the flow
-                if self._check_booking_completion():
+                # Checks completion first, then clicks the next flow button, or wait in-browser until one (or success) shows up
+                step = self._flow_step()
+                if step == 'done':
                     logger.info("✅ Booking flow completed successfully")
                     return True
-                
-                # Try to click next flow button
-                button_clicked = False
-                for button_text in flow_button_texts:
-                    try:
-                        # Multiple selector strategies for each button text
-                        selectors = [
-                            f'button:contains("{button_text}")',
-                            f'//button[contains(text(), "{button_text}")]',
-                            f'[data-test-id*="{button_text.lower()}"]'
-                        ]
-                        
-                        for selector in selectors:
-                            try:
-                                if selector.startswith('//'):
-                                    elements = self.driver.find_elements('xpath', selector)
-                                else:
-                                    elements = self.driver.find_elements('css selector', selector)
-                                
-                                if elements:
-                                    for element in elements:
-                                        if element.is_displayed() and element.is_enabled():
-                                            element.click()
-                                            logger.info(f"✅ Clicked '{button_text}' button")
-                                            time.sleep(2)
-                                            button_clicked = True
-                                            break
-                                
-                                if button_clicked:
-                                    break
-                            except:
-                                continue
-                        
-                        if button_clicked:
-                            break
-                    except:
-                        continue
-                
-                if not button_clicked:
-                    # Check if we're done anyway
-                    if self._check_booking_completion():
-                        return True
-                    
-                    if flow_attempt < max_flow_attempts - 1:
-                        time.sleep(2)
-                        continue
+                if step:
+                    logger.info(f"✅ Clicked '{step}' button")
                 
             except Exception as e:
                 logger.debug(f"⚠️ Application flow error: {e}")
-                if flow_attempt < max_flow_attempts - 1:
-                    time.sleep(2)
-                    continue
+                if flow_attempt < max_flow_attempts - 1 and self._adaptive_wait(self._check_booking_completion, total=2):
+                    return True
         
-        # Final completion check
-        return self._check_booking_completion()
+        # Final completion check; the confirmation can land a moment after the last click
+        return self._adaptive_wait(self._check_booking_completion, total=2)
+    
+    def _adaptive_wait(self, predicate, total: float = 10.0) -> bool:
+        """Re-check predicate on the poll_strategy schedule until it holds or total seconds pass"""
+        t0 = time.monotonic()
+        steps = self.poll_strategy.value
+        i = 0
+        while True:
+            if predicate():
+                return True
+            remaining = total - (time.monotonic() - t0)
+            if remaining <= 0:
+                return False
+            time.sleep(min(steps[min(i, len(steps) - 1)], remaining))
+            i += 1
+    
+    def _flow_step(self) -> str:
+        """Run one _FLOW_STEP_JS step: the clicked button text, 'done', or '' on timeout"""
+        if hasattr(self.driver, 'execute_cdp_cmd'):
+            try:
+                # Runtime.evaluate awaits the observer's Promise without WebDriver's script wrapping
+                result = self.driver.execute_cdp_cmd('Runtime.evaluate', {
+                    'expression': f"({_FLOW_STEP_JS})({_FLOW_STEP_ARGS})",
+                    'awaitPromise': True,
+                    'returnByValue': True,
+                })
+            except WebDriverException as e:
+                # The step ran and its click navigated away; running it again would skip a step
+                if any(marker in str(e) for marker in _CONTEXT_LOST_ERRORS):
+                    raise
+                result = None  # CDP unavailable; fall through to execute_script
+            if result is not None:
+                if 'exceptionDetails' in result:
+                    raise JavascriptException(result['exceptionDetails'].get('text', 'flow step failed'))
+                return result['result'].get('value') or ''
+        return self.driver.execute_script(
+            f"return ({_FLOW_STEP_JS})(arguments[0]);", json.loads(_FLOW_STEP_ARGS)) or ''
     
     def _check_booking_completion(self) -> bool:
         """Check if booking has been completed successfully"""
         try:
-            # Check for success indicators
-            success_indicators = [
-                'div:contains("Application submitted")',
-                'div:contains("Thank you")', 
-                'div:contains("Success")',
-                'div:contains("Confirmation")',
-                '.success-message',
-                '.confirmation-message'
-            ]
-            
-            for indicator in success_indicators:
-                try:
-                    elements = self.driver.find_elements('css selector', indicator)
-                    if elements and elements[0].is_displayed():
-                        logger.debug(f"✅ Found completion indicator: {indicator}")
-                        return True
-                except:
-                    continue
-            
-            # Check URL for completion patterns
-            current_url = self.driver.current_url
-            completion_url_patterns = [
-                'confirmation',
-                'success',
-                'thank-you',
-                'application-complete'
-            ]
-            
-            for pattern in completion_url_patterns:
-                if pattern in current_url.lower():
-                    logger.debug(f"✅ Found completion URL pattern: {pattern}")
-                    return True
-            
-        except Exception as e:
+            match = self.driver.execute_script(_COMPLETION_JS, _COMPLETION_ARGS[0], _COMPLETION_ARGS[1])
+        except WebDriverException as e:
             logger.debug(f"⚠️ Completion check error: {e}")
-        
-        return False
+            return False
+        if match:
+            logger.debug(f"✅ Found completion marker: {match}")
+        return bool(match)
     
     def _recovery_delay(self, attempt: int):
         """Progressive delay for recovery between attempts"""
-        delay = min(2 ** attempt, 10)  # Exponential backoff, max 10 seconds
-        logger.info(f"⏳ Recovery delay: {delay}s before next booking attempt")
+        # Exponential backoff capped at 10s, jittered so parallel bookings spread out
+        delay = min(_BACKOFF_CAP, _BACKOFF[min(attempt, len(_BACKOFF) - 1)] * (0.5 + random.random()))
+        logger.info(f"⏳ Recovery delay: {delay:.1f}s before next booking attempt")
         time.sleep(delay)
     
-    def get_booking_stats(self) -> Dict[str, int]:
-        """Get current booking statistics"""
-        return {
-            'success_count': self.booking_success_count,
-            'failure_count': self.booking_failure_count,
-            'total_attempts': self.booking_success_count + self.booking_failure_count,
-            'success_rate': (self.booking_success_count / max(1, self.booking_success_count + self.booking_failure_count)) * 100
-        }
\ No newline at end of file
+    def get_booking_stats(self) -> Dict[str, float]:
+        """Get current booking statistics (a copy of the snapshot cached until a booking finishes)"""
+        if self._stats_cache is None:
+            total = self.booking_success_count + self.booking_failure_count
+            self._stats_cache = MappingProxyType({
+                'success_count': self.booking_success_count,
+                'failure_count': self.booking_failure_count,
+                'total_attempts': total,
+                'success_rate': (self.booking_success_count / max(1, total)) * 100
+            })
+        return dict(self._stats_cache)
\ No newline at end of file
@@ -1,16 +1,80 @@
 import logging
+import random
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 from seleniumbase import BaseCase
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import WebDriverException
 
 logger = logging.getLogger(__name__)
 
+_NAV_URLS = (
+    "https://hiring.amazon.com/app#/jobSearch",
+    "https://hiring.amazon.com/app#/dashboard",
+    "https://hiring.amazon.com/",
+)
+
+# (by, selector) pairs evaluated together by _SESSION_PROBE_JS
+_LOGOUT_INDICATORS = (
+    (By.XPATH, '//button[contains(., "Sign in")]'),
+    (By.CSS_SELECTOR, 'input[data-test-id="input-test-id-login"]'),
+    (By.XPATH, '//div[text()[contains(., "Sign in to your account")]]'),
+    (By.XPATH, '//button[contains(text(), "Sign in")]'),
+    (By.XPATH, '//input[@placeholder="Email"]'),
+    (By.CSS_SELECTOR, '[data-test-id="input-test-id-login"]'),
+)
+
+_LOGIN_INDICATORS = (
+    (By.XPATH, '//div[text()[contains(., "Recommended jobs")]]'),
+    (By.XPATH, '//button[contains(., "Go to my jobs")]'),
+    (By.XPATH, '//button[contains(., "Search all jobs")]'),
+    (By.XPATH, '//div[text()[contains(., "Active jobs")]]'),
+    (By.CSS_SELECTOR, 'div[data-test-component="StencilReactRow"]'),
+    (By.XPATH, '//div[contains(text(), "job")]'),
+    (By.CSS_SELECTOR, '[data-test-id="JobCard"]'),
+    (By.CSS_SELECTOR, '.jobCardItem'),
+    (By.CSS_SELECTOR, '[data-test-component="StencilReactCard"]'),
+)
+
+# Visibility of each [by, selector] in both indicator lists, plus the current URL
+_SESSION_PROBE_JS = """
+const visible = ([by, sel]) => {
+    let e = null;
+    try {
+        e = by === 'xpath'
+            ? document.evaluate(sel, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+            : document.querySelector(sel);
+    } catch (err) {
+        return false;
+    }
+    return !!(e && e.offsetParent !== null);
+};
+return {logout: arguments[0].map(visible), login: arguments[1].map(visible), url: location.href};
+"""
+
+_VALID_URL_PATTERNS = (
+    "hiring.amazon.com/app#/jobSearch",
+    "hiring.amazon.com/app#/dashboard",
+    "hiring.amazon.com/application",
+)
+
+# Seeing any of these in the URL means we're on a login page
+_LOGIN_URL_PATTERNS = (
+    "/signin",
+    "/login",
+    "/auth",
+    "input-test-id-login",
+)
+
 class BulletproofSessionService:
     """Ultra-robust session service with comprehensive error handling"""
     
     def __init__(self):
         self.max_retries = 5
-        self.retry_delay_base = 2
+        # Navigate via CDP Page.navigate + readyState wait; False restores sb.open + sleep
+        self.use_cdp_navigation = True
         
     def validate_session_bulletproof(self, sb: BaseCase) -> bool:
         """Bulletproof session validation with comprehensive retry logic"""
@@ -27,8 +91,11 @@ class BulletproofSessionService:
                         continue
                     return False
                 
+                # One round trip reads both indicator sets and the URL
+                probe = self._probe_session(sb)
+                
                 # Step 2: Check for logout indicators first
-                if self._check_logout_indicators(sb):
+                if self._first_found(_LOGOUT_INDICATORS, probe['logout'], "🚪 Found logout indicator"):
                     logger.warning(f"⚠️ Found logout indicators on attempt {attempt + 1}")
                     if attempt < self.max_retries - 1:
                         self._progressive_delay(attempt)
@@ -36,12 +103,12 @@ class BulletproofSessionService:
                     return False
                 
                 # Step 3: Check for login indicators  
-                if self._check_login_indicators(sb):
+                if self._first_found(_LOGIN_INDICATORS, probe['login'], "✅ Found login indicator"):
                     logger.info(f"✅ Session validated successfully on attempt {attempt + 1}")
                     return True
                 
                 # Step 4: URL-based validation as fallback
-                if self._validate_by_url(sb):
+                if self._validate_by_url(probe['url']):
                     logger.info(f"✅ Session validated by URL on attempt {attempt + 1}")
                     return True
                 
@@ -61,18 +128,15 @@ class BulletproofSessionService:
     
     def _navigate_with_retries(self, sb: BaseCase, base_attempt: int) -> bool:
         """Navigate with multiple retry strategies"""
-        urls_to_try = [
-            "https://hiring.amazon.com/app#/jobSearch",
-            "https://hiring.amazon.com/app#/dashboard", 
-            "https://hiring.amazon.com/"
-        ]
-        
-        for url_idx, url in enumerate(urls_to_try):
+        for url_idx, url in enumerate(_NAV_URLS):
             for nav_attempt in range(3):  # 3 attempts per URL
                 try:
                     logger.debug(f"🌐 Navigating to {url} (attempt {nav_attempt + 1})")
-                    sb.open(url)
-                    time.sleep(min(1 + nav_attempt * 0.5, 3))  # Progressive wait
+                    if self.use_cdp_navigation and hasattr(sb.driver, 'execute_cdp_cmd'):
+                        self._navigate_cdp(sb.driver, url, timeout=min(5 + nav_attempt * 5, 15))
+                    else:
+                        sb.open(url)
+                        time.sleep(min(1 + nav_attempt * 0.5, 3))  # Progressive wait
                     return True
                 except Exception as e:
                     logger.warning(f"⚠️ Navigation to {url} failed (attempt {nav_attempt + 1}): {e}")
@@ -82,87 +146,41 @@ class BulletproofSessionService:
         
         return False
     
-    def _check_logout_indicators(self, sb: BaseCase) -> bool:
-        """Check for logout indicators with multiple strategies"""
-        logout_indicators = [
-            ('css', 'button:contains("Sign in")'),
-            ('css', 'input[data-test-id="input-test-id-login"]'),
-            ('css', 'div:contains("Sign in to your account")'),
-            ('xpath', '//button[contains(text(), "Sign in")]'),
-            ('xpath', '//input[@placeholder="Email"]'),
-            ('css', '[data-test-id="input-test-id-login"]')
-        ]
-        
-        for selector_type, selector in logout_indicators:
-            try:
-                if selector_type == 'css':
-                    if sb.is_element_visible(selector):
-                        logger.debug(f"🚪 Found logout indicator (CSS): {selector}")
-                        return True
-                elif selector_type == 'xpath':
-                    if sb.is_element_visible(selector):
-                        logger.debug(f"🚪 Found logout indicator (XPath): {selector}")
-                        return True
-            except Exception:
-                continue  # Ignore individual selector failures
-        
-        return False
+    def _navigate_cdp(self, driver, url: str, timeout: float):
+        """Start navigation over CDP and return once the new document has loaded"""
+        result = driver.execute_cdp_cmd('Page.navigate', {'url': url})
+        if result.get('errorText'):
+            raise WebDriverException(result['errorText'])
+        WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+            lambda d: d.execute_script("return document.readyState") == 'complete')
     
-    def _check_login_indicators(self, sb: BaseCase) -> bool:
-        """Check for login indicators with multiple strategies"""
-        login_indicators = [
-            ('css', 'div:contains("Recommended jobs")'),
-            ('css', 'button:contains("Go to my jobs")'),
-            ('css', 'button:contains("Search all jobs")'),
-            ('css', 'div:contains("Active jobs")'),
-            ('css', 'div[data-test-component="StencilReactRow"]'),
-            ('xpath', '//div[contains(text(), "job")]'),
-            ('css', '[data-test-id="JobCard"]'),
-            ('css', '.jobCardItem'),
-            ('css', '[data-test-component="StencilReactCard"]')
-        ]
-        
-        for selector_type, selector in login_indicators:
-            try:
-                if selector_type == 'css':
-                    if sb.is_element_visible(selector):
-                        logger.debug(f"✅ Found login indicator (CSS): {selector}")
-                        return True
-                elif selector_type == 'xpath':
-                    if sb.is_element_visible(selector):
-                        logger.debug(f"✅ Found login indicator (XPath): {selector}")
-                        return True
-            except Exception:
-                continue  # Ignore individual selector failures
-        
+    def _probe_session(self, sb: BaseCase) -> dict:
+        """Evaluate logout/login indicators and read the URL in a single execute_script"""
+        return sb.execute_script(
+            _SESSION_PROBE_JS,
+            [list(loc) for loc in _LOGOUT_INDICATORS],
+            [list(loc) for loc in _LOGIN_INDICATORS])
+    
+    @staticmethod
+    def _first_found(indicators, results, message: str) -> bool:
+        for (_, selector), found in zip(indicators, results):
+            if found:
+                logger.debug(f"{message}: {selector}")
+                return True
         return False
     
-    def _validate_by_url(self, sb: BaseCase) -> bool:
+    def _validate_by_url(self, current_url: str) -> bool:
         """Validate session based on URL patterns"""
         try:
-            current_url = sb.get_current_url()
             logger.debug(f"🔗 Current URL: {current_url}")
             
-            valid_url_patterns = [
-                "hiring.amazon.com/app#/jobSearch",
-                "hiring.amazon.com/app#/dashboard",
-                "hiring.amazon.com/application"
-            ]
-            
-            for pattern in valid_url_patterns:
+            for pattern in _VALID_URL_PATTERNS:
                 if pattern in current_url:
                     logger.debug(f"✅ URL pattern match: {pattern}")
                     return True
             
             # Check if we're not on a login page
-            login_url_patterns = [
-                "/signin",
-                "/login", 
-                "/auth",
-                "input-test-id-login"
-            ]
-            
-            for pattern in login_url_patterns:
+            for pattern in _LOGIN_URL_PATTERNS:
                 if pattern in current_url:
                     logger.debug(f"❌ Found login URL pattern: {pattern}")
                     return False
@@ -179,10 +197,27 @@ class BulletproofSessionService:
     
     def _progressive_delay(self, attempt: int):
         """Progressive delay with exponential backoff"""
-        delay = min(self.retry_delay_base ** attempt, 30)  # Max 30 seconds
-        logger.info(f"⏳ Progressive delay: {delay}s before next attempt")
+        # Doubling, capped at 30s, with jitter so parallel workers don't retry in lockstep
+        delay = min(30, (1 << min(attempt, 30)) * (0.5 + random.random()))
+        logger.info(f"⏳ Progressive delay: {delay:.1f}s before next attempt")
         time.sleep(delay)
     
+    def warmup(self, sb: BaseCase, notifier) -> bool:
+        """Send the test notification while the first session validation runs.
+        
+        Only validation decides the result; a failed test notification is logged
+        and otherwise ignored. Validation stays on the calling thread so the
+        browser is only ever driven from one thread.
+        """
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="session-warmup") as pool:
+            notify = pool.submit(self.send_test_notification, notifier)
+            session_valid = self.validate_session_bulletproof(sb)
+            if notify.result():
+                logger.info("✅ Discord notification system verified")
+            elif notifier:
+                logger.warning("⚠️ Discord notification test failed - continuing without notifications")
+        return session_valid
+    
     def send_test_notification(self, notifier) -> bool:
         """Send test notification to verify Discord connectivity"""
         try:
@@ -11,6 +11,8 @@ class SessionService:
     
     def __init__(self):
         self.session_manager = AmazonSessionManager()
+        # Browser the current session was established on; reused until it stops validating
+        self._sb = None
     
     def establish_session(self, sb: BaseCase, correlation_id: str = None) -> bool:
         """Establish an Amazon session, using saved session if available"""
@@ -29,6 +31,7 @@ class SessionService:
                 else:
                     logger.warning("⚠️ Restored session is invalid, creating new session", extra=log_extra)
                     self.session_manager.clear_session()
+                    self.clear_cookies_only(sb)
             
             # Create new session if restoration failed or session is invalid
             logger.info("🔄 Creating new session from scratch", extra=log_extra)
@@ -53,35 +56,15 @@ class SessionService:
         try:
             # Navigate to a reliable page
             sb.open("https://hiring.amazon.com/app#/jobSearch")
-            sb.sleep(1)  # Quick validation
             
-            # Check for multiple login indicators
-            login_indicators = [
-                'div:contains("Recommended jobs")',
-                'button:contains("Go to my jobs")',
-                'button:contains("Search all jobs")',
-                'div:contains("Active jobs")',
-                'div[data-test-component="StencilReactRow"]'
-            ]
-            
-            # Check for logout indicators (if present, we're not logged in)
-            logout_indicators = [
-                'button:contains("Sign in")',
-                'input[data-test-id="input-test-id-login"]',
-                'div:contains("Sign in to your account")'
-            ]
-            
-            # Check if we're logged out
-            for indicator in logout_indicators:
-                if sb.is_element_visible(indicator):
-                    logger.debug(f"Found logout indicator: {indicator}")
-                    return False
-            
-            # Check if we're logged in
-            for indicator in login_indicators:
-                if sb.is_element_visible(indicator):
-                    logger.debug(f"Session valid - found: {indicator}")
-                    return True
+            # Wait until either set renders instead of sleeping first
+            state, indicator = self.session_manager.wait_for_indicators(sb)
+            if state == 'logout':
+                logger.debug(f"Found logout indicator: {indicator}")
+                return False
+            if state == 'login':
+                logger.debug(f"Session valid - found: {indicator}")
+                return True
             
             # Fallback: check URL pattern
             current_url = sb.get_current_url()
@@ -100,8 +83,9 @@ class SessionService:
         log_extra = {'correlation_id': correlation_id} if correlation_id else {}
         logger.info("🔄 Refreshing session", extra=log_extra)
         
-        # Clear existing session and create new one
+        # Clear existing session, log the browser out, and create a new one
         self.session_manager.clear_session()
+        self.clear_cookies_only(sb)
         return self.establish_session(sb, correlation_id)
     
     def clear_session(self) -> bool:
@@ -113,9 +97,29 @@ class SessionService:
         return self._validate(sb)
     
     def ensure_authenticated_session(self, sb: BaseCase = None) -> bool:
-        """Ensure we have an authenticated session."""
-        if sb:
-            return self.establish_session(sb)
-        else:
+        """Ensure we have an authenticated session, reusing the last browser if it's still signed in."""
+        sb = sb or self._sb
+        if sb is None:
             # For compatibility when called without sb parameter
-            return True
\ No newline at end of file
+            return True
+        
+        if sb is self._sb and self._validate(sb):
+            return True
+        
+        if self.establish_session(sb):
+            self._sb = sb
+            return True
+        return False
+    
+    def clear_cookies_only(self, sb: BaseCase = None) -> bool:
+        """Log out the browser (cookies and web storage) without quitting Chrome."""
+        sb = sb or self._sb
+        if sb is None:
+            return False
+        try:
+            sb.delete_all_cookies()
+            sb.execute_script("sessionStorage.clear(); localStorage.clear();")
+            return True
+        except Exception as e:
+            logger.debug(f"Failed to clear browser session state: {e}")
+            return False
\ No newline at end of file
@@ -1,21 +1,91 @@
 import json
 import os
-import pickle
+import random
 import time
+import orjson
 from datetime import datetime, timedelta
 from seleniumbase import BaseCase
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 import logging
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Session indicators as native CSS on Amazon's data-test-* hooks, so each probe is a
+# plain querySelector rather than a text search over the whole page.
+# Present and visible only when signed out:
+LOGOUT_SELECTORS_CSS = (
+    'input[data-test-id="input-test-id-login"]',       # login form email field
+    'input[data-test-id="input-test-id-pin"]',         # login form PIN step
+    'button[data-test-id="signin-button"]',
+    'button[data-test-id="sidePanelSignInButton"]',
+)
+
+# Text fallback for the signed-out state, in case the hooks above change: the sign-in
+# button and the elements that directly hold the sign-in prompts, as one XPath union
+LOGOUT_TEXT_XPATH = ' | '.join((
+    '//button[contains(., "Sign in")]',
+    '//*[text()[contains(., "Sign in to your account")]]',
+    '//*[text()[contains(., "We need you to sign in")]]',
+))
+
+# Rendered for a signed-in candidate (dashboard rows). Job cards are left out:
+# jobSearch shows them to signed-out visitors too
+LOGIN_SELECTORS_CSS = (
+    'div[data-test-component="StencilReactRow"]',
+)
+
+# Each set pre-joined into one selector list, so a probe is one querySelectorAll per set
+LOGOUT_CSS = ", ".join(LOGOUT_SELECTORS_CSS)
+LOGIN_CSS = ", ".join(LOGIN_SELECTORS_CSS)
+_INDICATOR_GROUPS = (
+    ('logout', LOGOUT_CSS, LOGOUT_SELECTORS_CSS, LOGOUT_TEXT_XPATH),
+    ('login', LOGIN_CSS, LOGIN_SELECTORS_CSS, None),
+)
+
+# [state, matching selector] for the first group with a visible match, else null
+_INDICATOR_PROBE_JS = """
+const shown = e => e.offsetParent !== null;
+for (const [state, joined, sels, xpath] of arguments[0]) {
+    const e = Array.from(document.querySelectorAll(joined)).find(shown);
+    if (e) return [state, sels.find(s => e.matches(s))];
+    if (!xpath) continue;
+    const hits = document.evaluate(xpath, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (let i = 0; i < hits.snapshotLength; i++) {
+        if (shown(hits.snapshotItem(i))) return [state, xpath];
+    }
+}
+return null;
+"""
+
+# Any of the consent buttons (consentBtn, Stencil "I consent", "Accept All Cookies") as one
+# XPath union, so a single lookup per poll covers all three
+_CONSENT_XPATH = ' | '.join((
+    '//button[@data-test-id="consentBtn"]',
+    '//button[@data-test-component="StencilReactButton"][.//div[contains(., "I consent")]]',
+    '//button[contains(., "Accept All Cookies")]',
+))
+
+def _to_cdp_cookie(cookie: Dict) -> Dict:
+    """Map a WebDriver cookie dict onto CDP's Network.CookieParam"""
+    param = {k: cookie[k] for k in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite')
+             if k in cookie}
+    if 'expiry' in cookie:
+        param['expires'] = cookie['expiry']
+    return param
+
 class AmazonSessionManager:
     """Manages Amazon session persistence for continuous monitoring"""
     
-    def __init__(self, session_file: str = "amazon_session.pkl"):
+    def __init__(self, session_file: str = "amazon_session.json"):
         self.session_file = session_file
         self.cookies_file = "amazon_cookies.json"
         self.session_data = {}
+        # (mtime, saved timestamp) of the session file, so expiry checks skip the full parse
+        self._timestamp_cache = None
         
     def save_session(self, sb: BaseCase, user_email: str = None) -> bool:
         """Save current session state including cookies and metadata"""
@@ -46,13 +116,20 @@ class AmazonSessionManager:
                 'local_storage': self._get_local_storage(sb)
             }
             
-            # Save to pickle file
-            with open(self.session_file, 'wb') as f:
-                pickle.dump(session_data, f)
+            # Save as JSON; everything in the session is already JSON-native.
+            # Write a temp file and swap it in so a crash never leaves a truncated session
+            tmp_file = self.session_file + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(orjson.dumps(session_data))
+            os.replace(tmp_file, self.session_file)
             
-            # Also save cookies as JSON for backup
-            with open(self.cookies_file, 'w') as f:
-                json.dump(cookies, f, indent=2)
+            # Readable cookie dump for debugging only; the session file already holds them
+            if os.getenv('DEBUG_COOKIES', 'false').lower() == 'true':
+                tmp_file = self.cookies_file + ".tmp"
+                with open(tmp_file, 'w') as f:
+                    json.dump(cookies, f, indent=2)
+                os.replace(tmp_file, self.cookies_file)
+                logger.info(f"🍪 Cookies backup: {self.cookies_file}")
             
             logger.info(f"✅ Session saved successfully for {user_email}")
             logger.info(f"📁 Session file: {self.session_file}")
@@ -71,52 +148,40 @@ class AmazonSessionManager:
                 logger.warning("⚠️ No saved session found")
                 return False
             
-            # Load session data
-            with open(self.session_file, 'rb') as f:
-                session_data = pickle.load(f)
-            
-            # Check if session is not too old (reduce to 12 hours)
-            session_time = datetime.fromisoformat(session_data['timestamp'])
-            if datetime.now() - session_time > timedelta(hours=12):
+            # Check if session is not too old (12 hours) before reading it in full
+            # or touching the browser; the timestamp is memoised by file mtime
+            if self.is_session_expired():
                 logger.warning("⚠️ Session is too old, clearing and requiring fresh login")
                 self.clear_session()  # Clear expired session
                 return False
             
-            # Navigate to Amazon first
-            sb.open("https://hiring.amazon.com")
-            sb.sleep(5)  # Increased wait time
+            # Load session data
+            with open(self.session_file, 'rb') as f:
+                session_data = orjson.loads(f.read())
+            
+            # Cookies need the hiring domain loaded; skip the trip if we're already there
+            if "hiring.amazon.com" not in sb.get_current_url():
+                sb.open("https://hiring.amazon.com")
+                self._wait_for_load(sb)
             
             # Handle consent if needed
             self._handle_consent(sb)
             
             # Restore cookies
-            cookies_added = 0
-            for cookie in session_data['cookies']:
-                try:
-                    sb.add_cookie(cookie)
-                    cookies_added += 1
-                except Exception as e:
-                    logger.debug(f"Failed to add cookie {cookie.get('name', 'unknown')}: {e}")
+            cookies_added = self._restore_cookies(sb, session_data['cookies'])
             
             logger.info(f"📊 Added {cookies_added}/{len(session_data['cookies'])} cookies")
             
             # Restore session and local storage
-            self._restore_session_storage(sb, session_data.get('session_storage', {}))
-            self._restore_local_storage(sb, session_data.get('local_storage', {}))
+            self._restore_storage(sb, session_data.get('session_storage', {}), session_data.get('local_storage', {}))
             
-            # Navigate to the dashboard with retry
-            for attempt in range(3):
-                try:
-                    sb.open("https://hiring.amazon.com/app#/myApplications")
-                    sb.sleep(5)
-                    
-                    if self.validate_session(sb):
-                        logger.info(f"✅ Session restored successfully for {session_data['user_email']}")
-                        return True
-                        
-                except Exception as e:
-                    logger.warning(f"Attempt {attempt + 1} failed: {e}")
-                    sb.sleep(2)
+            # Navigate to the dashboard; validate_session does its own retries
+            sb.open("https://hiring.amazon.com/app#/myApplications")
+            self._wait_for_load(sb)
+            
+            if self.validate_session(sb):
+                logger.info(f"✅ Session restored successfully for {session_data['user_email']}")
+                return True
             
             logger.warning("⚠️ Session restoration failed after validation, clearing invalid session")
             self.clear_session()  # Clear invalid session
@@ -126,62 +191,52 @@ class AmazonSessionManager:
             logger.error(f"❌ Failed to load session: {e}")
             return False
     
+    def _restore_cookies(self, sb: BaseCase, cookies: List[Dict]) -> int:
+        """Install all cookies with one CDP Network.setCookies call; per-cookie add_cookie as fallback"""
+        if hasattr(sb.driver, 'execute_cdp_cmd'):
+            try:
+                sb.driver.execute_cdp_cmd('Network.setCookies', {'cookies': [_to_cdp_cookie(c) for c in cookies]})
+                return len(cookies)
+            except Exception as e:
+                logger.debug(f"CDP cookie restore failed, adding cookies one by one: {e}")
+        
+        cookies_added = 0
+        for cookie in cookies:
+            try:
+                sb.add_cookie(cookie)
+                cookies_added += 1
+            except Exception as e:
+                logger.debug(f"Failed to add cookie {cookie.get('name', 'unknown')}: {e}")
+        return cookies_added
+    
     def _handle_consent(self, sb: BaseCase):
         """Handle consent prompts during session loading"""
-        consent_selectors = [
-            'button[data-test-id="consentBtn"]',
-            'button[data-test-component="StencilReactButton"] div:contains("I consent")',
-            'button:contains("Accept All Cookies")'
-        ]
+        try:
+            buttons = WebDriverWait(sb.driver, 2, poll_frequency=0.1).until(
+                EC.visibility_of_any_elements_located((By.XPATH, _CONSENT_XPATH)))
+        except TimeoutException:
+            return
         
-        for selector in consent_selectors:
-            try:
-                if sb.is_element_visible(selector, timeout=2):
-                    sb.click(selector)
-                    sb.sleep(2)
-                    logger.info(f"✅ Handled consent with selector: {selector}")
-                    break
-            except:
-                continue
+        try:
+            button = buttons[0]
+            button.click()
+            WebDriverWait(sb.driver, 2, poll_frequency=0.1).until(EC.invisibility_of_element(button))
+            logger.info("✅ Handled consent prompt")
+        except Exception as e:
+            logger.debug(f"Consent prompt handling failed: {e}")
     
     def validate_session(self, sb: BaseCase, max_attempts: int = 3) -> bool:
         """Validate if current session is still active with retry logic"""
         for attempt in range(max_attempts):
             try:
-                # Check for logout indicators first (more reliable)
-                logout_indicators = [
-                    'button:contains("Sign in")',
-                    'input[data-test-id="input-test-id-login"]',
-                    'div:contains("Sign in to your account")',
-                    'div:contains("We need you to sign in")',
-                    'button[data-test-id="signin-button"]'
-                ]
-                
-                # Check for login indicators
-                login_indicators = [
-                    'div[data-test-component="StencilReactRow"]',  # Dashboard rows
-                    'button:contains("Go to my jobs")',
-                    'button:contains("Search all jobs")',
-                    'div:contains("Active jobs")',
-                    'div:contains("Recommended jobs")',
-                    'div:contains("My Applications")',
-                    'div:contains("Application status")'
-                ]
-                
-                # Wait for page to load
-                sb.sleep(3)
-                
-                # First check for logout indicators (if found, definitely invalid)
-                for indicator in logout_indicators:
-                    if sb.is_element_visible(indicator):
-                        logger.warning(f"⚠️ Session invalid - found logout indicator: {indicator}")
-                        return False
-                
-                # Then check for login indicators
-                for indicator in login_indicators:
-                    if sb.is_element_visible(indicator):
-                        logger.info(f"✅ Session valid - found: {indicator}")
-                        return True
+                # Returns as soon as either set shows up; logout wins if both do
+                state, indicator = self.wait_for_indicators(sb, timeout=5)
+                if state == 'logout':
+                    logger.warning(f"⚠️ Session invalid - found logout indicator: {indicator}")
+                    return False
+                if state == 'login':
+                    logger.info(f"✅ Session valid - found: {indicator}")
+                    return True
                 
                 # Check URL as fallback
                 current_url = sb.get_current_url()
@@ -193,7 +248,7 @@ class AmazonSessionManager:
                 
                 if attempt < max_attempts - 1:
                     logger.warning(f"⚠️ Session validation attempt {attempt + 1} inconclusive, retrying...")
-                    sb.sleep(2)
+                    self._retry_delay(attempt)
                     continue
                 
                 logger.warning("⚠️ Session validation failed after all attempts")
@@ -202,7 +257,7 @@ class AmazonSessionManager:
             except Exception as e:
                 if attempt < max_attempts - 1:
                     logger.warning(f"❌ Session validation error on attempt {attempt + 1}: {e}, retrying...")
-                    sb.sleep(2)
+                    self._retry_delay(attempt)
                     continue
                 else:
                     logger.error(f"❌ Session validation error after all attempts: {e}")
@@ -210,6 +265,42 @@ class AmazonSessionManager:
         
         return False
     
+    @staticmethod
+    def _retry_delay(attempt: int):
+        """Short exponential backoff with jitter: ~0.2s, 0.4s, 0.8s..."""
+        time.sleep(0.2 * (2 ** attempt) + random.uniform(0, 0.1))
+    
+    @staticmethod
+    def wait_for_indicators(sb: BaseCase, timeout: float = 8) -> Tuple[Optional[str], Optional[str]]:
+        """Poll the logout and login indicators (one round trip per poll) until one is visible.
+        
+        Returns ('logout', selector) or ('login', selector) for the first hit,
+        checking logout first, or (None, None) if neither appears in time.
+        Dashboard rows can paint before the sign-in button hydrates, so a login
+        hit only stands if the logout set is still absent once the page has loaded.
+        """
+        groups = [list(group) for group in _INDICATOR_GROUPS]
+        try:
+            state, indicator = WebDriverWait(sb.driver, timeout, poll_frequency=0.1).until(
+                lambda d: d.execute_script(_INDICATOR_PROBE_JS, groups))
+        except TimeoutException:
+            return None, None
+        if state == 'login':
+            AmazonSessionManager._wait_for_load(sb, timeout=2)
+            late_logout = sb.driver.execute_script(_INDICATOR_PROBE_JS, [groups[0]])
+            if late_logout:
+                return tuple(late_logout)
+        return state, indicator
+    
+    @staticmethod
+    def _wait_for_load(sb: BaseCase, timeout: float = 10):
+        """Wait for the current document to finish loading instead of a fixed sleep"""
+        try:
+            WebDriverWait(sb.driver, timeout, poll_frequency=0.1).until(
+                lambda d: d.execute_script("return document.readyState") == 'complete')
+        except TimeoutException:
+            logger.debug("Page still loading after %ss, continuing", timeout)
+    
     def _get_session_storage(self, sb: BaseCase) -> Dict:
         """Get session storage data"""
         try:
@@ -238,21 +329,26 @@ class AmazonSessionManager:
         except:
             return {}
     
-    def _restore_session_storage(self, sb: BaseCase, session_storage: Dict):
-        """Restore session storage"""
-        for key, value in session_storage.items():
-            try:
-                sb.execute_script(f"sessionStorage.setItem('{key}', '{value}');")
-            except Exception as e:
-                logger.debug(f"Failed to restore session storage {key}: {e}")
-    
-    def _restore_local_storage(self, sb: BaseCase, local_storage: Dict):
-        """Restore local storage"""
-        for key, value in local_storage.items():
-            try:
-                sb.execute_script(f"localStorage.setItem('{key}', '{value}');")
-            except Exception as e:
-                logger.debug(f"Failed to restore local storage {key}: {e}")
+    def _restore_storage(self, sb: BaseCase, session_storage: Dict, local_storage: Dict):
+        """Restore session and local storage in a single script call"""
+        try:
+            # Keys and values travel as script arguments, so quotes or newlines in
+            # tokens can't break the script; one bad entry doesn't stop the rest
+            failed = sb.execute_script("""
+                var failed = [];
+                function restore(store, name, data) {
+                    for (var k in data) {
+                        try { store.setItem(k, data[k]); } catch (e) { failed.push(name + ':' + k); }
+                    }
+                }
+                restore(sessionStorage, 'session', arguments[0]);
+                restore(localStorage, 'local', arguments[1]);
+                return failed;
+            """, session_storage or {}, local_storage or {})
+            if failed:
+                logger.debug(f"Failed to restore storage keys: {failed}")
+        except Exception as e:
+            logger.debug(f"Failed to restore browser storage: {e}")
     
     def clear_session(self):
         """Clear saved session files"""
@@ -271,11 +367,14 @@ class AmazonSessionManager:
             if not os.path.exists(self.session_file):
                 return True
             
-            # Load just the timestamp to check age
-            with open(self.session_file, 'rb') as f:
-                session_data = pickle.load(f)
+            # Only re-read the file when it has been rewritten since the last check
+            mtime = os.stat(self.session_file).st_mtime
+            if self._timestamp_cache is None or self._timestamp_cache[0] != mtime:
+                with open(self.session_file, 'rb') as f:
+                    session_data = orjson.loads(f.read())
+                self._timestamp_cache = (mtime, datetime.fromisoformat(session_data['timestamp']))
             
-            session_time = datetime.fromisoformat(session_data['timestamp'])
+            session_time = self._timestamp_cache[1]
             is_expired = datetime.now() - session_time > timedelta(hours=12)
             
             if is_expired:
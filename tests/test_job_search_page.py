@@ -0,0 +1,19 @@
+from job_search_page import JobSearchPage, _test_ids
+
+
+def test_test_ids_extracts_the_data_test_id_values():
+    selectors = [
+        'button[data-test-id="filter-schedule-shift-button-Night"]',
+        'button[data-test-id="filter-role-button-Amazon Fulfillment Center Warehouse Associate"] div',
+    ]
+    assert _test_ids(selectors) == frozenset({
+        "filter-schedule-shift-button-Night",
+        "filter-role-button-Amazon Fulfillment Center Warehouse Associate",
+    })
+
+
+def test_filter_id_sets_cover_every_configured_filter():
+    assert len(JobSearchPage.SHIFT_FILTER_IDS) == len(JobSearchPage.SHIFT_FILTERS)
+    assert len(JobSearchPage.ROLE_FILTER_IDS) == len(JobSearchPage.ROLE_FILTERS)
+    assert all(i.startswith("filter-schedule-shift-button-") for i in JobSearchPage.SHIFT_FILTER_IDS)
+    assert all(i.startswith("filter-role-button-") for i in JobSearchPage.ROLE_FILTER_IDS)
@@ -0,0 +1,48 @@
+from types import SimpleNamespace
+
+import pytest
+
+from utils import notifier as notifier_module
+from utils.notifier import DiscordNotifier, _MAX_MESSAGE_CHARS
+
+HEADER = "**🔎 Shifts Found:**"
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    monkeypatch.setattr(notifier_module, "get_settings",
+                        lambda: SimpleNamespace(discord_webhook_url="https://example.invalid/hook"))
+    messages = []
+    monkeypatch.setattr(DiscordNotifier, "send", lambda self, message: messages.append(message))
+    return messages
+
+
+def _shift(i, title="Warehouse Associate"):
+    return SimpleNamespace(job_id=f"JOB-{i}", title=title, location="Toronto, ON", schedule="Night")
+
+
+def _line(shift):
+    return f"• [{shift.job_id}] {shift.title} @ {shift.location} ({shift.schedule})"
+
+
+def test_notify_shifts_sends_nothing_for_no_shifts(sent):
+    DiscordNotifier().notify_shifts([])
+    assert sent == []
+
+
+def test_notify_shifts_fits_a_short_list_in_one_message(sent):
+    shifts = [_shift(i) for i in range(3)]
+    DiscordNotifier().notify_shifts(shifts)
+
+    assert sent == ["\n".join([HEADER] + [_line(s) for s in shifts])]
+
+
+def test_notify_shifts_splits_long_lists_under_the_limit(sent):
+    shifts = [_shift(i, title="Fulfillment Center Warehouse Associate " + "x" * 60) for i in range(60)]
+    DiscordNotifier().notify_shifts(shifts)
+
+    assert len(sent) > 1
+    assert all(len(message) <= _MAX_MESSAGE_CHARS for message in sent)
+    assert all(message.startswith(HEADER + "\n") and not message.endswith("\n") for message in sent)
+    lines = [line for message in sent for line in message.split("\n")[1:]]
+    assert lines == [_line(s) for s in shifts]
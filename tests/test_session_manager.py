@@ -0,0 +1,17 @@
+from session_manager import _to_cdp_cookie
+
+
+def test_to_cdp_cookie_maps_expiry_to_expires():
+    cookie = {
+        "name": "session-id", "value": "abc", "domain": ".amazon.com", "path": "/",
+        "secure": True, "httpOnly": True, "sameSite": "Lax", "expiry": 1893456000,
+    }
+    assert _to_cdp_cookie(cookie) == {
+        "name": "session-id", "value": "abc", "domain": ".amazon.com", "path": "/",
+        "secure": True, "httpOnly": True, "sameSite": "Lax", "expires": 1893456000,
+    }
+
+
+def test_to_cdp_cookie_omits_missing_and_unknown_fields():
+    cookie = {"name": "csm-hit", "value": "x", "domain": "hiring.amazon.com", "size": 12}
+    assert _to_cdp_cookie(cookie) == {"name": "csm-hit", "value": "x", "domain": "hiring.amazon.com"}
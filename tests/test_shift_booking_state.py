@@ -0,0 +1,127 @@
+import json
+import time
+
+import pytest
+
+from page_objects.shift_booking import ShiftBookingState
+
+
+@pytest.fixture
+def state_file(tmp_path):
+    return tmp_path / "booking_state.json"
+
+
+def _log_lines(state):
+    return state.state_log.read_text().splitlines() if state.state_log.exists() else []
+
+
+def test_mark_as_booked_appends_to_the_log(state_file):
+    state = ShiftBookingState(str(state_file))
+    state.mark_as_booked("job-1")
+    state.mark_as_booked("job-2")
+
+    entries = [json.loads(line) for line in _log_lines(state)]
+    assert [e["job_id"] for e in entries] == ["job-1", "job-2"]
+    assert all(e["day"] == state.last_reset_date for e in entries)
+    assert state.daily_count == 2
+    assert state.is_already_booked("job-1")
+
+
+def test_logged_bookings_are_replayed_on_load(state_file):
+    first = ShiftBookingState(str(state_file))
+    first.mark_as_booked("job-1")
+    first.mark_as_booked("job-2")
+
+    second = ShiftBookingState(str(state_file))
+    assert second.booked_today == {"job-1", "job-2"}
+    assert second.daily_count == 2
+
+
+def test_torn_final_log_line_is_skipped(state_file):
+    state = ShiftBookingState(str(state_file))
+    state.mark_as_booked("job-1")
+    with open(state.state_log, "a") as f:
+        f.write('{"job_id": "job-2", "da')
+
+    reloaded = ShiftBookingState(str(state_file))
+    assert reloaded.booked_today == {"job-1"}
+    assert reloaded.daily_count == 1
+
+
+def test_log_is_folded_into_the_snapshot_after_compact_after(state_file, monkeypatch):
+    monkeypatch.setattr(ShiftBookingState, "COMPACT_AFTER", 3)
+    state = ShiftBookingState(str(state_file))
+    for job_id in ("job-1", "job-2", "job-3"):
+        state.mark_as_booked(job_id)
+
+    assert _log_lines(state) == []
+    snapshot = json.loads(state_file.read_text())
+    assert snapshot["booked_today"] == ["job-1", "job-2", "job-3"]
+    assert snapshot["daily_count"] == 3
+
+
+def test_flush_does_not_double_count_on_reload(state_file):
+    state = ShiftBookingState(str(state_file))
+    state.mark_as_booked("job-1")
+    state.flush()
+    # A crash between writing the snapshot and truncating the log leaves both
+    with open(state.state_log, "a") as f:
+        f.write(json.dumps({"job_id": "job-1", "day": state.last_reset_date}) + "\n")
+
+    reloaded = ShiftBookingState(str(state_file))
+    assert reloaded.booked_today == {"job-1"}
+    assert reloaded.daily_count == 1
+
+
+def _advance_day(state, day="2099-01-02"):
+    """Make the state's cached date read `day` without waiting out TODAY_TTL."""
+    state._today_iso = day
+    state._today_checked = time.monotonic()
+
+
+def test_day_rollover_resets_counts_and_archives_the_log(state_file):
+    state = ShiftBookingState(str(state_file))
+    state.mark_as_booked("job-1")
+    previous_day = state.last_reset_date
+
+    _advance_day(state)
+
+    assert not state.is_already_booked("job-1")
+    assert state.can_book_more(daily_limit=1)
+    assert state.daily_count == 0
+    assert state.last_reset_date == "2099-01-02"
+    archive = state.state_log.with_name(f"booking_state.{previous_day}.log")
+    assert json.loads(archive.read_text())["job_id"] == "job-1"
+
+
+def test_booked_ids_rolls_over_before_reading(state_file):
+    state = ShiftBookingState(str(state_file))
+    state.mark_as_booked("job-1")
+    assert state.booked_ids() == ["job-1"]
+
+    _advance_day(state)
+
+    assert state.booked_ids() == []
+
+
+def test_booking_after_rollover_is_logged_under_the_new_day(state_file):
+    state = ShiftBookingState(str(state_file))
+    state.mark_as_booked("job-1")
+    _advance_day(state)
+
+    state.mark_as_booked("job-2")
+
+    assert state.booked_today == {"job-2"}
+    assert [json.loads(line)["day"] for line in _log_lines(state)] == ["2099-01-02"]
+
+
+def test_stale_snapshot_is_reset_on_load(state_file):
+    state_file.write_text(json.dumps({
+        "booked_today": ["job-1"], "daily_count": 1, "last_reset_date": "2000-01-01",
+    }))
+
+    state = ShiftBookingState(str(state_file))
+
+    assert state.booked_today == set()
+    assert state.daily_count == 0
+    assert state.last_reset_date != "2000-01-01"
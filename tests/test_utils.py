@@ -0,0 +1,90 @@
+import pytest
+
+from utils import retry, timed, timing_summary
+
+
+def _flaky(failures, exc=ValueError):
+    """A function that raises `exc` for its first `failures` calls, then returns 'ok'."""
+    calls = []
+
+    def func():
+        calls.append(1)
+        if len(calls) <= failures:
+            raise exc("boom")
+        return "ok"
+
+    return func, calls
+
+
+def test_retry_succeeds_after_failures():
+    func, calls = _flaky(2)
+    sleeps = []
+    wrapped = retry(ValueError, tries=3, delay=0.01)(func).retry_with(sleep=sleeps.append)
+
+    assert wrapped() == "ok"
+    assert len(calls) == 3
+    assert len(sleeps) == 2
+
+
+def test_retry_reraises_last_error_after_tries():
+    func, calls = _flaky(5)
+    wrapped = retry(ValueError, tries=3, delay=0.01)(func).retry_with(sleep=lambda s: None)
+
+    with pytest.raises(ValueError, match="boom"):
+        wrapped()
+    assert len(calls) == 3
+
+
+def test_retry_ignores_other_exceptions():
+    func, calls = _flaky(1, exc=KeyError)
+    wrapped = retry(ValueError, tries=3, delay=0.01)(func).retry_with(sleep=lambda s: None)
+
+    with pytest.raises(KeyError):
+        wrapped()
+    assert len(calls) == 1
+
+
+def test_retry_waits_never_exceed_max_delay():
+    func, _ = _flaky(7)
+    sleeps = []
+    wrapped = retry(ValueError, tries=8, delay=1, backoff=10, max_delay=3)(func).retry_with(
+        sleep=sleeps.append)
+
+    assert wrapped() == "ok"
+    assert len(sleeps) == 7
+    assert all(0 <= s <= 3 for s in sleeps)
+    assert max(sleeps) == 3
+
+
+def test_timing_summary_reports_percentiles(monkeypatch):
+    monkeypatch.setattr("utils._TIMINGS", {})
+    clock = iter(x / 1000 for pair in ((0, ms) for ms in range(1, 21)) for x in pair)
+    monkeypatch.setattr("utils.time.perf_counter", lambda: next(clock))
+
+    @timed("step")
+    def step():
+        return "done"
+
+    assert [step() for _ in range(20)] == ["done"] * 20
+    summary = timing_summary()
+
+    assert summary == {"step": {"count": 20, "p50": 11.0, "p95": 20.0, "max": 20.0}}
+
+
+def test_timing_summary_keeps_only_the_window_and_skips_empty_labels(monkeypatch):
+    monkeypatch.setattr("utils._TIMINGS", {})
+    clock = iter(x / 1000 for pair in ((0, ms) for ms in range(1, 6)) for x in pair)
+    monkeypatch.setattr("utils.time.perf_counter", lambda: next(clock))
+
+    @timed("windowed", window=2)
+    def step():
+        pass
+
+    @timed("unused")
+    def never_called():
+        pass
+
+    for _ in range(5):
+        step()
+
+    assert timing_summary() == {"windowed": {"count": 2, "p50": 5.0, "p95": 5.0, "max": 5.0}}
@@ -2,9 +2,14 @@
 from .logging_config import setup_logging
 
 # Import existing utility functions
+import json
 import logging
 import functools
+import sys
 import time
+from collections import deque
+import tenacity
+from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException
@@ -22,28 +27,77 @@ def init_logger(name=__name__, level=logging.INFO, log_file: str = None):
         logger.addHandler(fh)
     return logger
 
-def retry(exceptions, tries=3, delay=2, backoff=2):
+def retry(exceptions, tries=3, delay=2, backoff=2, max_delay=10):
+    """Retry on `exceptions` up to `tries` calls, with jittered exponential waits
+    starting at `delay` and capped at `max_delay`; the last error is re-raised."""
     def decorator(func):
+        logger = logging.getLogger(func.__module__)
+        
+        def log_retry(state):
+            logger.warning(f"{state.outcome.exception()!r} – retrying in {state.next_action.sleep:.1f}s…")
+        
+        backoff_wait = tenacity.wait_exponential(multiplier=delay, exp_base=backoff, max=max_delay)
+        jitter = tenacity.wait_random(0, delay)
+        
+        return tenacity.retry(
+            retry=tenacity.retry_if_exception_type(exceptions),
+            stop=tenacity.stop_after_attempt(tries),
+            # Cap after jitter so no wait exceeds max_delay
+            wait=lambda state: min(max_delay, backoff_wait(state) + jitter(state)),
+            before_sleep=log_retry,
+            reraise=True,
+        )(func)
+    return decorator
+
+# dataclass(slots=True) needs Python 3.10+; older interpreters keep __dict__.
+# Use as @dataclass(**DATACLASS_SLOTS).
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Rolling window of durations (ms) per @timed label
+_TIMINGS = {}
+
+def timed(label, window=200):
+    """Log how long each call takes and keep the last `window` samples per label."""
+    def decorator(func):
+        samples = _TIMINGS.setdefault(label, deque(maxlen=window))
+        logger = logging.getLogger(func.__module__)
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            mtries, mdelay = tries, delay
-            while mtries > 1:
-                try:
-                    return func(*args, **kwargs)
-                except exceptions as e:
-                    logger = logging.getLogger(func.__module__)
-                    logger.warning(f"{e!r} – retrying in {mdelay}s…")
-                    time.sleep(mdelay)
-                    mtries -= 1
-                    mdelay *= backoff
-            return func(*args, **kwargs)
+            t0 = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = (time.perf_counter() - t0) * 1000
+                samples.append(elapsed)
+                logger.info("%s ms=%.1f", label, elapsed)
         return wrapper
     return decorator
 
+def timing_summary():
+    """count/p50/p95/max in ms for every @timed label with samples"""
+    summary = {}
+    for label, samples in _TIMINGS.items():
+        if not samples:
+            continue
+        ordered = sorted(samples)
+        n = len(ordered)
+        summary[label] = {
+            'count': n,
+            'p50': round(ordered[n // 2], 1),
+            'p95': round(ordered[min(n - 1, int(n * 0.95))], 1),
+            'max': round(ordered[-1], 1),
+        }
+    return summary
+
+def dump_timings(path):
+    """Write timing_summary() to a JSON file so waits can be tuned from real data"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(timing_summary(), f, indent=2)
+
 def wait_for_presence(driver, selector, timeout=15):
     try:
         return WebDriverWait(driver, timeout).until(
-            EC.presence_of_element_located(("css selector", selector))
+            EC.presence_of_element_located((By.CSS_SELECTOR, selector))
         )
     except TimeoutException:
         return None
@@ -52,7 +106,7 @@ def click_when_ready(driver, selector, timeout=15):
     """Wait for element to be clickable and click it"""
     try:
         el = WebDriverWait(driver, timeout).until(
-            EC.element_to_be_clickable(("css selector", selector))
+            EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
         )
         el.click()
         return True
@@ -63,7 +117,7 @@ def wait_for_clickable(driver, selector, timeout=15):
     """Wait for element to be clickable and visible"""
     try:
         return WebDriverWait(driver, timeout).until(
-            EC.element_to_be_clickable(("css selector", selector))
+            EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
         )
     except TimeoutException:
         return None
@@ -93,6 +147,7 @@ def safe_send_keys(driver, element, text, clear_first=True):
         return False
 
 __all__ = [
-    'setup_logging', 'init_logger', 'retry', 'wait_for_presence', 
+    'setup_logging', 'init_logger', 'retry', 'timed', 'timing_summary', 'dump_timings',
+    'wait_for_presence', 
     'click_when_ready', 'wait_for_clickable', 'safe_send_keys'
 ]
\ No newline at end of file
@@ -1,10 +1,30 @@
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 
+# Background listener that owns the real handlers; stopped (and flushed) at exit
+_listener = None
+
+def stop_logging():
+    """Flush queued records, stop the background log writer and close its handlers."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
 def setup_logging(level=logging.INFO, log_file=None):
-    """Setup logging configuration for the application."""
+    """Setup logging configuration for the application.
+    
+    Records are handed to a queue and written by a background QueueListener, so
+    logging calls never block on console or disk I/O.
+    """
+    global _listener
     
     # Create logs directory if it doesn't exist
     log_dir = Path("logs")
@@ -25,27 +45,39 @@ def setup_logging(level=logging.INFO, log_file=None):
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
     
-    # Clear existing handlers
+    # Stop the previous listener first so its queued records reach the old file, then clear
+    stop_logging()
     root_logger.handlers.clear()
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(level)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
     
     # File handler
     file_handler = logging.FileHandler(log_file_path, encoding='utf-8')
     file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
     
-    # Also log to the general log.txt for convenience
-    general_log_handler = logging.FileHandler("log.txt", encoding='utf-8')
-    general_log_handler.setLevel(level)
-    general_log_handler.setFormatter(formatter)
-    root_logger.addHandler(general_log_handler)
+    # log.txt (untracked) points at the latest run rather than receiving a second copy
+    # of every record; a leftover regular log.txt is left alone, as is any platform
+    # without symlinks
+    general_log = Path("log.txt")
+    try:
+        if general_log.is_symlink():
+            general_log.unlink()
+        if not general_log.exists():
+            general_log.symlink_to(log_file_path)
+    except OSError:
+        pass
+    
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    _listener.start()
     
     logging.info(f"Logging initialized. Log file: {log_file_path}")
     
-    return root_logger
\ No newline at end of file
+    return root_logger
+
+atexit.register(stop_logging)
\ No newline at end of file
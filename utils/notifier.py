@@ -1,9 +1,16 @@
+import io
 import requests, logging
 from config.settings import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Discord rejects messages over 2000 characters; leave headroom
+_MAX_MESSAGE_CHARS = 1900
+
 class DiscordNotifier:
+    # Shared across instances so every webhook call reuses the open HTTPS connection
+    _session = requests.Session()
+
     def __init__(self):
         settings = get_settings()
         self.webhook = settings.discord_webhook_url
@@ -13,7 +20,7 @@ class DiscordNotifier:
             logger.warning("No Discord webhook set")
         payload = {"content": message}
         try:
-            resp = requests.post(self.webhook, json=payload, timeout=10)
+            resp = self._session.post(self.webhook, json=payload, timeout=10)
             if resp.status_code == 204:
                 logger.info("🔔 Discord notification sent")
             else:
@@ -24,10 +31,18 @@ class DiscordNotifier:
     def notify_shifts(self, shifts):
         if not shifts:
             return
-        msg = "**🔎 Shifts Found:**\n" + "\n".join(
-            f"• [{s.job_id}] {s.title} @ {s.location} ({s.schedule})" for s in shifts
-        )
-        self.send(msg)
+        header = "**🔎 Shifts Found:**\n"
+        buf = io.StringIO()
+        buf.write(header)
+        for s in shifts:
+            line = f"• [{s.job_id}] {s.title} @ {s.location} ({s.schedule})\n"
+            # Start a new message rather than letting Discord reject an oversized one
+            if buf.tell() > len(header) and buf.tell() + len(line) > _MAX_MESSAGE_CHARS:
+                self.send(buf.getvalue().rstrip("\n"))
+                buf = io.StringIO()
+                buf.write(header)
+            buf.write(line)
+        self.send(buf.getvalue().rstrip("\n"))
 
     def notify_booking(self, shift):
         self.send(f"✅ **Booked**: [{shift.job_id}] {shift.title} @ {shift.location}")
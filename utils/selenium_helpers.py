@@ -1,6 +1,10 @@
+import json
+import random
 import time
 import logging
-from typing import List, Optional, Any
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import List, Optional, Any, Tuple
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
@@ -8,70 +12,391 @@ from selenium.common.exceptions import (
     TimeoutException, 
     NoSuchElementException, 
     ElementClickInterceptedException,
-    StaleElementReferenceException
+    StaleElementReferenceException,
+    WebDriverException
 )
 from seleniumbase import BaseCase
 
 logger = logging.getLogger(__name__)
 
+# Resolves as soon as the selector matches (checked on every DOM mutation),
+# or with false once the timeout elapses. One round trip instead of polling.
+_OBSERVER_WAIT_JS = """
+const selector = arguments[0], timeoutMs = arguments[1];
+const done = arguments[arguments.length - 1];
+if (document.querySelector(selector)) { done(true); return; }
+const obs = new MutationObserver(() => {
+    if (document.querySelector(selector)) {
+        obs.disconnect();
+        clearTimeout(timer);
+        done(true);
+    }
+});
+const timer = setTimeout(() => { obs.disconnect(); done(false); }, timeoutMs);
+obs.observe(document.documentElement, {childList: true, subtree: true, attributes: true});
+"""
+
+# Records the selector's current first match and match count, for
+# _OBSERVER_CHANGE_JS to compare against after an action.
+_SNAPSHOT_MATCHES_JS = """
+const l = document.querySelectorAll(arguments[0]);
+(window.__observerSnapshots = window.__observerSnapshots || {})[arguments[0]] = {first: l[0] || null, count: l.length};
+"""
+
+# Resolves once the selector's first match or match count differs from the
+# snapshot (a re-render, a filtered list, a newly inserted node), or with
+# false on timeout. A missing snapshot means the page was replaced.
+_OBSERVER_CHANGE_JS = """
+const selector = arguments[0], timeoutMs = arguments[1];
+const done = arguments[arguments.length - 1];
+const snap = (window.__observerSnapshots || {})[selector];
+const changed = () => {
+    if (!snap) return true;
+    const l = document.querySelectorAll(selector);
+    return l.length !== snap.count || (l[0] || null) !== snap.first;
+};
+const finish = (ok) => { delete (window.__observerSnapshots || {})[selector]; done(ok); };
+if (changed()) { finish(true); return; }
+const obs = new MutationObserver(() => {
+    if (changed()) {
+        obs.disconnect();
+        clearTimeout(timer);
+        finish(true);
+    }
+});
+const timer = setTimeout(() => { obs.disconnect(); finish(false); }, timeoutMs);
+obs.observe(document.documentElement, {childList: true, subtree: true});
+"""
+
+# [first match of the highest-priority selector, null] if any is present, else
+# [null, the selectors that parse]; unparseable ones (e.g. XPath) are skipped
+_FIRST_PRESENT_JS = """
+const valid = [];
+for (const s of arguments[0]) {
+    let e;
+    try { e = document.querySelector(s); } catch (err) { continue; }
+    if (e) return [e, null];
+    valid.push(s);
+}
+return [null, valid];
+"""
+
+# For each [by, selector] pair: is the first match present and rendered?
+_BATCH_VISIBLE_JS = """
+return arguments[0].map(([by, sel]) => {
+    let e = null;
+    try {
+        e = by === 'xpath'
+            ? document.evaluate(sel, document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null).singleNodeValue
+            : document.querySelector(sel);
+    } catch (err) {
+        return false;
+    }
+    return !!(e && e.offsetParent !== null);
+});
+"""
+
+# [selector, text] for the first selector whose element has text (or an input value), else null
+_FIRST_TEXT_JS = """
+for (const s of arguments[0]) {
+    let e = null;
+    try { e = document.querySelector(s); } catch (err) { continue; }
+    if (!e) continue;
+    // li/meter/progress expose a numeric .value; only form fields count here
+    const v = typeof e.value === 'string' ? e.value.trim() : '';
+    // textContent is a plain DOM read (no layout) and includes not-yet-shown rows
+    const t = (e.textContent || '').trim() || v;
+    if (t) return [s, t];
+}
+return null;
+"""
+
+# [selector, value] for the first non-null attribute value across the selectors, read the
+# way WebDriver's get_attribute does: primitive properties first, then the raw attribute
+_FIRST_ATTRIBUTE_JS = """
+const a = arguments[1];
+for (const s of arguments[0]) {
+    let e = null;
+    try { e = document.querySelector(s); } catch (err) { continue; }
+    if (!e) continue;
+    const p = e[a];
+    if (typeof p === 'boolean') { if (p) return [s, 'true']; continue; }
+    if (typeof p === 'string' || typeof p === 'number') return [s, String(p)];
+    const v = e.getAttribute(a);
+    if (v !== null) return [s, v];
+}
+return null;
+"""
+
+# Amazon-specific loading indicators
+_AMAZON_LOADING_SELECTORS = (
+    '.loading',
+    '.spinner',
+    '[data-testid="loading"]',
+    '.loading-spinner',
+    '[aria-label*="loading"]',
+    '[aria-label*="Loading"]',
+)
+
+# Amazon-specific content checks
+_AMAZON_CONTENT_SELECTORS = (
+    '[data-testid="job-card"]',
+    '.job-card',
+    '[data-test-component="StencilReactRow"]',
+)
+# Matched against div textContent (formerly div:contains(...))
+_AMAZON_CONTENT_TEXTS = ("Recommended jobs", "Total")
+
+# Each group as one selector list, so a single querySelectorAll covers it
+_AMAZON_LOADING_CSS = ", ".join(_AMAZON_LOADING_SELECTORS)
+_AMAZON_CONTENT_CSS = ", ".join(_AMAZON_CONTENT_SELECTORS)
+
+_ANY_VISIBLE_JS = "return Array.from(document.querySelectorAll(arguments[0])).some(e => e.offsetParent !== null);"
+# Function sources for _cdp_eval
+_ANY_PRESENT_FN = "s => document.querySelector(s) !== null"
+_ANY_CONTENT_FN = """(css, texts) => document.querySelector(css) !== null
+    || Array.from(document.querySelectorAll('div')).some(e => texts.some(t => e.textContent.includes(t)))"""
+
+_CONSENT_SELECTORS = (
+    "button[data-action-type='ACCEPT']",
+    "#sp-cc-accept",
+    ".consent-accept",
+    "[data-testid='consent-accept']",
+)
+# Button labels that accept a consent banner (matched lower-case)
+_CONSENT_BUTTON_TEXTS = ("accept", "allow", "continue")
+
+# Click the first visible consent control, by selector then by button text;
+# returns [label, element] so the caller can wait for it to go, or null
+_CONSENT_CLICK_JS = """
+const [selectors, texts] = arguments;
+const shown = e => e && e.offsetParent !== null;
+for (const s of selectors) {
+    const e = document.querySelector(s);
+    if (shown(e)) { e.click(); return [s, e]; }
+}
+for (const b of document.querySelectorAll('button, [role=button]')) {
+    const t = (b.textContent || '').trim().toLowerCase();
+    if (shown(b) && texts.some(k => t.includes(k))) { b.click(); return [t, b]; }
+}
+return null;
+"""
+
+# Click the first visible, enabled match across the selectors; returns the selector used
+_CLICK_FIRST_FN = """(selectors) => {
+    for (const s of selectors) {
+        let e = null;
+        try { e = document.querySelector(s); } catch (err) { continue; }
+        if (e && e.offsetParent !== null && !e.disabled) { e.click(); return s; }
+    }
+    return null;
+}"""
+
+# [visible, enabled] for an element handle, in place of is_displayed() + is_enabled()
+_CLICKABLE_STATE_JS = """
+const e = arguments[0];
+return [e.offsetParent !== null && e.getClientRects().length > 0, !e.disabled];
+"""
+
+# wait_for_element conditions
+_CONDITIONS = {
+    "presence": EC.presence_of_element_located,
+    "visible": EC.visibility_of_element_located,
+    "clickable": EC.element_to_be_clickable,
+}
+
+# (selectors, kind) -> the selector that last succeeded for that call, tried first next time.
+# Holds selector strings only, never elements, so nothing here can go stale.
+_HIT_CACHE_SIZE = 128
+_selector_hit_cache: "OrderedDict[Tuple[Tuple[str, ...], str], str]" = OrderedDict()
+
+def _hit_first(selectors: List[str], kind: str) -> List[str]:
+    """``selectors`` with the last winning selector for this call moved to the front."""
+    ordered = list(selectors)
+    hit = _selector_hit_cache.get((tuple(selectors), kind))
+    if hit in ordered:
+        ordered.remove(hit)
+        ordered.insert(0, hit)
+    return ordered
+
+def _record_hit(selectors: List[str], kind: str, hit: Optional[str]):
+    """Remember ``hit`` as the winner for this call, or forget the entry on a miss."""
+    key = (tuple(selectors), kind)
+    if hit is None:
+        _selector_hit_cache.pop(key, None)
+        return
+    _selector_hit_cache[key] = hit
+    _selector_hit_cache.move_to_end(key)
+    if len(_selector_hit_cache) > _HIT_CACHE_SIZE:
+        _selector_hit_cache.popitem(last=False)
+
+def _is_plain_css(selector: str) -> bool:
+    """False for SeleniumBase-only syntax (``:contains()``) and XPath."""
+    return ':contains(' not in selector and not selector.startswith(('/', '('))
+
+def _raw_driver(driver):
+    """The underlying WebDriver, whether given one directly or a SeleniumBase ``BaseCase``."""
+    return getattr(driver, 'driver', driver)
+
+def _cdp_eval(driver, fn: str, *args):
+    """Call the JS function source ``fn`` with JSON-serialisable ``args``.
+    
+    Goes over CDP ``Runtime.evaluate`` (the DevTools websocket) where the driver
+    supports it, skipping the WebDriver HTTP layer; otherwise ``execute_script``.
+    """
+    raw = _raw_driver(driver)
+    if hasattr(raw, 'execute_cdp_cmd'):
+        try:
+            result = raw.execute_cdp_cmd('Runtime.evaluate', {
+                'expression': f"({fn})(...{json.dumps(args)})",
+                'returnByValue': True,
+            })
+            if 'exceptionDetails' not in result:
+                return result['result'].get('value')
+        except WebDriverException:
+            pass
+    return raw.execute_script(f"return ({fn})(...arguments);", *args)
+
+def _wait_for(driver, timeout: float, poll_frequency: float = 0.5) -> WebDriverWait:
+    """A ``WebDriverWait`` on the raw driver; cheap enough to build per call."""
+    return WebDriverWait(_raw_driver(driver), timeout, poll_frequency=poll_frequency)
+
+@contextmanager
+def implicit_wait(driver, timeout: float):
+    """Let ``find_element`` wait up to ``timeout`` on the driver side, restoring the previous value on exit.
+    
+    The driver is shared with SeleniumBase, so the setting only lasts for the block.
+    Use ``implicit_wait(driver, 0)`` around a ``WebDriverWait`` so the two waits don't compound.
+    """
+    raw = _raw_driver(driver)
+    try:
+        previous = raw.timeouts.implicit_wait
+    except Exception:
+        previous = 0
+    raw.implicitly_wait(timeout)
+    try:
+        yield raw
+    finally:
+        raw.implicitly_wait(previous)
+
 def click_with_retry(
     driver: BaseCase, 
     selectors: List[str], 
     max_retries: int = 3, 
     backoff_factor: float = 1.5,
-    use_js_fallback: bool = True
+    use_js_fallback: bool = True,
+    max_backoff: float = 2.0
 ) -> bool:
-    """Click an element with multiple selector attempts and retry logic."""
+    """Click an element with multiple selector attempts and retry logic.
+    
+    Plain CSS selectors are tried together in one in-page find-and-click per
+    attempt; ``:contains()``/XPath selectors go through SeleniumBase afterwards.
+    """
+    
+    ordered = _hit_first(selectors, "click")
+    js_selectors = [s for s in ordered if _is_plain_css(s)] if use_js_fallback else []
+    other_selectors = [s for s in ordered if s not in js_selectors]
     
     for attempt in range(max_retries):
-        for selector in selectors:
+        if js_selectors:
+            try:
+                clicked = _cdp_eval(driver, _CLICK_FIRST_FN, js_selectors)
+                if clicked:
+                    logger.debug("Successfully clicked element with selector: %s", clicked)
+                    _record_hit(selectors, "click", clicked)
+                    return True
+            except Exception as e:
+                logger.debug("JS click attempt %s failed for %s: %s", attempt + 1, js_selectors, e)
+        
+        for selector in other_selectors:
+            element = None
             try:
                 # Try normal click first
                 element = driver.find_element(selector)
-                if element and element.is_displayed() and element.is_enabled():
+                visible, enabled = driver.execute_script(_CLICKABLE_STATE_JS, element)
+                if visible and enabled:
                     element.click()
-                    logger.debug(f"Successfully clicked element with selector: {selector}")
+                    logger.debug("Successfully clicked element with selector: %s", selector)
+                    _record_hit(selectors, "click", selector)
                     return True
                     
             except (ElementClickInterceptedException, StaleElementReferenceException) as e:
                 if use_js_fallback:
                     try:
-                        # Fallback to JavaScript click
+                        # Fallback to JavaScript click, on a fresh handle if the old one is gone
+                        if element is None or isinstance(e, StaleElementReferenceException):
+                            element = driver.find_element(selector)
                         driver.execute_script("arguments[0].click();", element)
-                        logger.debug(f"Successfully clicked element with JS fallback: {selector}")
+                        logger.debug("Successfully clicked element with JS fallback: %s", selector)
+                        _record_hit(selectors, "click", selector)
                         return True
                     except Exception as js_e:
-                        logger.debug(f"JS click also failed for {selector}: {js_e}")
+                        logger.debug("JS click also failed for %s: %s", selector, js_e)
                         
             except Exception as e:
-                logger.debug(f"Click attempt {attempt + 1} failed for {selector}: {e}")
+                logger.debug("Click attempt %s failed for %s: %s", attempt + 1, selector, e)
                 
-        # Wait before retry
+        # Wait before retry: capped, and jittered so concurrent callers don't retry in step
         if attempt < max_retries - 1:
-            time.sleep(backoff_factor ** attempt)
+            time.sleep(min(max_backoff, backoff_factor ** attempt) * (0.5 + random.random() * 0.5))
             
     logger.warning(f"Failed to click element after {max_retries} attempts with selectors: {selectors}")
+    _record_hit(selectors, "click", None)
     return False
 
+def wait_for_via_observer(driver, selector: str, timeout_ms: int = 5000) -> bool:
+    """Wait for a CSS selector to appear using an in-page MutationObserver.
+    
+    Returns as soon as the node is inserted instead of at the next Selenium
+    poll tick. ``selector`` must be plain CSS (no ``:contains()``).
+    """
+    try:
+        return bool(driver.execute_async_script(_OBSERVER_WAIT_JS, selector, timeout_ms))
+    except Exception as e:
+        logger.debug("Observer wait failed for %s: %s", selector, e)
+        return False
+
+def snapshot_for_observer(driver, selector: str) -> None:
+    """Record ``selector``'s current matches for a later ``wait_for_change_via_observer``.
+    
+    Call before the action whose effect is awaited.
+    """
+    try:
+        driver.execute_script(_SNAPSHOT_MATCHES_JS, selector)
+    except Exception as e:
+        logger.debug("Observer snapshot failed for %s: %s", selector, e)
+
+def wait_for_change_via_observer(driver, selector: str, timeout_ms: int = 5000) -> bool:
+    """Wait until ``selector``'s matches differ from the last snapshot.
+    
+    Unlike ``wait_for_via_observer`` this doesn't return early when stale
+    matches are already on the page: the first match has to be replaced or
+    the match count has to change.
+    """
+    try:
+        return bool(driver.execute_async_script(_OBSERVER_CHANGE_JS, selector, timeout_ms))
+    except Exception as e:
+        logger.debug("Observer change wait failed for %s: %s", selector, e)
+        return False
+
+def batch_visible(driver, locators) -> List[bool]:
+    """Check many (by, selector) locators for a visible match in one round trip.
+    
+    ``by`` is ``'css selector'`` or ``'xpath'``; works with a WebDriver or a
+    SeleniumBase ``BaseCase``. Selectors the browser can't parse count as False.
+    """
+    return driver.execute_script(_BATCH_VISIBLE_JS, [list(loc) for loc in locators])
+
 def safe_get_text(driver: BaseCase, selectors: List[str], default: str = "") -> str:
-    """Safely get text from an element using multiple selectors."""
+    """Safely get text from an element using multiple selectors (one round trip)."""
     
-    for selector in selectors:
-        try:
-            element = driver.find_element(selector)
-            if element:
-                text = element.text.strip()
-                if text:
-                    return text
-                # Try getting text from value attribute if text is empty
-                value = element.get_attribute('value')
-                if value:
-                    return value.strip()
-        except Exception as e:
-            logger.debug(f"Failed to get text with selector {selector}: {e}")
-            continue
-            
-    return default
+    try:
+        hit = driver.execute_script(_FIRST_TEXT_JS, _hit_first(selectors, "text"))
+    except Exception as e:
+        logger.debug("Failed to get text with selectors %s: %s", selectors, e)
+        return default
+    _record_hit(selectors, "text", hit[0] if hit else None)
+    return hit[1] if hit else default
 
 def wait_for_element(
     driver: BaseCase, 
@@ -79,72 +404,67 @@ def wait_for_element(
     timeout: int = 10,
     condition: str = "presence"
 ) -> Optional[Any]:
-    """Wait for an element to meet a specific condition."""
+    """Wait for an element to meet a specific condition.
     
-    wait = WebDriverWait(driver, timeout)
+    All selectors are waited on together, so the worst case is ``timeout``
+    rather than ``timeout`` per selector.
+    """
     
-    for selector in selectors:
+    cond_fn = _CONDITIONS.get(condition)
+    if cond_fn is None:
+        raise ValueError(f"Unknown condition: {condition}")
+    
+    if condition == "presence":
+        # Presence needs no client-side polling: the driver waits in find_element on
+        # one group of the selectors that parse, then the first present one in list
+        # order wins (a group match alone would be in document order)
+        raw = _raw_driver(driver)
         try:
-            if condition == "presence":
-                element = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, selector)))
-            elif condition == "visible":
-                element = wait.until(EC.visibility_of_element_located((By.CSS_SELECTOR, selector)))
-            elif condition == "clickable":
-                element = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, selector)))
-            else:
-                raise ValueError(f"Unknown condition: {condition}")
-                
-            return element
-            
-        except TimeoutException:
-            logger.debug(f"Timeout waiting for element with selector: {selector}")
-            continue
+            hit, valid = raw.execute_script(_FIRST_PRESENT_JS, selectors)
+            if hit is not None:
+                return hit
+            if not valid:
+                logger.debug("No valid CSS among selectors: %s", selectors)
+                return None
+            with implicit_wait(raw, timeout):
+                raw.find_element(By.CSS_SELECTOR, ", ".join(valid))
+            return raw.execute_script(_FIRST_PRESENT_JS, valid)[0]
+        except NoSuchElementException:
+            logger.debug("Timeout waiting for element with selectors: %s", selectors)
         except Exception as e:
-            logger.debug(f"Error waiting for element with selector {selector}: {e}")
-            continue
-            
+            logger.debug("Error waiting for element with selectors %s: %s", selectors, e)
+        return None
+    
+    # any_of returns the first selector, in list order, meeting the condition on each poll;
+    # implicit wait is off meanwhile so each poll's lookups return at once
+    try:
+        with implicit_wait(driver, 0):
+            return _wait_for(driver, timeout).until(
+                EC.any_of(*(cond_fn((By.CSS_SELECTOR, selector)) for selector in selectors)))
+    except TimeoutException:
+        logger.debug("Timeout waiting for element with selectors: %s", selectors)
+    except Exception as e:
+        logger.debug("Error waiting for element with selectors %s: %s", selectors, e)
+        
     return None
 
 def wait_for_page_load(driver, timeout: int = 15) -> bool:  # Restored from 5 to 15
     """Wait for page to load completely with Amazon-specific checks"""
     try:
-        # Wait for document ready state with restored timeout
-        driver.wait_for_ready_state_complete(timeout=10)  # Restored from 3 to 10
-        
-        # Amazon-specific loading indicators
-        amazon_loading_selectors = [
-            '.loading',
-            '.spinner', 
-            '[data-testid="loading"]',
-            '.loading-spinner',
-            '[aria-label*="loading"]',
-            '[aria-label*="Loading"]'
-        ]
-        
-        # Wait for any loading indicators to disappear with restored timeout
-        for selector in amazon_loading_selectors:
-            try:
-                if driver.is_element_present(selector):
-                    driver.wait_for_element_not_visible(selector, timeout=8)  # Restored from 2 to 8
-            except Exception:
-                continue  # Ignore if selector not found
+        # Wait for document ready state with restored timeout, unless it's already there
+        if driver.execute_script("return document.readyState") != "complete":
+            driver.wait_for_ready_state_complete(timeout=10)  # Restored from 3 to 10
         
-        # Amazon-specific content checks
-        amazon_content_selectors = [
-            '[data-testid="job-card"]',
-            '.job-card',
-            'div:contains("Recommended jobs")',
-            'div:contains("Total")',
-            '[data-test-component="StencilReactRow"]'
-        ]
+        # Wait (8s total, not per selector) until no loading indicator is visible
+        try:
+            _wait_for(driver, 8, poll_frequency=0.1).until_not(
+                lambda d: d.execute_script(_ANY_VISIBLE_JS, _AMAZON_LOADING_CSS))
+        except TimeoutException:
+            pass
         
         # Quick check for Amazon content to appear
-        for selector in amazon_content_selectors:
-            try:
-                if driver.is_element_present(selector):
-                    return True
-            except Exception:
-                continue
+        if _cdp_eval(driver, _ANY_CONTENT_FN, _AMAZON_CONTENT_CSS, _AMAZON_CONTENT_TEXTS):
+            return True
         
         logger.debug("Page loaded but no Amazon content detected")
         return True  # Don't fail if content not found
@@ -154,40 +474,36 @@ def wait_for_page_load(driver, timeout: int = 15) -> bool:  # Restored from 5 to
         return False  # Return False but don't raise exception
 
 def handle_consent_buttons(driver: BaseCase) -> bool:
-    """Handle common consent/cookie buttons."""
-    consent_selectors = [
-        "button[data-action-type='ACCEPT']",
-        "#sp-cc-accept",
-        "button:contains('Accept')",
-        "button:contains('Allow')",
-        "button:contains('Continue')",
-        ".consent-accept",
-        "[data-testid='consent-accept']"
-    ]
-    
-    for selector in consent_selectors:
-        try:
-            element = driver.find_element(selector)
-            if element and element.is_displayed():
-                element.click()
-                logger.info(f"Clicked consent button: {selector}")
-                time.sleep(1)  # Brief pause after consent
-                return True
-        except Exception:
-            continue
-            
-    return False
+    """Handle common consent/cookie buttons (found and clicked in one script call)."""
+    try:
+        clicked = driver.execute_script(
+            _CONSENT_CLICK_JS, list(_CONSENT_SELECTORS), list(_CONSENT_BUTTON_TEXTS))
+    except Exception as e:
+        logger.debug("Consent button check failed: %s", e)
+        return False
+    if not clicked:
+        return False
+    
+    label, element = clicked
+    logger.info(f"Clicked consent button: {label}")
+    # Continue once the banner has gone rather than after a fixed pause
+    try:
+        _wait_for(driver, 2, poll_frequency=0.1).until(
+            EC.invisibility_of_element(element))
+    except TimeoutException:
+        pass
+    return True
 
 def scroll_to_element(driver: BaseCase, selector: str) -> bool:
     """Scroll to an element to ensure it's visible."""
     try:
         element = driver.find_element(selector)
         if element:
-            driver.execute_script("arguments[0].scrollIntoView(true);", element)
-            time.sleep(0.5)  # Brief pause after scroll
+            # Instant scrolling completes before the script returns, so no pause is needed
+            driver.execute_script("arguments[0].scrollIntoView({block: 'start', behavior: 'instant'});", element)
             return True
     except Exception as e:
-        logger.debug(f"Failed to scroll to element {selector}: {e}")
+        logger.debug("Failed to scroll to element %s: %s", selector, e)
         
     return False
 
@@ -197,17 +513,13 @@ def get_element_attribute(
     attribute: str, 
     default: Any = None
 ) -> Any:
-    """Get an attribute value from an element using multiple selectors."""
+    """Get an attribute value from an element using multiple selectors (one round trip)."""
     
-    for selector in selectors:
-        try:
-            element = driver.find_element(selector)
-            if element:
-                value = element.get_attribute(attribute)
-                if value is not None:
-                    return value
-        except Exception as e:
-            logger.debug(f"Failed to get attribute {attribute} with selector {selector}: {e}")
-            continue
-            
-    return default
\ No newline at end of file
+    kind = f"attr:{attribute}"
+    try:
+        hit = driver.execute_script(_FIRST_ATTRIBUTE_JS, _hit_first(selectors, kind), attribute)
+    except Exception as e:
+        logger.debug("Failed to get attribute %s with selectors %s: %s", attribute, selectors, e)
+        return default
+    _record_hit(selectors, kind, hit[0] if hit else None)
+    return hit[1] if hit else default
\ No newline at end of file